@@ -0,0 +1,96 @@
+"""Per-keystroke cost of the fuzzy filter on a synthetic task list.
+
+Run with ``uv run python -m benchmarks.fuzzy_filter [TASKS] [REPEATS] [MAX_MS]``.
+Each repeat types a few queries one character at a time into a fresh
+``FuzzyMatcher``, deletes them again, and times every keystroke against a
+from-scratch rescan of all tasks. Each keystroke counts its best time over
+the repeats, and the run fails if the slowest exceeds MAX_MS, 16 by default:
+one frame at 60 Hz.
+"""
+
+import random
+import sys
+import time
+
+from lazytask.domain.fuzzy_match import FuzzyMatcher
+from lazytask.domain.task import Task
+
+QUERIES = ("report", "callmom", "Fix")
+
+WORDS = (
+    "call email fix review write report plan book buy clean update send meet "
+    "read draft sync check order pay renew mom dad team client budget invoice "
+    "slides garden car dentist taxes flight hotel backup server release notes "
+    "ticket bug design docs groceries laundry gym recipe birthday present"
+).split()
+
+
+def make_tasks(count: int) -> list[Task]:
+    rng = random.Random(0)
+    tasks = []
+    for index in range(count):
+        words = rng.choices(WORDS, k=rng.randint(2, 6))
+        if index % 4 == 0:
+            words[0] = words[0].capitalize()
+        tasks.append(Task(id=str(index), title=" ".join(words)))
+    return tasks
+
+
+def keystrokes(query: str) -> list[str]:
+    """The filter text after each key typing ``query`` and deleting it again."""
+    typed = [query[:length] for length in range(1, len(query) + 1)]
+    return typed + typed[-2::-1]
+
+
+def type_queries(tasks: list[Task]) -> list[tuple[str, float]]:
+    timings = []
+    for query in QUERIES:
+        matcher = FuzzyMatcher()
+        for text in keystrokes(query):
+            start = time.perf_counter()
+            matcher.rank(tasks, text)
+            timings.append((text, time.perf_counter() - start))
+    return timings
+
+
+def rescan(tasks: list[Task]) -> list[tuple[str, float]]:
+    timings = []
+    for query in QUERIES:
+        for text in keystrokes(query):
+            start = time.perf_counter()
+            FuzzyMatcher().rank(tasks, text)
+            timings.append((text, time.perf_counter() - start))
+    return timings
+
+
+def best_times(runs: list[list[tuple[str, float]]]) -> list[tuple[str, float]]:
+    """Each keystroke with its fastest time across ``runs``."""
+    return [
+        (timings[0][0], min(seconds for _, seconds in timings))
+        for timings in zip(*runs)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    max_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 16.0
+    tasks = make_tasks(count)
+
+    incremental = best_times([type_queries(tasks) for _ in range(repeats)])
+    baseline = best_times([rescan(tasks) for _ in range(repeats)])
+
+    print(f"tasks: {count}, best of {repeats}")
+    print(f"{'keystroke':<12} {'narrowed':>10} {'rescan':>10}")
+    for (text, seconds), (_, rescan_seconds) in zip(incremental, baseline):
+        print(f"{text:<12} {seconds * 1000:8.2f}ms {rescan_seconds * 1000:8.2f}ms")
+    slowest = max(seconds for _, seconds in incremental) * 1000
+    mean = sum(seconds for _, seconds in incremental) / len(incremental) * 1000
+    print(f"narrowed: mean {mean:.2f} ms, slowest {slowest:.2f} ms per keystroke")
+
+    if slowest > max_ms:
+        sys.exit(f"slowest keystroke took {slowest:.1f} ms, budget is {max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Per-row cost of rendering task rows.
+
+Run with ``uv run python -m benchmarks.row_render [ROWS] [REPEATS]``. "text"
+times ``render_task_row``, which builds a row's styled texts and is all a
+VirtualTaskList row needs; "compose" times ``TaskListItem.compose``, which adds
+the row's widgets on top.
+"""
+
+import datetime
+import sys
+import timeit
+
+from lazytask.domain.task import Task
+from lazytask.presentation.app import TaskListItem
+from lazytask.presentation.task_row import render_task_row
+
+
+def make_tasks(count: int) -> list[Task]:
+    today = datetime.date.today()
+    return [
+        Task(
+            id=str(index),
+            title=f"Task {index}",
+            due_date=today + datetime.timedelta(days=index % 14 - 7),
+            tags=["work", "home"][: index % 3],
+            priority=index % 4 or None,
+            is_flagged=index % 5 == 0,
+            recurring="weekly" if index % 7 == 0 else None,
+        )
+        for index in range(count)
+    ]
+
+
+def render_rows(tasks: list[Task]) -> None:
+    for task in tasks:
+        render_task_row(task)
+
+
+def compose_rows(items: list[TaskListItem]) -> None:
+    for item in items:
+        list(item.compose())
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    tasks = make_tasks(rows)
+    items = [TaskListItem(task) for task in tasks]
+
+    text_seconds = min(
+        timeit.repeat(lambda: render_rows(tasks), number=1, repeat=repeats)
+    )
+    compose_seconds = min(
+        timeit.repeat(lambda: compose_rows(items), number=1, repeat=repeats)
+    )
+
+    print(f"rows: {rows}, best of {repeats}")
+    print(f"text:    {text_seconds / rows * 1e6:8.2f} us/row")
+    print(f"compose: {compose_seconds / rows * 1e6:8.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Wall-clock startup of the scripting CLI, ``python main.py ls``.
+
+Run with ``uv run python -m benchmarks.startup_cli [REPEATS] [MAX_MS]``. Each
+repeat runs ``main.py ls`` in a fresh interpreter against the mock backend and
+times it end to end, next to an interpreter that only imports asyncio, which
+every subcommand needs. It then runs ``ls`` once more under
+``python -X importtime`` to list what it imported. The run fails if a module the default configuration
+doesn't need (the TUI, other backends, the cache, the editor) shows up, or if
+the best time exceeds MAX_MS (default 100).
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+COMMAND = [str(MAIN), "ls"]
+
+# Imported by DependencyContainer only for the configuration that needs them.
+DEFERRED_MODULES = (
+    "textual",
+    "rich",
+    "lazytask.presentation",
+    "lazytask.infrastructure.caching_task_manager",
+    "lazytask.infrastructure.neovim_editor",
+    "lazytask.infrastructure.reminders_cli_task_manager",
+    "lazytask.infrastructure.sqlite_task_manager",
+)
+
+IMPORT_LINE = re.compile(r"import time:\s+\d+ \|\s+\d+ \|\s*(\S+)")
+
+
+def environment() -> dict[str, str]:
+    env = dict(os.environ)
+    env["LAZYTASK_TASK_MANAGER"] = "mock"
+    env.pop("LAZYTASK_CACHE_TTL", None)
+    return env
+
+
+def run_once(args: list[str]) -> float:
+    """Seconds taken by one run of the interpreter with ``args``."""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args],
+        stdout=subprocess.DEVNULL,
+        check=True,
+        env=environment(),
+    )
+    return time.perf_counter() - start
+
+
+def imported_modules() -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *COMMAND],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+        env=environment(),
+    )
+    return {
+        match.group(1)
+        for match in map(IMPORT_LINE.match, result.stderr.splitlines())
+        if match
+    }
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    max_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+    best = min(run_once(COMMAND) for _ in range(repeats)) * 1000
+    floor = min(run_once(["-c", "import asyncio"]) for _ in range(repeats)) * 1000
+    print(f"main.py ls, best of {repeats}:     {best:8.1f} ms")
+    print(f"import asyncio, best of {repeats}: {floor:8.1f} ms")
+
+    modules = imported_modules()
+    eager = [
+        name
+        for name in DEFERRED_MODULES
+        if any(module == name or module.startswith(name + ".") for module in modules)
+    ]
+    if eager:
+        sys.exit(f"imported by 'ls' but should be deferred: {', '.join(eager)}")
+    if best > max_ms:
+        sys.exit(f"'ls' took {best:.1f} ms, budget is {max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Import cost of the TUI entry point, measured with ``python -X importtime``.
+
+Run with ``uv run python -m benchmarks.startup_import [REPEATS] [MAX_MS]``. Each
+repeat imports ``lazytask.presentation.app`` in a fresh interpreter and reads
+the cumulative import time Python reports for it. The run fails if a module
+that should only load on demand (modal screens and their dependencies) shows
+up, or if the best time exceeds MAX_MS when given.
+"""
+
+import re
+import subprocess
+import sys
+
+MODULE = "lazytask.presentation.app"
+
+# Loaded by the screens LazyTaskApp opens on demand, not at startup.
+DEFERRED_MODULES = (
+    "pendulum",
+    "textual_datepicker",
+    "lazytask.presentation.date_picker_screen",
+    "lazytask.presentation.edit_screen",
+    "lazytask.presentation.help_screen",
+    "lazytask.presentation.select_list_screen",
+    "lazytask.presentation.sort_options_screen",
+    "lazytask.presentation.text_input_modal",
+)
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def measure() -> tuple[int, dict[str, int]]:
+    """The cumulative import time of MODULE in microseconds, and of every
+    top-level package it pulled in."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    packages: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        cumulative, name = int(match.group(2)), match.group(4)
+        if name == MODULE:
+            total = cumulative
+        packages[name] = max(packages.get(name, 0), cumulative)
+    return total, packages
+
+
+def main() -> None:
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    max_ms = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    runs = [measure() for _ in range(repeats)]
+    best, packages = min(runs, key=lambda run: run[0])
+
+    print(f"import {MODULE}, best of {repeats}: {best / 1000:8.1f} ms")
+    heaviest = sorted(
+        (name for name in packages if "." not in name),
+        key=packages.__getitem__,
+        reverse=True,
+    )[:5]
+    for name in heaviest:
+        print(f"  {name:<20} {packages[name] / 1000:8.1f} ms")
+
+    eager = [name for name in DEFERRED_MODULES if name in packages]
+    if eager:
+        sys.exit(f"imported at startup but should be deferred: {', '.join(eager)}")
+    if max_ms is not None and best / 1000 > max_ms:
+        sys.exit(f"startup import took {best / 1000:.1f} ms, budget is {max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Memory held per task once a synthetic task set is loaded.
+
+Run with ``uv run python -m benchmarks.task_memory [TASKS] [MAX_BYTES]``. The
+tasks are decoded from JSON, as the mock and SQLite backends load them, so
+every list name and tag starts out as its own string. "slotted" builds the
+current ``Task``; "dict" builds the previous layout, a plain dataclass with a
+``__dict__`` and a list of tags per task. "dict, saved" is that layout after
+the mock backend's old save read ``task.__dict__``, which makes Python build a
+real dict for every instance. The run fails if a slotted task takes more than
+MAX_BYTES when given.
+"""
+
+import dataclasses
+import datetime
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from lazytask.domain.task import Task
+
+LISTS = ("develop", "work", "home", "errands", "someday")
+TAGS = ("work", "home", "urgent", "waiting", "phone", "errand", "read")
+
+
+@dataclasses.dataclass(eq=False)
+class DictTask:
+    id: str
+    title: str
+    completed: bool = False
+    due_date: Optional[datetime.date] = None
+    creation_date: Optional[datetime.datetime] = None
+    list_name: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = dataclasses.field(default_factory=list)
+    priority: Optional[int] = None
+    is_flagged: bool = False
+    recurring: Optional[str] = None
+
+
+def make_payload(count: int) -> str:
+    rng = random.Random(0)
+    records = []
+    for index in range(count):
+        records.append(
+            {
+                "id": f"{index:08x}-0000-4000-8000-000000000000",
+                "title": f"Task {index}",
+                "completed": index % 3 == 0,
+                "list_name": LISTS[index % len(LISTS)],
+                "tags": rng.sample(TAGS, k=rng.choice((0, 0, 1, 2))),
+                "priority": index % 4 or None,
+                "is_flagged": index % 5 == 0,
+            }
+        )
+    return json.dumps(records)
+
+
+def build(payload: str, factory: Callable[..., Any]) -> float:
+    """Seconds to build the tasks in ``payload`` with ``factory``."""
+    records: List[Dict[str, Any]] = json.loads(payload)
+    start = time.perf_counter()
+    for record in records:
+        factory(**record)
+    return time.perf_counter() - start
+
+
+def load(payload: str, factory: Callable[..., Any], saved: bool = False) -> int:
+    """Bytes held by the tasks in ``payload`` built with ``factory``."""
+    tracemalloc.start()
+    records: List[Dict[str, Any]] = json.loads(payload)
+    tasks = [factory(**record) for record in records]
+    if saved:
+        for task in tasks:
+            vars(task)
+    # Drop the decoded records so only what the tasks keep alive is counted.
+    del records
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tasks
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    max_bytes = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    payload = make_payload(count)
+
+    print(f"tasks: {count}")
+    print(f"{'layout':<12} {'total':>10} {'per task':>10} {'build':>10}")
+    per_task = {}
+    for name, factory, saved in (
+        ("dict", DictTask, False),
+        ("dict, saved", DictTask, True),
+        ("slotted", Task, False),
+    ):
+        size = load(payload, factory, saved)
+        seconds = build(payload, factory)
+        per_task[name] = size / count
+        print(
+            f"{name:<12} {size / 2**20:8.1f}MB {size / count:9.0f}B "
+            f"{seconds * 1000:8.1f}ms"
+        )
+    for name in ("dict", "dict, saved"):
+        smaller = 1 - per_task["slotted"] / per_task[name]
+        print(f"slotted tasks are {smaller:.0%} smaller than {name}")
+
+    slotted = per_task["slotted"]
+    if max_bytes is not None and slotted > max_bytes:
+        sys.exit(f"a task takes {slotted:.0f} bytes, budget is {max_bytes:.0f}")
+
+
+if __name__ == "__main__":
+    main()
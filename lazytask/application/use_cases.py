@@ -1,6 +1,7 @@
+import datetime
 import logging
 from typing import List, Optional, Dict, Any
-from lazytask.domain.task_manager import TaskManager
+from lazytask.domain.task_manager import BatchResult, TaskManager
 from lazytask.domain.task import Task
 
 
@@ -13,6 +14,17 @@ class AddTask:
         return await self.task_manager.add_task(title, list_name, **kwargs)
 
 
+class AddTasks:
+    def __init__(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+
+    async def execute(
+        self, new_tasks: List[Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        logging.debug(f"Adding {len(new_tasks)} tasks to {list_name}")
+        return await self.task_manager.add_tasks(new_tasks, list_name)
+
+
 class GetTasks:
     def __init__(self, task_manager: TaskManager):
         self.task_manager = task_manager
@@ -23,6 +35,45 @@ class GetTasks:
         return await self.task_manager.get_tasks(list_name, include_completed)
 
 
+class GetTask:
+    def __init__(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+
+    async def execute(self, task_id: str, list_name: str = "develop") -> Optional[Task]:
+        return await self.task_manager.get_task(task_id, list_name)
+
+
+class FilterTasks:
+    def __init__(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+
+    async def execute(
+        self,
+        list_name: str = "develop",
+        include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
+    ) -> List[Task]:
+        return await self.task_manager.filter_tasks(
+            list_name, include_completed=include_completed, due_by=due_by
+        )
+
+
+class GetTasksForLists:
+    def __init__(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+
+    @property
+    def supports_bulk_fetch(self) -> bool:
+        return self.task_manager.supports_bulk_fetch
+
+    async def execute(
+        self, list_names: List[str], include_completed: bool = False
+    ) -> Dict[str, List[Task]]:
+        return await self.task_manager.get_tasks_for_lists(
+            list_names, include_completed
+        )
+
+
 class CompleteTask:
     def __init__(self, task_manager: TaskManager):
         self.task_manager = task_manager
@@ -31,6 +82,16 @@ class CompleteTask:
         return await self.task_manager.complete_task(task_id, list_name)
 
 
+class CompleteTasks:
+    def __init__(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+
+    async def execute(
+        self, task_ids: List[str], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return await self.task_manager.complete_tasks(task_ids, list_name)
+
+
 class UpdateTask:
     def __init__(self, task_manager: TaskManager):
         self.task_manager = task_manager
@@ -41,6 +102,16 @@ class UpdateTask:
         return await self.task_manager.edit_task_full(task_id, updates, list_name)
 
 
+class UpdateTasks:
+    def __init__(self, task_manager: TaskManager):
+        self.task_manager = task_manager
+
+    async def execute(
+        self, updates: Dict[str, Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return await self.task_manager.edit_tasks(updates, list_name)
+
+
 class GetLists:
     def __init__(self, task_manager: TaskManager):
         self.task_manager = task_manager
@@ -0,0 +1,199 @@
+"""Scriptable subcommands: ``lazytask add``, ``ls``, ``done`` and ``export``.
+
+These go straight through the application use cases and must not import
+textual, rich or anything under ``lazytask.presentation``, so they start fast
+enough to run in shell loops.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import sys
+from typing import Sequence
+
+from lazytask.application.use_cases import (
+    AddTask,
+    CompleteTasks,
+    FilterTasks,
+    GetLists,
+    GetTask,
+    GetTasks,
+)
+from lazytask.container import container
+from lazytask.domain.task import Task, task_to_dict
+
+
+class CommandError(Exception):
+    """A user-facing failure; reported on stderr with exit status 1."""
+
+
+def parse_due_date(value: str) -> datetime.date:
+    today = datetime.date.today()
+    if value == "today":
+        return today
+    if value == "tomorrow":
+        return today + datetime.timedelta(days=1)
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected YYYY-MM-DD, 'today' or 'tomorrow', got '{value}'"
+        ) from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lazytask", description="Manage tasks without starting the TUI."
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    add = subcommands.add_parser("add", help="Add a task and print its ID.")
+    add.add_argument("title", nargs="+", help="Task title.")
+    add.add_argument("--list", help="List to add to (default: first list).")
+    add.add_argument(
+        "--due", type=parse_due_date, help="Due date: YYYY-MM-DD, today or tomorrow."
+    )
+    add.add_argument("--description", help="Task notes.")
+    add.add_argument("--json", action="store_true", help="Print the task as JSON.")
+
+    ls = subcommands.add_parser("ls", help="List tasks, sorted by due date.")
+    ls.add_argument("--list", help="Only this list (default: every list).")
+    ls.add_argument("--overdue", action="store_true", help="Only tasks due by today.")
+    ls.add_argument("--completed", action="store_true", help="Include completed.")
+    ls.add_argument("--json", action="store_true", help="Print a JSON array.")
+
+    done = subcommands.add_parser("done", help="Complete tasks by ID.")
+    done.add_argument("task_ids", nargs="+", metavar="id")
+    done.add_argument("--list", help="List the tasks are on (default: search all).")
+
+    export = subcommands.add_parser(
+        "export", help="Print every task, completed ones included, as JSON by list."
+    )
+    export.add_argument("--list", help="Only this list (default: every list).")
+    return parser
+
+
+async def configured_lists() -> list[str]:
+    """The lists from LAZYTASK_LISTS, or every backend list when it is unset."""
+    lists_str = os.environ.get("LAZYTASK_LISTS", "")
+    lists = [name.strip() for name in lists_str.split(",") if name.strip()]
+    return lists or await container.get(GetLists).execute()
+
+
+async def target_lists(list_name: str | None) -> list[str]:
+    return [list_name.strip()] if list_name else await configured_lists()
+
+
+def format_task(task: Task) -> str:
+    status = "[x]" if task.completed else "[ ]"
+    due = task.due_date.isoformat() if task.due_date else "-"
+    return f"{task.id}\t{status}\t{due}\t{task.list_name or '-'}\t{task.title}"
+
+
+async def add(args: argparse.Namespace) -> None:
+    lists = await target_lists(args.list)
+    if not lists:
+        raise CommandError("No lists configured; set LAZYTASK_LISTS or pass --list.")
+    list_name = lists[0]
+    options = {}
+    if args.due:
+        options["due_date"] = args.due
+    if args.description:
+        options["description"] = args.description
+    task = await container.get(AddTask).execute(
+        " ".join(args.title), list_name, **options
+    )
+    print(json.dumps(task_to_dict(task)) if args.json else task.id)
+
+
+async def ls(args: argparse.Namespace) -> None:
+    get_tasks = container.get(GetTasks)
+    filter_tasks = container.get(FilterTasks)
+    today = datetime.date.today()
+    tasks: list[Task] = []
+    for list_name in await target_lists(args.list):
+        if args.overdue:
+            # Backends with a due date index answer this without a full scan.
+            tasks.extend(
+                await filter_tasks.execute(list_name, args.completed, due_by=today)
+            )
+        else:
+            tasks.extend(await get_tasks.execute(list_name, args.completed))
+    tasks.sort(key=lambda task: task.due_date or datetime.date.max)
+    if args.json:
+        print(json.dumps([task_to_dict(task) for task in tasks]))
+        return
+    for task in tasks:
+        print(format_task(task))
+
+
+async def done(args: argparse.Namespace) -> None:
+    get_task = container.get(GetTask)
+    lists = await target_lists(args.list)
+    ids_by_list: dict[str, list[str]] = {}
+    failures = []
+    for task_id in args.task_ids:
+        for list_name in lists:
+            if await get_task.execute(task_id, list_name) is not None:
+                ids_by_list.setdefault(list_name, []).append(task_id)
+                break
+        else:
+            failures.append(f"{task_id}: no such task")
+
+    complete_tasks = container.get(CompleteTasks)
+    for list_name, task_ids in ids_by_list.items():
+        results = await complete_tasks.execute(task_ids, list_name)
+        failures.extend(
+            f"{task_id}: {result.error}"
+            for task_id, result in zip(task_ids, results)
+            if not result.ok
+        )
+    if failures:
+        raise CommandError("could not complete " + "; ".join(failures))
+
+
+async def export(args: argparse.Namespace) -> None:
+    get_tasks = container.get(GetTasks)
+    exported = {
+        list_name: [
+            task_to_dict(task) for task in await get_tasks.execute(list_name, True)
+        ]
+        for list_name in await target_lists(args.list)
+    }
+    print(json.dumps(exported, indent=2))
+
+
+HANDLERS = {"add": add, "ls": ls, "done": done, "export": export}
+
+
+async def run(args: argparse.Namespace) -> None:
+    try:
+        await HANDLERS[args.command](args)
+    finally:
+        # Helper processes belong to this event loop, so stop them before it
+        # closes.
+        if container.built:
+            await container.task_manager.close()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        try:
+            asyncio.run(run(args))
+        finally:
+            # Building the container just to flush would only fail again.
+            if container.built:
+                container.task_manager.flush()
+    except Exception as error:
+        # Backend and configuration errors end up here too; report them like
+        # our own errors instead of with a traceback.
+        print(f"lazytask: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
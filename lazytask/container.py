@@ -1,13 +1,17 @@
 import os
 
-from lazytask.infrastructure.mock_task_manager import MockTaskManager
-from lazytask.infrastructure.neovim_editor import NeovimDescriptionEditor
 from lazytask.application.ports.editor import DescriptionEditor
 from lazytask.application.use_cases import (
     AddTask,
+    AddTasks,
     GetTasks,
+    GetTask,
+    GetTasksForLists,
+    FilterTasks,
     CompleteTask,
+    CompleteTasks,
     UpdateTask,
+    UpdateTasks,
     GetLists,
     MoveTask,
 )
@@ -18,21 +22,66 @@ class DependencyContainer:
     def __init__(self):
         backend_name = os.getenv("LAZYTASK_TASK_MANAGER", "mock").strip().lower()
         self.task_manager = self._create_task_manager(backend_name)
-        self.description_editor: DescriptionEditor = NeovimDescriptionEditor()
+        cache_ttl = self._cache_ttl()
+        if cache_ttl is not None:
+            from lazytask.infrastructure.caching_task_manager import (
+                CachingTaskManager,
+            )
+
+            self.task_manager = CachingTaskManager(self.task_manager, cache_ttl)
+        self._description_editor: DescriptionEditor | None = None
         self._update_use_cases()
 
+    @staticmethod
+    def _env_flag(name: str) -> bool:
+        return os.getenv(name, "").strip().lower() in {"1", "true", "yes"}
+
+    @staticmethod
+    def _cache_ttl() -> float | None:
+        cache_ttl = os.getenv("LAZYTASK_CACHE_TTL", "").strip()
+        if not cache_ttl:
+            return None
+        try:
+            return float(cache_ttl)
+        except ValueError:
+            raise ValueError(
+                f"Invalid LAZYTASK_CACHE_TTL value '{cache_ttl}'. "
+                "Expected a number of seconds, e.g. '30' or '2.5'."
+            ) from None
+
     def _create_task_manager(self, backend_name: str) -> TaskManager:
+        # Backends and their dependencies are imported only when chosen, so a
+        # scripted ``lazytask ls`` doesn't pay for the ones it doesn't use.
         if backend_name in {"", "mock"}:
-            return MockTaskManager()
+            from lazytask.infrastructure.mock_task_manager import MockTaskManager
+
+            return MockTaskManager(
+                use_journal=self._env_flag("LAZYTASK_MOCK_JOURNAL"),
+                write_behind=self._env_flag("LAZYTASK_MOCK_WRITE_BEHIND"),
+            )
         if backend_name in {"reminders", "reminders_cli", "reminders-cli"}:
             from lazytask.infrastructure.reminders_cli_task_manager import (
+                REMINDERS_CLI_PATH,
                 RemindersCliTaskManager,
             )
+            from lazytask.infrastructure.reminders_cli_worker import (
+                RemindersCliWorker,
+            )
 
+            if self._env_flag("LAZYTASK_REMINDERS_WORKER"):
+                return RemindersCliTaskManager(
+                    worker=RemindersCliWorker([REMINDERS_CLI_PATH, "worker"])
+                )
             return RemindersCliTaskManager()
+        if backend_name in {"sqlite", "sqlite3"}:
+            from lazytask.infrastructure.sqlite_task_manager import SqliteTaskManager
+
+            return SqliteTaskManager(
+                os.getenv("LAZYTASK_SQLITE_PATH", "lazytask.db").strip()
+            )
         raise ValueError(
             f"Unknown LAZYTASK_TASK_MANAGER value '{backend_name}'. "
-            "Valid options are 'mock' or 'reminders-cli'."
+            "Valid options are 'mock', 'reminders-cli' or 'sqlite'."
         )
 
     def set_task_manager(self, task_manager):
@@ -40,8 +89,17 @@ class DependencyContainer:
         self._update_use_cases()
         return self
 
+    @property
+    def description_editor(self) -> DescriptionEditor:
+        # Only the TUI edits descriptions, so the editor is created on first use.
+        if self._description_editor is None:
+            from lazytask.infrastructure.neovim_editor import NeovimDescriptionEditor
+
+            self._description_editor = NeovimDescriptionEditor()
+        return self._description_editor
+
     def set_description_editor(self, description_editor: DescriptionEditor):
-        self.description_editor = description_editor
+        self._description_editor = description_editor
         return self
 
     def get_description_editor(self) -> DescriptionEditor:
@@ -49,21 +107,39 @@ class DependencyContainer:
 
     def _update_use_cases(self):
         self.add_task = AddTask(self.task_manager)
+        self.add_tasks = AddTasks(self.task_manager)
         self.get_tasks = GetTasks(self.task_manager)
+        self.get_task = GetTask(self.task_manager)
+        self.get_tasks_for_lists = GetTasksForLists(self.task_manager)
+        self.filter_tasks = FilterTasks(self.task_manager)
         self.complete_task = CompleteTask(self.task_manager)
+        self.complete_tasks = CompleteTasks(self.task_manager)
         self.update_task = UpdateTask(self.task_manager)
+        self.update_tasks = UpdateTasks(self.task_manager)
         self.get_lists = GetLists(self.task_manager)
         self.move_task = MoveTask(self.task_manager)
 
     def get(self, use_case):
         if use_case == AddTask:
             return self.add_task
+        if use_case == AddTasks:
+            return self.add_tasks
         if use_case == GetTasks:
             return self.get_tasks
+        if use_case == GetTask:
+            return self.get_task
+        if use_case == GetTasksForLists:
+            return self.get_tasks_for_lists
+        if use_case == FilterTasks:
+            return self.filter_tasks
         if use_case == CompleteTask:
             return self.complete_task
+        if use_case == CompleteTasks:
+            return self.complete_tasks
         if use_case == UpdateTask:
             return self.update_task
+        if use_case == UpdateTasks:
+            return self.update_tasks
         if use_case == GetLists:
             return self.get_lists
         if use_case == MoveTask:
@@ -72,4 +148,29 @@ class DependencyContainer:
             return self.description_editor
 
 
-container = DependencyContainer()
+class LazyDependencyContainer:
+    """Stands in for the DependencyContainer until it is first used.
+
+    Building the container reads the environment and opens the task backend
+    (loading ``mock_tasks.json`` for the mock one), so importing modules that
+    reference ``container`` stays cheap.
+    """
+
+    def __init__(self):
+        self._container: DependencyContainer | None = None
+
+    @property
+    def built(self) -> bool:
+        """Whether the real container has been created yet."""
+        return self._container is not None
+
+    def _resolve(self) -> DependencyContainer:
+        if self._container is None:
+            self._container = DependencyContainer()
+        return self._container
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+
+container = LazyDependencyContainer()
@@ -0,0 +1,269 @@
+import functools
+import heapq
+import itertools
+import operator
+import re
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from lazytask.domain.task import Task
+
+# Scoring is modelled on fzf's: every matched character scores, skipped
+# characters cost, and runs and word starts earn bonuses. So that a keystroke
+# can score thousands of titles, a title is scored from what string searches in
+# C can tell about it:
+#
+# - If the query appears in the title as one run, each character after the
+#   first earns BONUS_CONSECUTIVE. If the run starts a word, every character
+#   earns BONUS_BOUNDARY instead, the first one twice.
+# - Otherwise the leftmost match is scored. The characters it skips cost one
+#   gap, and its first character earns BONUS_BOUNDARY twice if it starts a word.
+# - Each uppercase query character earns BONUS_SAME_CASE when the query appears
+#   in the title with the same case.
+#
+# Words start at the beginning of a title and after spaces and ASCII
+# punctuation.
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_BOUNDARY = SCORE_MATCH // 2
+BONUS_CONSECUTIVE = -(SCORE_GAP_START + SCORE_GAP_EXTENSION)
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+BONUS_SAME_CASE = 1
+
+# Turns ASCII characters other than letters and digits into spaces, leaving
+# NUL alone to separate titles.
+_SPACES = str.maketrans(
+    {chr(code): " " for code in range(1, 128) if not chr(code).isalnum()}
+)
+# How many of the best matches ``FuzzyMatcher.rank`` returns. Nobody reads
+# further down a filtered list, and ranking fewer keeps a keystroke within a
+# frame on long lists.
+MATCH_LIMIT = 500
+# How many titles are searched between checks whether to stop ranking.
+_CHUNK = 4096
+# Sort keys put the score above the title length.
+_LENGTH_SPAN = 1 << 32
+
+
+def _fold(text: str) -> str:
+    """``text`` lowercased with ASCII punctuation as spaces, behind a space."""
+    return " " + text.lower().translate(_SPACES)
+
+
+@functools.lru_cache(maxsize=64)
+def _subsequence_pattern(needle: str) -> re.Pattern[str]:
+    """A regex finding the first, leftmost occurrence of the needle characters
+    in order. Negated classes instead of ``.*?`` keep it free of backtracking."""
+    parts = [re.escape(needle[0])]
+    for char in needle[1:]:
+        escaped = re.escape(char)
+        parts.append(f"[^{escaped}]*{escaped}")
+    return re.compile("".join(parts), re.DOTALL)
+
+
+class RankingCancelled(Exception):
+    """Raised by ``FuzzyMatcher.rank`` when asked to stop."""
+
+
+class _Narrowing(NamedTuple):
+    query: str
+    # Indexes into the source of the tasks that may match, in source order.
+    candidates: Sequence[int]
+    # Indexes of the best matches, best first.
+    ranked: List[int]
+
+
+class FuzzyMatcher:
+    """Ranks tasks by how well their titles fuzzy-match a query.
+
+    A title matches when the query characters appear in it in order, ignoring
+    case; any punctuation or space in the query matches any punctuation or
+    space in the title. Titles are folded that way once per task sequence.
+    Only the best ``limit`` matches are returned.
+
+    Results are kept for each prefix of the query being typed: an extended
+    query only searches the titles the longest earlier prefix may match, since
+    a title that doesn't match a query can't match a longer one, and deleting
+    characters returns an earlier ranking unchanged. Call ``reset`` when
+    titles may have changed in place.
+
+    Ranking a long list takes a while, so ``rank`` takes a ``cancelled``
+    callback and checks it between chunks of titles; the matcher stays usable
+    after a cancelled ranking.
+    """
+
+    def __init__(self, limit: int = MATCH_LIMIT) -> None:
+        self._limit = limit
+        self._source: List[Task] = []
+        # Titles as ``_fold`` returns them, in source order.
+        self._folded: List[str] = []
+        # Original titles, only needed for queries with uppercase letters.
+        self._titles: List[str] = []
+        # Results for successively longer queries, each a prefix of the next.
+        self._narrowed: List[_Narrowing] = []
+
+    def reset(self) -> None:
+        self._source = []
+        self._folded = []
+        self._titles = []
+        self._narrowed = []
+
+    def rank(
+        self,
+        tasks: Sequence[Task],
+        query: str,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[Task]:
+        """The best matches for ``query`` among ``tasks``, best first.
+
+        Equal scores go to the shorter title, then keep their order in ``tasks``.
+        Raises ``RankingCancelled`` once ``cancelled`` returns true.
+        """
+        if not query:
+            return list(tasks)
+        # Comparing task lists is cheap when they hold the same objects.
+        if list(tasks) != self._source:
+            self._prepare(tasks)
+
+        while self._narrowed and not query.startswith(self._narrowed[-1].query):
+            self._narrowed.pop()
+        if self._narrowed and self._narrowed[-1].query == query:
+            ranked = self._narrowed[-1].ranked
+        else:
+            ranked = self._narrow(query, cancelled)
+        return list(map(self._source.__getitem__, ranked))
+
+    def _prepare(self, tasks: Sequence[Task]) -> None:
+        self.reset()
+        self._source = list(tasks)
+        # One call over all titles is far cheaper than one per title.
+        joined = "\0 ".join(map(operator.attrgetter("title"), self._source))
+        self._folded = _fold(joined).split("\0")
+        if len(self._folded) != len(self._source):
+            # No tasks, or a title contains the separator.
+            self._folded = [_fold(task.title) for task in self._source]
+
+    def _narrow(self, query: str, cancelled: Optional[Callable[[], bool]]) -> List[int]:
+        if self._narrowed:
+            candidates: Sequence[int] = self._narrowed[-1].candidates
+        else:
+            candidates = range(len(self._source))
+        word = _fold(query)
+        needle = word[1:]
+        length = len(needle)
+        word_run_score = length * (SCORE_MATCH + BONUS_BOUNDARY) + BONUS_BOUNDARY * (
+            BONUS_FIRST_CHAR_MULTIPLIER - 1
+        )
+
+        word_runs: List[int] = []
+        for chunk in _chunks(candidates, cancelled):
+            word_runs += itertools.compress(
+                chunk,
+                map(
+                    operator.contains,
+                    _texts(chunk, self._folded),
+                    itertools.repeat(word),
+                ),
+            )
+        if len(word_runs) >= self._limit:
+            # A run at a word start outscores any other match, so the best
+            # matches are all among these. Finding the rest would take longer
+            # than ranking, so longer queries search all the candidates.
+            matched: Sequence[int] = candidates
+            scored = word_runs
+            scores = [word_run_score] * len(word_runs)
+        else:
+            scored, scores = [], []
+            for chunk in _chunks(candidates, cancelled):
+                chunk_matched, chunk_scores = self._score(chunk, word, word_run_score)
+                scored += chunk_matched
+                scores += chunk_scores
+            matched = scored
+
+        case_bonus = BONUS_SAME_CASE * sum(1 for char in query if char.isupper())
+        if case_bonus:
+            if not self._titles:
+                self._titles = list(map(operator.attrgetter("title"), self._source))
+            cased = map(
+                operator.contains,
+                _texts(scored, self._titles),
+                itertools.repeat(query),
+            )
+            scores = list(
+                map(operator.add, scores, map((0, case_bonus).__getitem__, cased))
+            )
+
+        keys = list(
+            map(
+                operator.sub,
+                map(len, _texts(scored, self._folded)),
+                map(operator.mul, scores, itertools.repeat(_LENGTH_SPAN)),
+            )
+        )
+        # Like a stable sort cut short, so ties keep their order in ``scored``.
+        best = heapq.nsmallest(self._limit, range(len(scored)), key=keys.__getitem__)
+        ranked = list(map(scored.__getitem__, best))
+        self._narrowed.append(_Narrowing(query, matched, ranked))
+        return ranked
+
+    def _score(
+        self, candidates: Sequence[int], word: str, word_run_score: int
+    ) -> Tuple[List[int], List[int]]:
+        """The candidates matching the folded query ``word``, with their
+        scores."""
+        needle = word[1:]
+        length = len(needle)
+        search = _subsequence_pattern(needle).search
+        found = list(map(search, _texts(candidates, self._folded)))
+        matched = list(itertools.compress(candidates, found))
+        matches = list(filter(None, found))
+        texts = list(_texts(matched, self._folded))
+
+        run_score = length * SCORE_MATCH + (length - 1) * BONUS_CONSECUTIVE
+        gap_score = (
+            length * SCORE_MATCH + SCORE_GAP_START - (length + 1) * SCORE_GAP_EXTENSION
+        )
+        first_char_bonus = BONUS_BOUNDARY * BONUS_FIRST_CHAR_MULTIPLIER
+        starts = list(map(re.Match.start, matches))
+        features = zip(
+            map(operator.contains, texts, itertools.repeat(needle)),
+            map(operator.contains, texts, itertools.repeat(word)),
+            map(operator.sub, map(re.Match.end, matches), starts),
+            # Folded titles start with a space, so there is a character before.
+            map(str.__getitem__, texts, map(operator.sub, starts, itertools.repeat(1))),
+        )
+        scores = [
+            (word_run_score if word_run else run_score)
+            if run
+            else gap_score
+            + SCORE_GAP_EXTENSION * span
+            + first_char_bonus * (before == " ")
+            for run, word_run, span, before in features
+        ]
+        return matched, scores
+
+
+def _chunks(
+    indexes: Sequence[int], cancelled: Optional[Callable[[], bool]]
+) -> Iterator[Sequence[int]]:
+    """``indexes`` in slices of ``_CHUNK``, checking ``cancelled`` before each."""
+    for start in range(0, len(indexes), _CHUNK):
+        if cancelled is not None and cancelled():
+            raise RankingCancelled
+        yield indexes[start : start + _CHUNK]
+
+
+def _texts(indexes: Sequence[int], texts: List[str]) -> Iterable[str]:
+    if isinstance(indexes, range):
+        # Slicing is much cheaper than looking up each index.
+        return texts[indexes.start : indexes.stop]
+    return map(texts.__getitem__, indexes)
@@ -1,10 +1,26 @@
-from dataclasses import dataclass, field
-from typing import Optional, List
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, List, Optional
 import datetime
+import sys
 
 
-@dataclass
+def intern_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """``tags`` as a list of interned strings."""
+    if not tags:
+        return []
+    return list(map(sys.intern, tags))
+
+
+@dataclass(slots=True)
 class Task:
+    """A single task.
+
+    Instances use ``__slots__`` instead of a per-instance ``__dict__``. List
+    names and tags are interned on construction, so the many tasks sharing a
+    list or a tag share those strings. Code that changes fields in place should
+    go through ``set_task_field``.
+    """
+
     id: str
     title: str
     completed: bool = False
@@ -17,6 +33,11 @@ class Task:
     is_flagged: bool = False
     recurring: Optional[str] = None
 
+    def __post_init__(self):
+        self.tags = intern_tags(self.tags)
+        if self.list_name is not None:
+            self.list_name = sys.intern(self.list_name)
+
     def __hash__(self):
         return hash(self.id)
 
@@ -24,3 +45,51 @@ class Task:
         if not isinstance(other, Task):
             return NotImplemented
         return self.id == other.id
+
+
+_FIELD_NAMES = tuple(task_field.name for task_field in fields(Task))
+
+
+def set_task_field(task: Task, key: str, value: Any) -> None:
+    """Set a field of ``task``, interning list names and tags as ``Task`` does."""
+    setattr(task, key, _stored_value(key, value))
+
+
+def changed_fields(task: Task, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the subset of ``updates`` whose values differ from ``task``."""
+    return {
+        key: value
+        for key, value in updates.items()
+        if not hasattr(task, key) or getattr(task, key) != _stored_value(key, value)
+    }
+
+
+def _stored_value(key: str, value: Any) -> Any:
+    if key == "tags":
+        return intern_tags(value)
+    if key == "list_name" and value is not None:
+        return sys.intern(value)
+    return value
+
+
+def task_to_dict(task: Task) -> Dict[str, Any]:
+    """A JSON-serializable dict of ``task``, with dates as ISO strings."""
+    task_dict = {name: getattr(task, name) for name in _FIELD_NAMES}
+    task_dict["tags"] = list(task.tags)
+    if task.due_date:
+        task_dict["due_date"] = task.due_date.isoformat()
+    if task.creation_date:
+        task_dict["creation_date"] = task.creation_date.isoformat()
+    return task_dict
+
+
+def task_from_dict(task_data: Dict[str, Any]) -> Task:
+    """The inverse of ``task_to_dict``."""
+    task_data = dict(task_data)
+    if task_data.get("due_date"):
+        task_data["due_date"] = datetime.date.fromisoformat(task_data["due_date"])
+    if task_data.get("creation_date"):
+        task_data["creation_date"] = datetime.datetime.fromisoformat(
+            task_data["creation_date"]
+        )
+    return Task(**task_data)
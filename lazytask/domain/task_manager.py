@@ -1,10 +1,40 @@
+import datetime
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
+from typing import Awaitable, List, Optional, Dict, Any
 
 from lazytask.domain.task import Task
 
 
+@dataclass
+class BatchResult:
+    """Outcome of one item of a bulk mutation.
+
+    ``task`` is what the single-task method returned for the item, which may be
+    None (e.g. an unknown ID); ``error`` is set instead if the item failed.
+    """
+
+    task: Optional[Task] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def capture_batch_result(operation: Awaitable[Optional[Task]]) -> BatchResult:
+    """Await one batch item, recording a failure instead of raising it."""
+    try:
+        return BatchResult(task=await operation)
+    except Exception as error:
+        return BatchResult(error=error)
+
+
 class TaskManager(ABC):
+    # Backends that can serve get_tasks_for_lists with one round-trip set this so
+    # callers don't fan out into one get_tasks call per list instead.
+    supports_bulk_fetch: bool = False
+
     @abstractmethod
     async def add_task(
         self, title: str, list_name: str = "develop", **kwargs: Any
@@ -26,6 +56,26 @@ class TaskManager(ABC):
         """Retrieves tasks from a specified list."""
         pass
 
+    async def get_tasks_for_lists(
+        self, list_names: List[str], include_completed: bool = False
+    ) -> Dict[str, List[Task]]:
+        """Retrieves tasks for several lists, keyed by list name in request order.
+
+        Backends with a bulk endpoint should override this; the default falls back
+        to one get_tasks call per list.
+        """
+        return {
+            list_name: await self.get_tasks(list_name, include_completed)
+            for list_name in list_names
+        }
+
+    @abstractmethod
+    async def get_task(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        """Retrieves a single task by ID, or None if the list has no such task."""
+        pass
+
     @abstractmethod
     async def get_lists(self) -> List[str]:
         """Retrieves all available task lists."""
@@ -87,8 +137,12 @@ class TaskManager(ABC):
         priority: Optional[int] = None,
         flagged: Optional[bool] = None,
         include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
     ) -> List[Task]:
-        """Filters tasks based on various criteria."""
+        """Filters tasks based on various criteria.
+
+        ``due_by`` keeps only tasks due on or before that day.
+        """
         pass
 
     @abstractmethod
@@ -118,3 +172,49 @@ class TaskManager(ABC):
     ) -> Optional[Task]:
         """Moves a task from one list to another."""
         pass
+
+    async def add_tasks(
+        self, new_tasks: List[Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        """Adds several tasks to a list, one result per entry in order.
+
+        Each entry holds a ``title`` plus the keyword arguments add_task takes.
+        The default adds them one at a time.
+        """
+        results = []
+        for entry in new_tasks:
+            options = dict(entry)
+            title = options.pop("title")
+            results.append(
+                await capture_batch_result(self.add_task(title, list_name, **options))
+            )
+        return results
+
+    async def complete_tasks(
+        self, task_ids: List[str], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        """Marks several tasks completed, one result per ID in order."""
+        return [
+            await capture_batch_result(self.complete_task(task_id, list_name))
+            for task_id in task_ids
+        ]
+
+    async def edit_tasks(
+        self, updates: Dict[str, Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        """Applies edit_task_full updates keyed by task ID, one result per ID in order."""
+        return [
+            await capture_batch_result(
+                self.edit_task_full(task_id, task_updates, list_name)
+            )
+            for task_id, task_updates in updates.items()
+        ]
+
+    def flush(self) -> None:
+        """Persists any buffered writes. Write-through backends need not override."""
+
+    def invalidate_cache(self, list_name: Optional[str] = None) -> None:
+        """Drops cached reads so the next fetch hits the backend. No-op by default."""
+
+    async def close(self) -> None:
+        """Stops helper processes the backend started. No-op by default."""
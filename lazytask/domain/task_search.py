@@ -0,0 +1,133 @@
+from typing import Callable, Dict, Hashable, Iterable, List, Set
+
+from lazytask.domain.task import Task
+
+_NO_KEYS: Set[Hashable] = frozenset()  # type: ignore[assignment]
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Case-insensitive substring search over texts keyed by an ID.
+
+    Every trigram of a text maps to the keys whose text contains it. A query's
+    trigrams are intersected, smallest posting set first, and only the keys
+    that survive are checked with a plain substring test. Queries shorter than
+    three characters have no trigrams and fall back to checking every text.
+    """
+
+    def __init__(self) -> None:
+        self._texts: Dict[Hashable, str] = {}
+        self._postings: Dict[str, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def set(self, key: Hashable, text: str) -> None:
+        """Index ``text`` under ``key``, replacing what was indexed before."""
+        text = text.lower()
+        old_text = self._texts.get(key)
+        if old_text == text:
+            return
+        new_grams = trigrams(text)
+        if old_text is not None:
+            old_grams = trigrams(old_text)
+            for gram in old_grams - new_grams:
+                self._discard_posting(gram, key)
+            new_grams -= old_grams
+        postings = self._postings
+        for gram in new_grams:
+            keys = postings.get(gram)
+            if keys is None:
+                postings[gram] = {key}
+            else:
+                keys.add(key)
+        self._texts[key] = text
+
+    def discard(self, key: Hashable) -> None:
+        old_text = self._texts.pop(key, None)
+        if old_text is not None:
+            for gram in trigrams(old_text):
+                self._discard_posting(gram, key)
+
+    def clear(self) -> None:
+        self._texts.clear()
+        self._postings.clear()
+
+    def search(self, query: str) -> Set[Hashable]:
+        """The keys whose text contains ``query``, ignoring case."""
+        query = query.lower()
+        grams = trigrams(query)
+        if not grams:
+            return {key for key, text in self._texts.items() if query in text}
+        postings = sorted(
+            (self._postings.get(gram, _NO_KEYS) for gram in grams), key=len
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return {key for key in candidates if query in self._texts[key]}
+
+    def _discard_posting(self, gram: str, key: Hashable) -> None:
+        keys = self._postings.get(gram)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._postings[gram]
+
+
+def task_id_key(task: Task) -> Hashable:
+    return task.id
+
+
+class TaskSearchIndex:
+    """Substring search over task titles and descriptions.
+
+    Tasks are keyed by ``key`` (their ID by default). Re-adding a task whose
+    title and description are unchanged only compares strings, so callers can
+    re-add a whole freshly fetched list to keep the index current. Indexing
+    costs a few seconds per 50k tasks with notes, so owners build it on the
+    first search and keep it updated from then on.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Task] = (),
+        key: Callable[[Task], Hashable] = task_id_key,
+    ):
+        self.key = key
+        self._titles = TrigramIndex()
+        self._descriptions = TrigramIndex()
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Task) -> None:
+        """Index a task, or re-index it after its title or description changed."""
+        key = self.key(task)
+        self._titles.set(key, task.title)
+        if task.description:
+            self._descriptions.set(key, task.description)
+        else:
+            self._descriptions.discard(key)
+
+    def discard(self, key: Hashable) -> None:
+        self._titles.discard(key)
+        self._descriptions.discard(key)
+
+    def clear(self) -> None:
+        self._titles.clear()
+        self._descriptions.clear()
+
+    def search(self, query: str, include_descriptions: bool = True) -> Set[Hashable]:
+        """Keys of the tasks whose title (or description) contains ``query``."""
+        matches = self._titles.search(query)
+        if include_descriptions:
+            matches |= self._descriptions.search(query)
+        return matches
+
+    def filter(
+        self, tasks: Iterable[Task], query: str, include_descriptions: bool = True
+    ) -> List[Task]:
+        """The indexed ``tasks`` that match ``query``, in their given order."""
+        matches = self.search(query, include_descriptions)
+        return [task for task in tasks if self.key(task) in matches]
@@ -0,0 +1,350 @@
+import dataclasses
+import datetime
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from lazytask.domain.task import Task
+from lazytask.domain.task_manager import BatchResult, TaskManager
+
+CacheKey = Tuple[str, bool]  # (list_name, include_completed)
+
+
+class CachingTaskManager(TaskManager):
+    """Read-through cache around another TaskManager.
+
+    get_tasks and get_lists results are kept for ``ttl`` seconds. Mutations patch
+    the cached lists in place using the task the backend returns; when a backend
+    cannot report the result (e.g. reminders-cli's tag and flag edits), the
+    affected list is dropped from the cache instead.
+    """
+
+    def __init__(
+        self,
+        task_manager: TaskManager,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl <= 0:
+            raise ValueError(f"Cache ttl must be positive, got {ttl}.")
+        self.task_manager = task_manager
+        self.ttl = ttl
+        self._clock = clock
+        self._tasks: Dict[CacheKey, Tuple[float, List[Task]]] = {}
+        self._lists: Optional[Tuple[float, List[str]]] = None
+
+    @property
+    def supports_bulk_fetch(self) -> bool:  # type: ignore[override]
+        return self.task_manager.supports_bulk_fetch
+
+    def __getattr__(self, name: str) -> Any:
+        # Backend-specific extras (e.g. MockTaskManager.compact) pass through.
+        if name == "task_manager":
+            raise AttributeError(name)
+        return getattr(self.task_manager, name)
+
+    def _normalize_list_name(self, list_name: str) -> str:
+        cleaned = (list_name or "").strip()
+        if not cleaned:
+            raise ValueError("List name must not be empty")
+        return cleaned
+
+    def _is_fresh(self, stored_at: float) -> bool:
+        return self._clock() - stored_at < self.ttl
+
+    def _cached_tasks(self, key: CacheKey) -> Optional[List[Task]]:
+        entry = self._tasks.get(key)
+        if entry is None:
+            return None
+        stored_at, tasks = entry
+        if not self._is_fresh(stored_at):
+            del self._tasks[key]
+            return None
+        return tasks
+
+    def _store_tasks(self, key: CacheKey, tasks: List[Task]) -> List[Task]:
+        stored = list(tasks)
+        self._tasks[key] = (self._clock(), stored)
+        return stored
+
+    def invalidate_cache(self, list_name: Optional[str] = None) -> None:
+        """Drop cached entries for one list, or everything when no list is given."""
+        self.task_manager.invalidate_cache(list_name)
+        if list_name is None:
+            self._tasks.clear()
+            self._lists = None
+            return
+        clean_list = self._normalize_list_name(list_name)
+        for include_completed in (False, True):
+            self._tasks.pop((clean_list, include_completed), None)
+
+    def _remove_task(self, list_name: str, task_id: str) -> None:
+        for include_completed in (False, True):
+            cached = self._cached_tasks((list_name, include_completed))
+            if cached is not None:
+                cached[:] = [task for task in cached if task.id != task_id]
+
+    def _put_task(self, task: Task, replaces_id: Optional[str] = None) -> None:
+        """Insert or replace a task in every cached view of its list."""
+        list_name = self._normalize_list_name(task.list_name or "")
+        previous_id = replaces_id or task.id
+        for include_completed in (False, True):
+            cached = self._cached_tasks((list_name, include_completed))
+            if cached is None:
+                continue
+            position = next(
+                (
+                    index
+                    for index, cached_task in enumerate(cached)
+                    if cached_task.id == previous_id
+                ),
+                None,
+            )
+            visible = include_completed or not task.completed
+            if position is None:
+                if visible:
+                    cached.append(task)
+            elif visible:
+                cached[position] = task
+            else:
+                del cached[position]
+        if self._lists is not None and list_name not in self._lists[1]:
+            self._lists[1].append(list_name)
+
+    def _apply_result(
+        self, result: Optional[Task], task_id: str, list_name: str
+    ) -> Optional[Task]:
+        clean_list = self._normalize_list_name(list_name)
+        if result is None:
+            self.invalidate_cache(clean_list)
+            return result
+        if not result.list_name:
+            result = dataclasses.replace(result, list_name=clean_list)
+        if result.list_name != clean_list:
+            self._remove_task(clean_list, task_id)
+            self._put_task(result)
+        else:
+            # Recreating backends may hand back a new ID for the same task.
+            self._put_task(result, replaces_id=task_id)
+        return result
+
+    def _find_cached_task(self, list_name: str, task_id: str) -> Optional[Task]:
+        for include_completed in (True, False):
+            cached = self._cached_tasks((list_name, include_completed))
+            for task in cached or []:
+                if task.id == task_id:
+                    return task
+        return None
+
+    def _apply_added(self, task: Task, list_name: str) -> None:
+        if task.list_name:
+            self._put_task(task)
+        else:
+            self.invalidate_cache(list_name)
+
+    def _apply_completed(
+        self, result: Optional[Task], task_id: str, list_name: str
+    ) -> Optional[Task]:
+        if result is None:
+            # reminders-cli does not return the completed task; patch our copy.
+            clean_list = self._normalize_list_name(list_name)
+            cached_task = self._find_cached_task(clean_list, task_id)
+            if cached_task is not None:
+                self._put_task(dataclasses.replace(cached_task, completed=True))
+            return result
+        return self._apply_result(result, task_id, list_name)
+
+    async def add_task(
+        self, title: str, list_name: str = "develop", **kwargs: Any
+    ) -> Task:
+        task = await self.task_manager.add_task(title, list_name, **kwargs)
+        self._apply_added(task, list_name)
+        return task
+
+    async def add_tasks(
+        self, new_tasks: List[Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        results = await self.task_manager.add_tasks(new_tasks, list_name)
+        for result in results:
+            if result.task is not None:
+                self._apply_added(result.task, list_name)
+        return results
+
+    async def complete_task(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.complete_task(task_id, list_name)
+        return self._apply_completed(result, task_id, list_name)
+
+    async def complete_tasks(
+        self, task_ids: List[str], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        results = await self.task_manager.complete_tasks(task_ids, list_name)
+        for task_id, result in zip(task_ids, results):
+            if result.ok:
+                self._apply_completed(result.task, task_id, list_name)
+            else:
+                self.invalidate_cache(list_name)
+        return results
+
+    async def get_tasks(
+        self, list_name: str = "develop", include_completed: bool = False
+    ) -> List[Task]:
+        key = (self._normalize_list_name(list_name), include_completed)
+        cached = self._cached_tasks(key)
+        if cached is None:
+            cached = self._store_tasks(
+                key, await self.task_manager.get_tasks(list_name, include_completed)
+            )
+        return list(cached)
+
+    async def get_task(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        cached_task = self._find_cached_task(
+            self._normalize_list_name(list_name), task_id
+        )
+        if cached_task is not None:
+            return cached_task
+        return await self.task_manager.get_task(task_id, list_name)
+
+    async def get_tasks_for_lists(
+        self, list_names: List[str], include_completed: bool = False
+    ) -> Dict[str, List[Task]]:
+        missing = [
+            list_name
+            for list_name in list_names
+            if self._cached_tasks(
+                (self._normalize_list_name(list_name), include_completed)
+            )
+            is None
+        ]
+        if missing and self.supports_bulk_fetch:
+            fetched = await self.task_manager.get_tasks_for_lists(
+                missing, include_completed
+            )
+            for list_name, tasks in fetched.items():
+                self._store_tasks(
+                    (self._normalize_list_name(list_name), include_completed), tasks
+                )
+        return {
+            list_name: await self.get_tasks(list_name, include_completed)
+            for list_name in list_names
+        }
+
+    async def get_lists(self) -> List[str]:
+        if self._lists is None or not self._is_fresh(self._lists[0]):
+            self._lists = (self._clock(), list(await self.task_manager.get_lists()))
+        return list(self._lists[1])
+
+    async def edit_task_date(
+        self, task_id: str, new_date: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.edit_task_date(task_id, new_date, list_name)
+        return self._apply_result(result, task_id, list_name)
+
+    async def move_task_to_tomorrow(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.move_task_to_tomorrow(task_id, list_name)
+        return self._apply_result(result, task_id, list_name)
+
+    async def edit_task_description(
+        self, task_id: str, description: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.edit_task_description(
+            task_id, description, list_name
+        )
+        return self._apply_result(result, task_id, list_name)
+
+    async def edit_task_tags(
+        self, task_id: str, tags: List[str], list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.edit_task_tags(task_id, tags, list_name)
+        return self._apply_result(result, task_id, list_name)
+
+    async def edit_task_priority(
+        self, task_id: str, priority: int, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.edit_task_priority(
+            task_id, priority, list_name
+        )
+        return self._apply_result(result, task_id, list_name)
+
+    async def edit_task_flag(
+        self, task_id: str, flagged: bool, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.edit_task_flag(task_id, flagged, list_name)
+        return self._apply_result(result, task_id, list_name)
+
+    async def refresh_tasks(self, list_name: str = "develop") -> List[Task]:
+        self.invalidate_cache(list_name)
+        tasks = await self.task_manager.refresh_tasks(list_name)
+        self._store_tasks((self._normalize_list_name(list_name), False), tasks)
+        return list(tasks)
+
+    async def filter_tasks(
+        self,
+        list_name: str = "develop",
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        priority: Optional[int] = None,
+        flagged: Optional[bool] = None,
+        include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
+    ) -> List[Task]:
+        return await self.task_manager.filter_tasks(
+            list_name, query, tags, priority, flagged, include_completed, due_by
+        )
+
+    async def sort_tasks(
+        self, list_name: str = "develop", sort_by: str = "due_date"
+    ) -> List[Task]:
+        return await self.task_manager.sort_tasks(list_name, sort_by)
+
+    async def edit_task_full(
+        self, task_id: str, updates: Dict[str, Any], list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.edit_task_full(task_id, updates, list_name)
+        return self._apply_result(result, task_id, list_name)
+
+    async def edit_tasks(
+        self, updates: Dict[str, Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        results = await self.task_manager.edit_tasks(updates, list_name)
+        for task_id, result in zip(updates, results):
+            if result.ok:
+                self._apply_result(result.task, task_id, list_name)
+            else:
+                self.invalidate_cache(list_name)
+        return results
+
+    async def set_task_recurring(
+        self, task_id: str, recurring: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        result = await self.task_manager.set_task_recurring(
+            task_id, recurring, list_name
+        )
+        return self._apply_result(result, task_id, list_name)
+
+    async def move_task(
+        self, task_id: str, from_list: str, to_list: str
+    ) -> Optional[Task]:
+        result = await self.task_manager.move_task(task_id, from_list, to_list)
+        self._remove_task(self._normalize_list_name(from_list), task_id)
+        if result is None:
+            self.invalidate_cache(to_list)
+            return result
+        self._put_task(
+            dataclasses.replace(result, list_name=self._normalize_list_name(to_list))
+        )
+        return result
+
+    async def clear_tasks(self):
+        await self.task_manager.clear_tasks()  # type: ignore[attr-defined]
+        self.invalidate_cache()
+
+    def flush(self) -> None:
+        self.task_manager.flush()
+
+    async def close(self) -> None:
+        await self.task_manager.close()
@@ -2,22 +2,54 @@ import datetime
 import json
 import logging
 import os
+import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from lazytask.domain.task import Task
-from lazytask.domain.task_manager import TaskManager
+from lazytask.domain.task import Task, set_task_field, task_to_dict
+from lazytask.domain.task_manager import BatchResult, TaskManager
+from lazytask.infrastructure.task_index import IndexedTasks
 
 
 class MockTaskManager(TaskManager):
     def __init__(
-        self, file_path: str = "mock_tasks.json", use_persistence: bool = True
+        self,
+        file_path: str = "mock_tasks.json",
+        use_persistence: bool = True,
+        use_journal: bool = False,
+        compact_threshold: int = 500,
+        write_behind: bool = False,
+        write_behind_delay: float = 0.5,
     ):
+        if compact_threshold < 1:
+            raise ValueError(
+                f"compact_threshold must be at least 1, got {compact_threshold}."
+            )
+        if write_behind_delay < 0:
+            raise ValueError(
+                f"write_behind_delay must not be negative, got {write_behind_delay}."
+            )
         self.file_path = file_path
         self.use_persistence = use_persistence
-        self._tasks: Dict[str, Dict[str, Task]] = {
-            "develop": {}
-        }  # list_name -> {task_id -> Task}
+        # With a journal every mutation appends one compact record to
+        # ``<file_path>.journal``; the snapshot at ``file_path`` is only rewritten
+        # when the journal is compacted.
+        self.use_journal = use_journal
+        self.journal_path = f"{file_path}.journal"
+        self.compact_threshold = compact_threshold
+        self._journal_records = 0
+        # With write-behind, mutations only mark the store dirty; a background
+        # timer writes everything that accumulated within write_behind_delay.
+        self.write_behind = write_behind
+        self.write_behind_delay = write_behind_delay
+        self._dirty = False
+        self._pending_records: List[Dict[str, Any]] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        # list_name -> {task_id -> Task}, with secondary indexes per list. Code
+        # that changes a stored task in place must call reindex on its bucket.
+        self._tasks: Dict[str, IndexedTasks] = {"develop": IndexedTasks()}
         if self.use_persistence:
             self._load_tasks()
 
@@ -33,48 +65,169 @@ class MockTaskManager(TaskManager):
                 data = json.load(f)
                 for raw_list_name, tasks in data.items():
                     list_name = self._normalize_list_name(raw_list_name)
-                    list_bucket = self._tasks.setdefault(list_name, {})
+                    list_bucket = self._tasks.setdefault(list_name, IndexedTasks())
                     for task_id, task_data in tasks.items():
-                        if task_data.get("due_date") and isinstance(
-                            task_data.get("due_date"), str
-                        ):
-                            task_data["due_date"] = datetime.datetime.strptime(
-                                task_data["due_date"], "%Y-%m-%d"
-                            ).date()
-                        if task_data.get("creation_date") and isinstance(
-                            task_data.get("creation_date"), str
-                        ):
-                            task_data["creation_date"] = (
-                                datetime.datetime.fromisoformat(
-                                    task_data.pop("creation_date")
-                                )
-                            )
-                        task_data["list_name"] = list_name
-                        list_bucket[task_id] = Task(**task_data)
+                        list_bucket[task_id] = self._task_from_dict(
+                            task_data, list_name
+                        )
+        if self.use_journal:
+            self._replay_journal()
+
+    def _task_from_dict(self, task_data: Dict[str, Any], list_name: str) -> Task:
+        task_data = dict(task_data)
+        if task_data.get("due_date") and isinstance(task_data.get("due_date"), str):
+            task_data["due_date"] = datetime.datetime.strptime(
+                task_data["due_date"], "%Y-%m-%d"
+            ).date()
+        if task_data.get("creation_date") and isinstance(
+            task_data.get("creation_date"), str
+        ):
+            task_data["creation_date"] = datetime.datetime.fromisoformat(
+                task_data.pop("creation_date")
+            )
+        task_data["list_name"] = list_name
+        return Task(**task_data)
+
+    def _replay_journal(self):
+        """Apply the journal tail on top of the loaded snapshot.
+
+        Records are idempotent (put/delete/clear), so replaying a journal that was
+        already folded into the snapshot by an interrupted compaction is harmless.
+        A torn final line from a crash mid-append is ignored and cut off the
+        file, so the next append starts on a line of its own.
+        """
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, "rb") as f:
+            data = f.read()
+        lines = data.split(b"\n")
+        # Byte offset just past the last record that was read in full.
+        end = 0
+        for line_number, line in enumerate(lines, start=1):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    if line_number == len(lines):
+                        logging.warning(
+                            f"Ignoring truncated journal record at {self.journal_path}:{line_number}"
+                        )
+                        break
+                    raise ValueError(
+                        f"Corrupt journal record at {self.journal_path}:{line_number}"
+                    )
+                self._apply_journal_record(record)
+                self._journal_records += 1
+            end += len(line) + 1
+        if end > len(data):
+            # The last record is complete but its newline never made it.
+            with open(self.journal_path, "ab") as f:
+                f.write(b"\n")
+        elif end < len(data):
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(end)
+
+    def _apply_journal_record(self, record: Dict[str, Any]):
+        operation = record.get("op")
+        if operation == "put":
+            list_name = self._normalize_list_name(record["list"])
+            task = self._task_from_dict(record["task"], list_name)
+            self._tasks.setdefault(list_name, IndexedTasks())[task.id] = task
+        elif operation == "delete":
+            list_name = self._normalize_list_name(record["list"])
+            self._tasks.get(list_name, {}).pop(record["id"], None)
+        elif operation == "clear":
+            self._tasks = {"develop": IndexedTasks()}
+        else:
+            raise ValueError(f"Unknown journal operation '{operation}'")
+
+    def _put_record(self, task: Task) -> Dict[str, Any]:
+        return {"op": "put", "list": task.list_name, "task": task_to_dict(task)}
+
+    def _delete_record(self, list_name: str, task_id: str) -> Dict[str, Any]:
+        return {"op": "delete", "list": list_name, "id": task_id}
+
+    def _persist(self, *records: Dict[str, Any]):
+        """Persist a mutation, either as journal records or as a full snapshot."""
+        if not self.use_persistence:
+            return
+        if self.write_behind:
+            self._schedule_write(records)
+            return
+        with self._write_lock:
+            self._write(list(records))
+
+    def _schedule_write(self, records: tuple[Dict[str, Any], ...]):
+        with self._pending_lock:
+            self._dirty = True
+            if self.use_journal:
+                self._pending_records.extend(records)
+            # The timer is not restarted by later mutations so a steady stream of
+            # edits still reaches the disk within write_behind_delay.
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.write_behind_delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        """Write any mutations still buffered by write-behind mode."""
+        with self._write_lock:
+            with self._pending_lock:
+                timer, self._flush_timer = self._flush_timer, None
+                records, self._pending_records = self._pending_records, []
+                dirty, self._dirty = self._dirty, False
+            if timer is not None:
+                timer.cancel()
+            if dirty:
+                self._write(records)
+
+    def _write(self, records: List[Dict[str, Any]]):
+        if not self.use_journal:
+            self._save_tasks()
+            return
+        with open(self.journal_path, "a") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._journal_records += len(records)
+        if self._journal_records >= self.compact_threshold:
+            self._compact()
+
+    def compact(self):
+        """Fold the journal into the snapshot and start a fresh journal."""
+        if not self.use_persistence:
+            return
+        self.flush()
+        with self._write_lock:
+            self._compact()
+
+    def _compact(self):
+        self._save_tasks()
+        if self.use_journal:
+            with open(self.journal_path, "w"):
+                pass
+            self._journal_records = 0
 
     def _save_tasks(self):
         if not self.use_persistence:
             return
-        with open(self.file_path, "w") as f:
-            data = {
-                list_name: {
-                    task_id: self._task_to_dict(task) for task_id, task in tasks.items()
-                }
-                for list_name, tasks in self._tasks.items()
+        # Write-behind serializes from a background thread while the event loop
+        # keeps mutating; list() copies of the dicts are atomic under the GIL.
+        data = {
+            list_name: {
+                task_id: task_to_dict(task) for task_id, task in list(tasks.items())
             }
+            for list_name, tasks in list(self._tasks.items())
+        }
+        # Write to a temp file and rename so a crash never leaves a half-written
+        # snapshot behind; compaction truncates the journal right after this.
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "w") as f:
             json.dump(data, f, indent=4)
-
-    def _task_to_dict(self, task: Task) -> Dict[str, Any]:
-        task_dict = task.__dict__.copy()
-        if isinstance(task_dict.get("due_date"), datetime.date):
-            task_dict["due_date"] = task_dict["due_date"].isoformat()
-        if isinstance(task_dict.get("creation_date"), datetime.datetime):
-            task_dict["creation_date"] = task_dict["creation_date"].isoformat()
-        return task_dict
+        os.replace(temp_path, self.file_path)
 
     async def clear_tasks(self):
-        self._tasks = {"develop": {}}
-        self._save_tasks()
+        self._tasks = {"develop": IndexedTasks()}
+        self._persist({"op": "clear"})
 
     async def add_task(
         self, title: str | Task, list_name: str = "develop", **kwargs
@@ -82,19 +235,24 @@ class MockTaskManager(TaskManager):
         if isinstance(title, Task):
             task_obj = title
             target_list = self._normalize_list_name(task_obj.list_name or list_name)
-            self._tasks.setdefault(target_list, {})
+            self._tasks.setdefault(target_list, IndexedTasks())
             if not task_obj.id:
                 task_obj.id = str(uuid.uuid4())
             if not task_obj.creation_date:
                 task_obj.creation_date = datetime.datetime.now()
-            task_obj.list_name = target_list
+            set_task_field(task_obj, "list_name", target_list)
             self._tasks[target_list][task_obj.id] = task_obj
-            self._save_tasks()
+            self._persist(self._put_record(task_obj))
             return task_obj
 
+        new_task = self._create_task(title, list_name, **kwargs)
+        self._persist(self._put_record(new_task))
+        return new_task
+
+    def _create_task(self, title: str, list_name: str, **kwargs) -> Task:
         list_name = self._normalize_list_name(list_name)
         if list_name not in self._tasks:
-            self._tasks[list_name] = {}
+            self._tasks[list_name] = IndexedTasks()
         task_id = kwargs.pop("id", None) or str(uuid.uuid4())
         new_task = Task(
             id=task_id,
@@ -106,32 +264,77 @@ class MockTaskManager(TaskManager):
             if hasattr(new_task, key):
                 if key == "due_date" and isinstance(value, str):
                     value = datetime.datetime.strptime(value, "%Y-%m-%d").date()
-                setattr(new_task, key, value)
+                set_task_field(new_task, key, value)
         self._tasks[list_name][task_id] = new_task
-        self._save_tasks()
         return new_task
 
     async def complete_task(
         self, task_id: str, list_name: str = "develop"
     ) -> Optional[Task]:
+        task = self._complete_task(task_id, list_name)
+        if task is not None:
+            self._persist(self._put_record(task))
+        return task
+
+    def _complete_task(self, task_id: str, list_name: str) -> Optional[Task]:
         list_name = self._normalize_list_name(list_name)
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
             task.completed = True
-            self._save_tasks()
+            self._tasks[list_name].reindex(task)
             return task
         return None
 
+    def _apply_batch(
+        self, items: List[Any], mutate: Callable[[Any], Optional[Task]]
+    ) -> List[BatchResult]:
+        """Apply ``mutate`` to every item, then persist the changes in one save."""
+        results = []
+        for item in items:
+            try:
+                results.append(BatchResult(task=mutate(item)))
+            except Exception as error:
+                results.append(BatchResult(error=error))
+        records = [
+            self._put_record(result.task)
+            for result in results
+            if result.task is not None
+        ]
+        if records:
+            self._persist(*records)
+        return results
+
+    async def add_tasks(
+        self, new_tasks: List[Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return self._apply_batch(
+            new_tasks, lambda entry: self._create_task(list_name=list_name, **entry)
+        )
+
+    async def complete_tasks(
+        self, task_ids: List[str], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return self._apply_batch(
+            task_ids, lambda task_id: self._complete_task(task_id, list_name)
+        )
+
+    async def edit_tasks(
+        self, updates: Dict[str, Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return self._apply_batch(
+            list(updates.items()),
+            lambda item: self._edit_task_full(item[0], item[1], list_name),
+        )
+
     async def get_tasks(
         self, list_name: str = "develop", include_completed: bool = False
     ) -> List[Task]:
         list_name = self._normalize_list_name(list_name)
         if list_name not in self._tasks:
             return []
-        tasks = list(self._tasks[list_name].values())
-        if not include_completed:
-            tasks = [task for task in tasks if not task.completed]
-        return tasks
+        if include_completed:
+            return list(self._tasks[list_name].values())
+        return self._tasks[list_name].active_tasks()
 
     async def get_task(
         self, task_id: str, list_name: str = "develop"
@@ -154,7 +357,8 @@ class MockTaskManager(TaskManager):
                 task.due_date = datetime.datetime.strptime(new_date, "%Y-%m-%d").date()
             else:
                 task.due_date = new_date
-            self._save_tasks()
+            self._tasks[list_name].reindex(task)
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -166,7 +370,8 @@ class MockTaskManager(TaskManager):
             task = self._tasks[list_name][task_id]
             tomorrow = datetime.date.today() + datetime.timedelta(days=1)
             task.due_date = tomorrow
-            self._save_tasks()
+            self._tasks[list_name].reindex(task)
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -177,7 +382,8 @@ class MockTaskManager(TaskManager):
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
             task.description = description
-            self._save_tasks()
+            self._tasks[list_name].reindex(task)
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -187,8 +393,9 @@ class MockTaskManager(TaskManager):
         list_name = self._normalize_list_name(list_name)
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
-            task.tags = tags
-            self._save_tasks()
+            set_task_field(task, "tags", tags)
+            self._tasks[list_name].reindex(task)
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -199,7 +406,7 @@ class MockTaskManager(TaskManager):
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
             task.priority = priority
-            self._save_tasks()
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -210,7 +417,8 @@ class MockTaskManager(TaskManager):
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
             task.is_flagged = flagged
-            self._save_tasks()
+            self._tasks[list_name].reindex(task)
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -226,27 +434,19 @@ class MockTaskManager(TaskManager):
         priority: Optional[int] = None,
         flagged: Optional[bool] = None,
         include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
     ) -> List[Task]:
         list_name = self._normalize_list_name(list_name)
-        tasks = await self.get_tasks(list_name, include_completed)
-        filtered_tasks = []
-        for task in tasks:
-            match = True
-            if (
-                query
-                and query.lower() not in task.title.lower()
-                and (task.description and query.lower() not in task.description.lower())
-            ):
-                match = False
-            if tags and not any(tag in task.tags for tag in tags):
-                match = False
-            if priority is not None and task.priority != priority:
-                match = False
-            if flagged is not None and task.is_flagged != flagged:
-                match = False
-            if match:
-                filtered_tasks.append(task)
-        return filtered_tasks
+        bucket = self._tasks.get(list_name)
+        if bucket is None:
+            return []
+        # Every criterion but priority is answered by the bucket's indexes.
+        candidates = bucket.in_list_order(
+            bucket.candidate_ids(tags, flagged, include_completed, due_by, query)
+        )
+        if priority is None:
+            return candidates
+        return [task for task in candidates if task.priority == priority]
 
     async def sort_tasks(
         self, list_name: str = "develop", sort_by: str = "due_date"
@@ -273,6 +473,14 @@ class MockTaskManager(TaskManager):
         self, task_id: str, updates: Dict[str, Any], list_name: str = "develop"
     ) -> Optional[Task]:
         logging.debug(f"Editing task {task_id} with updates: {updates}")
+        task = self._edit_task_full(task_id, updates, list_name)
+        if task is not None:
+            self._persist(self._put_record(task))
+        return task
+
+    def _edit_task_full(
+        self, task_id: str, updates: Dict[str, Any], list_name: str
+    ) -> Optional[Task]:
         list_name = self._normalize_list_name(list_name)
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
@@ -280,8 +488,8 @@ class MockTaskManager(TaskManager):
                 if hasattr(task, key):
                     if key == "due_date" and isinstance(value, str):
                         value = datetime.datetime.strptime(value, "%Y-%m-%d").date()
-                    setattr(task, key, value)
-            self._save_tasks()
+                    set_task_field(task, key, value)
+            self._tasks[list_name].reindex(task)
             return task
         return None
 
@@ -292,7 +500,7 @@ class MockTaskManager(TaskManager):
         if list_name in self._tasks and task_id in self._tasks[list_name]:
             task = self._tasks[list_name][task_id]
             task.recurring = recurring
-            self._save_tasks()
+            self._persist(self._put_record(task))
             return task
         return None
 
@@ -304,9 +512,11 @@ class MockTaskManager(TaskManager):
         if from_list_clean in self._tasks and task_id in self._tasks[from_list_clean]:
             task = self._tasks[from_list_clean].pop(task_id)
             if to_list_clean not in self._tasks:
-                self._tasks[to_list_clean] = {}
+                self._tasks[to_list_clean] = IndexedTasks()
             self._tasks[to_list_clean][task_id] = task
-            task.list_name = to_list_clean
-            self._save_tasks()
+            set_task_field(task, "list_name", to_list_clean)
+            self._persist(
+                self._delete_record(from_list_clean, task_id), self._put_record(task)
+            )
             return task
         return None
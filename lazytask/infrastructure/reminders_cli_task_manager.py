@@ -1,8 +1,14 @@
 import asyncio
+import dataclasses
 import json
-from typing import List, Optional, Dict, Any
-from lazytask.domain.task_manager import TaskManager
-from lazytask.domain.task import Task
+from typing import Awaitable, Callable, List, Optional, Dict, Any
+from lazytask.domain.task_manager import (
+    BatchResult,
+    TaskManager,
+    capture_batch_result,
+)
+from lazytask.domain.task import Task, set_task_field
+from lazytask.infrastructure.reminders_cli_worker import RemindersCliWorker
 
 import datetime
 
@@ -19,6 +25,24 @@ class RemindersCliTaskManager(TaskManager):
         9: "low",
     }
     _PRIORITY_NAME_SET = {"none", "low", "medium", "high"}
+    _UNSUPPORTED_EDIT_FIELDS = ("tags", "is_flagged", "recurring")
+    supports_bulk_fetch = True
+
+    def __init__(
+        self, worker: Optional[RemindersCliWorker] = None, batch_concurrency: int = 4
+    ):
+        if batch_concurrency < 1:
+            raise ValueError(
+                f"batch_concurrency must be at least 1, got {batch_concurrency}."
+            )
+        # Without a worker every operation spawns a fresh reminders process.
+        self.worker = worker
+        # How many reminders commands a bulk mutation keeps in flight at once.
+        self.batch_concurrency = batch_concurrency
+        # list name -> task ID -> last task seen from the CLI. Lets get_task and
+        # the edit paths find a reminder without refetching its whole list; it
+        # is refreshed by every list fetch and dropped by invalidate_cache.
+        self._task_index: Dict[str, Dict[str, Task]] = {}
 
     @staticmethod
     def _parse_cli_datetime(value: str | None) -> Optional[datetime.datetime]:
@@ -104,6 +128,9 @@ class RemindersCliTaskManager(TaskManager):
         )
 
     async def _run_cli_command(self, command: List[str]) -> Dict[str, Any]:
+        if self.worker is not None:
+            return self._parse_cli_output(await self.worker.request(command))
+
         process = await asyncio.create_subprocess_exec(
             REMINDERS_CLI_PATH,
             *command,
@@ -115,7 +142,10 @@ class RemindersCliTaskManager(TaskManager):
         if process.returncode != 0:
             raise Exception(f"CLI command failed with error: {stderr.decode().strip()}")
 
-        output = stdout.decode().strip()
+        return self._parse_cli_output(stdout.decode())
+
+    def _parse_cli_output(self, raw_output: str) -> Any:
+        output = raw_output.strip()
         if output:
             try:
                 return json.loads(output)
@@ -154,6 +184,38 @@ class RemindersCliTaskManager(TaskManager):
             raise ValueError("List name must not be empty")
         return cleaned
 
+    def _index_tasks(
+        self, list_name: str, tasks: List[Task], include_completed: bool
+    ) -> None:
+        if include_completed:
+            index: Dict[str, Task] = {}
+        else:
+            # Completed reminders weren't part of this fetch; keep what we know.
+            index = {
+                task_id: task
+                for task_id, task in self._task_index.get(list_name, {}).items()
+                if task.completed
+            }
+        index.update((task.id, task) for task in tasks)
+        self._task_index[list_name] = index
+
+    def _remember_task(self, list_name: str, task: Task) -> None:
+        if task.id:
+            self._task_index.setdefault(list_name, {})[task.id] = task
+
+    def _forget_task(self, list_name: str, task_id: str) -> None:
+        self._task_index.get(list_name, {}).pop(task_id, None)
+
+    def invalidate_cache(self, list_name: Optional[str] = None) -> None:
+        if list_name is None:
+            self._task_index.clear()
+        else:
+            self._task_index.pop(self._normalize_list_name(list_name), None)
+
+    async def close(self) -> None:
+        if self.worker is not None:
+            await self.worker.close()
+
     async def add_task(
         self, title: str, list_name: str = "develop", **kwargs: Any
     ) -> Task:
@@ -187,7 +249,9 @@ class RemindersCliTaskManager(TaskManager):
                 ) from error
 
         response = await self._run_cli_command(command)
-        return self._parse_reminder_json(response)
+        task = self._parse_reminder_json(response)
+        self._remember_task(clean_list, task)
+        return task
 
     async def complete_task(
         self, task_id: str, list_name: str = "develop"
@@ -195,12 +259,53 @@ class RemindersCliTaskManager(TaskManager):
         clean_list = self._normalize_list_name(list_name)
         command = ["complete", clean_list, task_id]
         await self._run_cli_command(command)  # This command doesn't return JSON
+        indexed_task = self._task_index.get(clean_list, {}).get(task_id)
+        if indexed_task is not None:
+            self._remember_task(
+                clean_list, dataclasses.replace(indexed_task, completed=True)
+            )
         # To get the updated task, we need to fetch it
         # This is a limitation, as the CLI doesn't return the completed task
         # For now, we'll return None or try to fetch all tasks and find it
         # A better approach would be to modify the CLI to return the updated task
         return None  # Placeholder
 
+    async def _run_batch(
+        self, items: List[Any], operation: Callable[[Any], Awaitable[Optional[Task]]]
+    ) -> List[BatchResult]:
+        """Run ``operation`` for every item, at most batch_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(item: Any) -> BatchResult:
+            async with semaphore:
+                return await capture_batch_result(operation(item))
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    async def add_tasks(
+        self, new_tasks: List[Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        def add(entry: Dict[str, Any]) -> Awaitable[Task]:
+            options = dict(entry)
+            return self.add_task(options.pop("title"), list_name, **options)
+
+        return await self._run_batch(new_tasks, add)
+
+    async def complete_tasks(
+        self, task_ids: List[str], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return await self._run_batch(
+            task_ids, lambda task_id: self.complete_task(task_id, list_name)
+        )
+
+    async def edit_tasks(
+        self, updates: Dict[str, Dict[str, Any]], list_name: str = "develop"
+    ) -> List[BatchResult]:
+        return await self._run_batch(
+            list(updates.items()),
+            lambda item: self.edit_task_full(item[0], item[1], list_name),
+        )
+
     async def get_tasks(
         self, list_name: str = "develop", include_completed: bool = False
     ) -> List[Task]:
@@ -210,9 +315,46 @@ class RemindersCliTaskManager(TaskManager):
             command.extend(["--include-completed"])
 
         response = await self._run_cli_command(command)
-        if isinstance(response, list):
-            return [self._parse_reminder_json(r) for r in response]
-        return []
+        if not isinstance(response, list):
+            return []
+        tasks = [self._parse_reminder_json(r) for r in response]
+        self._index_tasks(clean_list, tasks, include_completed)
+        return tasks
+
+    async def get_task(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        clean_list = self._normalize_list_name(list_name)
+        task = self._task_index.get(clean_list, {}).get(task_id)
+        if task is None:
+            # Unknown ID: one list fetch refreshes the index for this list.
+            tasks = await self.get_tasks(clean_list, include_completed=True)
+            task = next((t for t in tasks if t.id == task_id), None)
+        return task
+
+    async def get_tasks_for_lists(
+        self, list_names: List[str], include_completed: bool = False
+    ) -> Dict[str, List[Task]]:
+        # One show-all call instead of one process (and EventKit startup) per list.
+        tasks_by_list: Dict[str, List[Task]] = {
+            self._normalize_list_name(list_name): [] for list_name in list_names
+        }
+        command = ["show-all", "--format", "json"]
+        if include_completed:
+            command.append("--include-completed")
+
+        response = await self._run_cli_command(command)
+        if not isinstance(response, list):
+            return tasks_by_list
+        for reminder_json in response:
+            list_name = str(reminder_json.get("list") or "").strip()
+            if list_name in tasks_by_list:
+                task = self._parse_reminder_json(reminder_json)
+                set_task_field(task, "list_name", list_name)
+                tasks_by_list[list_name].append(task)
+        for list_name, tasks in tasks_by_list.items():
+            self._index_tasks(list_name, tasks, include_completed)
+        return tasks_by_list
 
     async def get_lists(self) -> List[str]:
         command = ["show-lists", "--format", "json"]
@@ -233,8 +375,7 @@ class RemindersCliTaskManager(TaskManager):
         list_name: str = "develop",
     ) -> Optional[Task]:
         clean_list = self._normalize_list_name(list_name)
-        tasks = await self.get_tasks(clean_list, include_completed=True)
-        original_task = next((t for t in tasks if t.id == task_id), None)
+        original_task = await self.get_task(task_id, clean_list)
 
         if not original_task:
             return None
@@ -258,24 +399,43 @@ class RemindersCliTaskManager(TaskManager):
         if original_task.priority is not None:
             recreation_kwargs["priority"] = original_task.priority
 
+        return await self._recreate_task(
+            original_task,
+            clean_list,
+            original_task.title,
+            recreation_kwargs,
+            purpose="updating the due date",
+        )
+
+    async def _recreate_task(
+        self,
+        original_task: Task,
+        clean_list: str,
+        title: str,
+        recreation_kwargs: Dict[str, Any],
+        purpose: str,
+    ) -> Task:
+        """Apply edits reminders-cli can't make in place: add a copy, then delete."""
         try:
             recreated_task = await self.add_task(
-                original_task.title,
+                title,
                 list_name=clean_list,
                 **recreation_kwargs,
             )
         except Exception as error:
             raise RuntimeError(
                 f"Failed to create task '{original_task.title}' on '{clean_list}' "
-                "while updating the due date."
+                f"while {purpose}."
             ) from error
 
+        task_id = original_task.id
         try:
             await self._run_cli_command(["delete", clean_list, task_id])
         except Exception as error:
             cleanup_error: Optional[Exception] = None
             try:
                 await self._run_cli_command(["delete", clean_list, recreated_task.id])
+                self._forget_task(clean_list, recreated_task.id)
             except Exception as attempted_cleanup_error:
                 cleanup_error = attempted_cleanup_error
 
@@ -287,9 +447,10 @@ class RemindersCliTaskManager(TaskManager):
 
             raise RuntimeError(
                 f"Failed to delete original task '{task_id}' from '{clean_list}' "
-                "after recreating it with a new due date."
+                f"after recreating it while {purpose}."
             ) from error
 
+        self._forget_task(clean_list, task_id)
         return recreated_task
 
     async def move_task_to_tomorrow(
@@ -305,9 +466,13 @@ class RemindersCliTaskManager(TaskManager):
         clean_list = self._normalize_list_name(list_name)
         command = ["edit", clean_list, task_id, "--notes", description]
         await self._run_cli_command(command)
-        # The CLI doesn't return the updated task, so we fetch it
-        tasks = await self.get_tasks(clean_list, include_completed=True)
-        return next((t for t in tasks if t.id == task_id), None)
+        # The CLI doesn't return the updated task, so patch the one we know.
+        task = await self.get_task(task_id, clean_list)
+        if task is None:
+            return None
+        updated_task = dataclasses.replace(task, description=description)
+        self._remember_task(clean_list, updated_task)
+        return updated_task
 
     async def edit_task_tags(
         self, task_id: str, tags: List[str], list_name: str = "develop"
@@ -323,11 +488,11 @@ class RemindersCliTaskManager(TaskManager):
     ) -> Optional[Task]:
         # Similar workaround as edit_task_date
         clean_list = self._normalize_list_name(list_name)
-        tasks = await self.get_tasks(clean_list, include_completed=True)
-        original_task = next((t for t in tasks if t.id == task_id), None)
+        original_task = await self.get_task(task_id, clean_list)
 
         if original_task:
             await self._run_cli_command(["delete", clean_list, task_id])
+            self._forget_task(clean_list, task_id)
             command = ["add", clean_list, original_task.title, "--format", "json"]
             if original_task.due_date:
                 due_date_argument = self._due_date_to_cli_value(original_task.due_date)
@@ -344,7 +509,9 @@ class RemindersCliTaskManager(TaskManager):
             command.extend(["--priority", priority_argument])
 
             new_task_json = await self._run_cli_command(command)
-            return self._parse_reminder_json(new_task_json)
+            new_task = self._parse_reminder_json(new_task_json)
+            self._remember_task(clean_list, new_task)
+            return new_task
         return None
 
     async def edit_task_flag(
@@ -366,10 +533,11 @@ class RemindersCliTaskManager(TaskManager):
         priority: Optional[int] = None,
         flagged: Optional[bool] = None,
         include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
     ) -> List[Task]:
         # Fetch all relevant tasks and then filter in Python
         clean_list = self._normalize_list_name(list_name)
-        tasks = await self.get_tasks(clean_list, include_completed=True)
+        tasks = await self.get_tasks(clean_list, include_completed=include_completed)
         filtered_tasks = []
         for task in tasks:
             match = True
@@ -387,6 +555,8 @@ class RemindersCliTaskManager(TaskManager):
                 flagged is not None and task.flagged != flagged
             ):  # This will always be False as flagged is hardcoded
                 match = False
+            if due_by is not None and (task.due_date is None or task.due_date > due_by):
+                match = False
             if match:
                 filtered_tasks.append(task)
         return filtered_tasks
@@ -416,10 +586,7 @@ class RemindersCliTaskManager(TaskManager):
                 f"Source and target lists are identical ('{cleaned_source}'); nothing to move."
             )
 
-        tasks_on_source = await self.get_tasks(cleaned_source, include_completed=True)
-        original_task = next(
-            (task for task in tasks_on_source if task.id == task_id), None
-        )
+        original_task = await self.get_task(task_id, cleaned_source)
         if original_task is None:
             raise ValueError(
                 f"Task '{task_id}' not found on list '{cleaned_source}'. Cannot move task."
@@ -451,7 +618,7 @@ class RemindersCliTaskManager(TaskManager):
                 f"while moving from '{cleaned_source}'."
             ) from error
 
-        recreated_task.list_name = cleaned_target
+        set_task_field(recreated_task, "list_name", cleaned_target)
 
         try:
             await self._run_cli_command(["delete", cleaned_source, task_id])
@@ -461,6 +628,7 @@ class RemindersCliTaskManager(TaskManager):
                 await self._run_cli_command(
                     ["delete", cleaned_target, recreated_task.id]
                 )
+                self._forget_task(cleaned_target, recreated_task.id)
             except Exception as attempted_cleanup_error:
                 cleanup_error = attempted_cleanup_error
 
@@ -475,37 +643,96 @@ class RemindersCliTaskManager(TaskManager):
                 f"after recreating it on '{cleaned_target}'."
             ) from error
 
+        self._forget_task(cleaned_source, task_id)
         return recreated_task
 
+    def _due_date_to_date(self, due_date: Any) -> Optional[datetime.date]:
+        cli_value = self._due_date_to_cli_value(due_date)
+        if cli_value is None:
+            return None
+        parsed = self._parse_cli_date(cli_value)
+        if parsed is None:
+            raise ValueError(f"Unsupported due date '{due_date}'.")
+        return parsed
+
     async def edit_task_full(
         self, task_id: str, updates: Dict[str, Any], list_name: str = "develop"
     ) -> Optional[Task]:
-        # This is a workaround as reminders-cli edit doesn't support all fields
-        # We will call the specific edit methods for each field
-        task = None
-        if "title" in updates:
-            # Not supported by reminders-cli
-            pass
-        if "due_date" in updates:
-            task = await self.edit_task_date(task_id, updates["due_date"], list_name)
-        if "description" in updates:
-            task = await self.edit_task_description(
-                task_id, updates["description"], list_name
+        # Merge every field first so a save costs at most one recreate (for due
+        # date or priority changes) or one in-place `edit` (title and notes).
+        clean_list = self._normalize_list_name(list_name)
+        unsupported_fields = [
+            field for field in self._UNSUPPORTED_EDIT_FIELDS if field in updates
+        ]
+        if unsupported_fields:
+            print(
+                "Warning: Editing "
+                f"{', '.join(unsupported_fields)} is not supported by reminders-cli."
             )
-        if "priority" in updates:
-            task = await self.edit_task_priority(
-                task_id, updates["priority"], list_name
+
+        original_task = await self.get_task(task_id, clean_list)
+        if original_task is None:
+            return None
+
+        title = updates.get("title", original_task.title)
+        description = updates.get("description", original_task.description)
+        try:
+            due_date = (
+                self._due_date_to_date(updates["due_date"])
+                if "due_date" in updates
+                else original_task.due_date
             )
-        if "tags" in updates:
-            task = await self.edit_task_tags(task_id, updates["tags"], list_name)
-        if "is_flagged" in updates:
-            task = await self.edit_task_flag(task_id, updates["is_flagged"], list_name)
-        if "recurring" in updates:
-            task = await self.set_task_recurring(
-                task_id, updates["recurring"], list_name
+        except ValueError as error:
+            raise ValueError(
+                f"Invalid due date '{updates['due_date']}' for task '{task_id}' on '{clean_list}'."
+            ) from error
+        priority = updates.get("priority", original_task.priority)
+        try:
+            priority_changed = (self._priority_to_cli_value(priority) or "none") != (
+                self._priority_to_cli_value(original_task.priority) or "none"
             )
+        except ValueError as error:
+            raise ValueError(
+                f"Invalid priority '{priority}' while updating task '{task_id}' on '{clean_list}'."
+            ) from error
 
-        return task
+        if due_date != original_task.due_date or priority_changed:
+            if original_task.completed:
+                raise RuntimeError(
+                    f"Completed task '{task_id}' cannot be edited on '{clean_list}'. "
+                    "Mark it as incomplete first."
+                )
+            recreation_kwargs: Dict[str, Any] = {}
+            if due_date is not None:
+                recreation_kwargs["due_date"] = self._due_date_to_cli_value(due_date)
+            if description:
+                recreation_kwargs["description"] = description
+            if priority is not None:
+                recreation_kwargs["priority"] = priority
+            return await self._recreate_task(
+                original_task,
+                clean_list,
+                title,
+                recreation_kwargs,
+                purpose="applying the edit",
+            )
+
+        title_changed = title != original_task.title
+        description_changed = (description or "") != (original_task.description or "")
+        if not title_changed and not description_changed:
+            return original_task
+
+        command = ["edit", clean_list, task_id]
+        if title_changed:
+            command.append(title)
+        if description_changed:
+            command.extend(["--notes", description or ""])
+        await self._run_cli_command(command)
+        updated_task = dataclasses.replace(
+            original_task, title=title, description=description
+        )
+        self._remember_task(clean_list, updated_task)
+        return updated_task
 
     async def set_task_recurring(
         self, task_id: str, recurring: str, list_name: str = "develop"
@@ -0,0 +1,142 @@
+import asyncio
+import itertools
+import json
+import logging
+from typing import Dict, List, Optional, Sequence
+
+
+class RemindersCliWorker:
+    """Long-lived reminders-cli process speaking line-delimited JSON.
+
+    Each request is written to the worker's stdin as
+    ``{"id": <int>, "args": [...]}`` and answered on stdout with
+    ``{"id": <int>, "ok": true, "output": "<stdout of the command>"}`` or
+    ``{"id": <int>, "ok": false, "error": "<message>"}``. Requests are pipelined:
+    callers don't wait for earlier responses before sending, and responses are
+    matched back to callers by ID. If the process dies, requests in flight fail
+    and the next request starts a fresh process. A request that gets no answer
+    within ``timeout`` seconds fails, too.
+    """
+
+    def __init__(self, command: Sequence[str], timeout: float = 30.0):
+        if not command:
+            raise ValueError("Worker command must not be empty")
+        self.command = list(command)
+        self.timeout = timeout
+        self.restarts = 0
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._request_ids = itertools.count(1)
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._process is not None and self._process.returncode is None:
+                return self._process
+            if self._process is not None:
+                self.restarts += 1
+                logging.warning(
+                    f"reminders-cli worker exited with code {self._process.returncode}; restarting"
+                )
+            process = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            # Each process gets its own pending map so a dying process can only
+            # fail the requests that were actually sent to it.
+            self._process = process
+            self._pending = {}
+            self._reader_task = asyncio.create_task(
+                self._read_responses(process, self._pending)
+            )
+            return process
+
+    async def _read_responses(
+        self, process: asyncio.subprocess.Process, pending: Dict[int, asyncio.Future]
+    ) -> None:
+        assert process.stdout is not None
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    response = json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Ignoring malformed worker response: {line!r}")
+                    continue
+                future = pending.pop(response.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if response.get("ok"):
+                    future.set_result(response.get("output") or "")
+                else:
+                    future.set_exception(
+                        Exception(
+                            f"CLI command failed with error: {response.get('error', '').strip()}"
+                        )
+                    )
+        finally:
+            return_code = await process.wait()
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError(
+                            f"reminders-cli worker exited with code {return_code} "
+                            "before answering the request"
+                        )
+                    )
+            pending.clear()
+
+    async def request(self, args: List[str]) -> str:
+        """Run one reminders-cli command in the worker and return its stdout."""
+        process = await self._ensure_started()
+        assert process.stdin is not None
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending
+        pending[request_id] = future
+        if process.returncode is not None:
+            # The reader fails pending requests once the process has exited,
+            # and may have done so before this one was added.
+            pending.pop(request_id, None)
+            raise RuntimeError(
+                f"reminders-cli worker exited before accepting command {args[:1]}"
+            )
+        payload = json.dumps({"id": request_id, "args": args}) + "\n"
+        try:
+            process.stdin.write(payload.encode())
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as error:
+            pending.pop(request_id, None)
+            raise RuntimeError(
+                f"reminders-cli worker exited before accepting command {args[:1]}"
+            ) from error
+        try:
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError as error:
+            pending.pop(request_id, None)
+            raise RuntimeError(
+                f"reminders-cli worker didn't answer command {args[:1]} "
+                f"within {self.timeout} s"
+            ) from error
+
+    async def close(self) -> None:
+        """Stop the worker process; the next request would start a new one."""
+        process, self._process = self._process, None
+        if process is None or process.returncode is not None:
+            return
+        assert process.stdin is not None
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        if self._reader_task is not None:
+            await self._reader_task
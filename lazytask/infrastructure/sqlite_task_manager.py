@@ -0,0 +1,337 @@
+import datetime
+import json
+import logging
+import sqlite3
+import uuid
+from typing import Any, Dict, List, Optional
+
+from lazytask.domain.task import Task, set_task_field
+from lazytask.domain.task_manager import TaskManager
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lists (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    list_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    due_date TEXT,
+    creation_date TEXT,
+    description TEXT,
+    tags TEXT NOT NULL DEFAULT '[]',
+    priority INTEGER,
+    is_flagged INTEGER NOT NULL DEFAULT 0,
+    recurring TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_list_completed ON tasks (list_name, completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_is_flagged ON tasks (is_flagged);
+"""
+
+_COLUMNS = (
+    "id",
+    "list_name",
+    "title",
+    "completed",
+    "due_date",
+    "creation_date",
+    "description",
+    "tags",
+    "priority",
+    "is_flagged",
+    "recurring",
+)
+
+_UPSERT_ASSIGNMENTS = ", ".join(
+    f"{column} = excluded.{column}" for column in _COLUMNS if column != "id"
+)
+
+# ORDER BY clauses matching MockTaskManager.sort_tasks: undated and
+# unprioritised tasks sort last.
+_SORT_CLAUSES = {
+    "due_date": "due_date IS NULL, due_date",
+    "title": "title COLLATE NOCASE",
+    "priority": "priority IS NULL, priority",
+    "completed": "completed",
+}
+
+
+class SqliteTaskManager(TaskManager):
+    def __init__(self, database_path: str = "lazytask.db"):
+        self.database_path = database_path
+        self._connection = sqlite3.connect(database_path)
+        self._connection.row_factory = sqlite3.Row
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            self._connection.execute(
+                "INSERT OR IGNORE INTO lists (name) VALUES (?)", ("develop",)
+            )
+
+    def _normalize_list_name(self, list_name: str) -> str:
+        cleaned = (list_name or "").strip()
+        if not cleaned:
+            raise ValueError("List name must not be empty")
+        return cleaned
+
+    @staticmethod
+    def _parse_due_date(value: Any) -> Optional[datetime.date]:
+        if isinstance(value, str):
+            return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        return value
+
+    def _row_to_task(self, row: sqlite3.Row) -> Task:
+        return Task(
+            id=row["id"],
+            title=row["title"],
+            completed=bool(row["completed"]),
+            due_date=self._parse_due_date(row["due_date"]),
+            creation_date=(
+                datetime.datetime.fromisoformat(row["creation_date"])
+                if row["creation_date"]
+                else None
+            ),
+            list_name=row["list_name"],
+            description=row["description"],
+            tags=json.loads(row["tags"]),
+            priority=row["priority"],
+            is_flagged=bool(row["is_flagged"]),
+            recurring=row["recurring"],
+        )
+
+    def _task_to_row(self, task: Task) -> Dict[str, Any]:
+        return {
+            "id": task.id,
+            "list_name": task.list_name,
+            "title": task.title,
+            "completed": int(task.completed),
+            "due_date": task.due_date.isoformat() if task.due_date else None,
+            "creation_date": (
+                task.creation_date.isoformat() if task.creation_date else None
+            ),
+            "description": task.description,
+            "tags": json.dumps(list(task.tags)),
+            "priority": task.priority,
+            "is_flagged": int(task.is_flagged),
+            "recurring": task.recurring,
+        }
+
+    def _save_task(self, task: Task, move_to_end: bool = False) -> None:
+        """Insert or update ``task``, keeping its place in its list unless
+        ``move_to_end``."""
+        row = self._task_to_row(task)
+        placeholders = ", ".join(f":{column}" for column in _COLUMNS)
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO lists (name) VALUES (?)", (task.list_name,)
+            )
+            if move_to_end:
+                # Tasks are listed by rowid, and reinserting assigns a new one.
+                self._connection.execute("DELETE FROM tasks WHERE id = ?", (task.id,))
+            # An upsert rather than INSERT OR REPLACE, which deletes the row and
+            # gives the task a new rowid, i.e. moves it to the end of its list.
+            self._connection.execute(
+                f"INSERT INTO tasks ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders}) "
+                f"ON CONFLICT(id) DO UPDATE SET {_UPSERT_ASSIGNMENTS}",
+                row,
+            )
+
+    def _query_tasks(
+        self,
+        where: List[str],
+        parameters: List[Any],
+        order_by: Optional[str] = None,
+    ) -> List[Task]:
+        sql = "SELECT * FROM tasks"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        # Tasks come back in the order they were added, like the other
+        # backends, and in that order among equal sort keys.
+        sql += f" ORDER BY {order_by}, rowid" if order_by else " ORDER BY rowid"
+        rows = self._connection.execute(sql, parameters).fetchall()
+        return [self._row_to_task(row) for row in rows]
+
+    async def _update_task(
+        self, task_id: str, list_name: str, updates: Dict[str, Any]
+    ) -> Optional[Task]:
+        task = await self.get_task(task_id, list_name)
+        if task is None:
+            return None
+        for key, value in updates.items():
+            if hasattr(task, key):
+                if key == "due_date":
+                    value = self._parse_due_date(value)
+                set_task_field(task, key, value)
+        self._save_task(task)
+        return task
+
+    async def clear_tasks(self):
+        with self._connection:
+            self._connection.execute("DELETE FROM tasks")
+            self._connection.execute("DELETE FROM lists WHERE name != 'develop'")
+
+    async def add_task(
+        self, title: str | Task, list_name: str = "develop", **kwargs: Any
+    ) -> Task:
+        if isinstance(title, Task):
+            task = title
+            set_task_field(
+                task,
+                "list_name",
+                self._normalize_list_name(task.list_name or list_name),
+            )
+            if not task.id:
+                task.id = str(uuid.uuid4())
+            if not task.creation_date:
+                task.creation_date = datetime.datetime.now()
+            self._save_task(task)
+            return task
+
+        task = Task(
+            id=kwargs.pop("id", None) or str(uuid.uuid4()),
+            title=title,
+            creation_date=datetime.datetime.now(),
+            list_name=self._normalize_list_name(list_name),
+        )
+        for key, value in kwargs.items():
+            if hasattr(task, key):
+                if key == "due_date":
+                    value = self._parse_due_date(value)
+                set_task_field(task, key, value)
+        self._save_task(task)
+        return task
+
+    async def complete_task(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"completed": True})
+
+    async def get_tasks(
+        self, list_name: str = "develop", include_completed: bool = False
+    ) -> List[Task]:
+        where = ["list_name = ?"]
+        parameters: List[Any] = [self._normalize_list_name(list_name)]
+        if not include_completed:
+            where.append("completed = 0")
+        return self._query_tasks(where, parameters)
+
+    async def get_task(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        tasks = self._query_tasks(
+            ["id = ?", "list_name = ?"],
+            [task_id, self._normalize_list_name(list_name)],
+        )
+        return tasks[0] if tasks else None
+
+    async def get_lists(self) -> List[str]:
+        rows = self._connection.execute("SELECT name FROM lists ORDER BY rowid")
+        return [row["name"] for row in rows]
+
+    async def edit_task_date(
+        self, task_id: str, new_date: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"due_date": new_date})
+
+    async def move_task_to_tomorrow(
+        self, task_id: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        return await self._update_task(task_id, list_name, {"due_date": tomorrow})
+
+    async def edit_task_description(
+        self, task_id: str, description: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"description": description})
+
+    async def edit_task_tags(
+        self, task_id: str, tags: List[str], list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"tags": tags})
+
+    async def edit_task_priority(
+        self, task_id: str, priority: int, list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"priority": priority})
+
+    async def edit_task_flag(
+        self, task_id: str, flagged: bool, list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"is_flagged": flagged})
+
+    async def refresh_tasks(self, list_name: str = "develop") -> List[Task]:
+        return await self.get_tasks(list_name)
+
+    async def filter_tasks(
+        self,
+        list_name: str = "develop",
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        priority: Optional[int] = None,
+        flagged: Optional[bool] = None,
+        include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
+    ) -> List[Task]:
+        where = ["list_name = ?"]
+        parameters: List[Any] = [self._normalize_list_name(list_name)]
+        if not include_completed:
+            where.append("completed = 0")
+        if query:
+            where.append(
+                "(instr(lower(title), ?) > 0 "
+                "OR instr(lower(coalesce(description, '')), ?) > 0)"
+            )
+            parameters.extend([query.lower(), query.lower()])
+        if tags:
+            placeholders = ", ".join("?" for _ in tags)
+            where.append(
+                "EXISTS (SELECT 1 FROM json_each(tasks.tags) "
+                f"WHERE json_each.value IN ({placeholders}))"
+            )
+            parameters.extend(tags)
+        if priority is not None:
+            where.append("priority = ?")
+            parameters.append(priority)
+        if flagged is not None:
+            where.append("is_flagged = ?")
+            parameters.append(int(flagged))
+        if due_by is not None:
+            where.append("due_date <= ?")
+            parameters.append(due_by.isoformat())
+        return self._query_tasks(where, parameters)
+
+    async def sort_tasks(
+        self, list_name: str = "develop", sort_by: str = "due_date"
+    ) -> List[Task]:
+        return self._query_tasks(
+            ["list_name = ?"],
+            [self._normalize_list_name(list_name)],
+            order_by=_SORT_CLAUSES.get(sort_by),
+        )
+
+    async def edit_task_full(
+        self, task_id: str, updates: Dict[str, Any], list_name: str = "develop"
+    ) -> Optional[Task]:
+        logging.debug(f"Editing task {task_id} with updates: {updates}")
+        return await self._update_task(task_id, list_name, updates)
+
+    async def set_task_recurring(
+        self, task_id: str, recurring: str, list_name: str = "develop"
+    ) -> Optional[Task]:
+        return await self._update_task(task_id, list_name, {"recurring": recurring})
+
+    async def move_task(
+        self, task_id: str, from_list: str, to_list: str
+    ) -> Optional[Task]:
+        task = await self.get_task(task_id, from_list)
+        if task is None:
+            return None
+        set_task_field(task, "list_name", self._normalize_list_name(to_list))
+        # Like the other backends, a moved task goes to the end of its new list.
+        self._save_task(task, move_to_end=True)
+        return task
@@ -0,0 +1,228 @@
+import bisect
+import datetime
+import itertools
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+from lazytask.domain.task import Task
+from lazytask.domain.task_search import TaskSearchIndex
+
+
+class _IndexKeys(NamedTuple):
+    title: str
+    description: Optional[str]
+    due_date: Optional[datetime.date]
+    tags: FrozenSet[str]
+    is_flagged: bool
+    completed: bool
+
+
+def _index_keys(task: Task) -> _IndexKeys:
+    return _IndexKeys(
+        task.title,
+        task.description,
+        task.due_date,
+        frozenset(task.tags),
+        task.is_flagged,
+        task.completed,
+    )
+
+
+class IndexedTasks(Dict[str, Task]):
+    """One list's tasks keyed by ID, with secondary indexes kept in step.
+
+    Maintains a sorted (due date, ID) index for range queries, a tag -> IDs
+    inverted index, the set of flagged IDs, an active/completed partition and,
+    from the first text query on, a ``TaskSearchIndex`` over titles and
+    descriptions. Adding, replacing and removing entries updates the indexes;
+    a task mutated in place has to be passed to ``reindex``. Each entry
+    remembers the keys it was indexed under, so stale entries are removed
+    correctly after such a mutation.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        super().__init__()
+        self._keys: Dict[str, _IndexKeys] = {}
+        # Insertion order of every ID, used to return index hits in list order.
+        self._order: Dict[str, int] = {}
+        self._counter = itertools.count()
+        self._due: List[tuple[datetime.date, str]] = []
+        self._tag_ids: Dict[str, Set[str]] = {}
+        self._flagged_ids: Set[str] = set()
+        # Ordered like the list, except that a reopened task is appended
+        # until ``active_tasks`` puts it back in its place.
+        self._active_ids: Dict[str, None] = {}
+        self._active_out_of_order = False
+        self._completed_ids: Set[str] = set()
+        self._search: Optional[TaskSearchIndex] = None
+        for task in tasks:
+            self[task.id] = task
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        super().__setitem__(task_id, task)
+        if task_id not in self._order:
+            self._order[task_id] = next(self._counter)
+        self._reindex(task_id, _index_keys(task))
+
+    def __delitem__(self, task_id: str) -> None:
+        super().__delitem__(task_id)
+        self._unindex(task_id)
+
+    def pop(self, task_id: str, *default):  # type: ignore[override]
+        if task_id in self:
+            self._unindex(task_id)
+        return super().pop(task_id, *default)
+
+    def popitem(self) -> tuple[str, Task]:
+        task_id, task = super().popitem()
+        self._unindex(task_id)
+        return task_id, task
+
+    def setdefault(self, task_id: str, task: Task) -> Task:  # type: ignore[override]
+        if task_id not in self:
+            self[task_id] = task
+        return self[task_id]
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        for task_id, task in dict(*args, **kwargs).items():
+            self[task_id] = task
+
+    def clear(self) -> None:
+        super().clear()
+        self._keys.clear()
+        self._order.clear()
+        self._due.clear()
+        self._tag_ids.clear()
+        self._flagged_ids.clear()
+        self._active_ids.clear()
+        self._active_out_of_order = False
+        self._completed_ids.clear()
+        self._search = None
+
+    def reindex(self, task: Task) -> None:
+        """Refresh the indexes for a task whose fields were changed in place."""
+        if task.id in self:
+            self._reindex(task.id, _index_keys(task))
+
+    def active_tasks(self) -> List[Task]:
+        if self._active_out_of_order:
+            self._active_ids = dict.fromkeys(
+                sorted(self._active_ids, key=self._order.__getitem__)
+            )
+            self._active_out_of_order = False
+        return [self[task_id] for task_id in self._active_ids]
+
+    def candidate_ids(
+        self,
+        tags: Optional[List[str]] = None,
+        flagged: Optional[bool] = None,
+        include_completed: bool = False,
+        due_by: Optional[datetime.date] = None,
+        query: Optional[str] = None,
+    ) -> Set[str]:
+        """IDs that pass every indexed criterion given.
+
+        ``query`` matches a case-insensitive substring of the title or
+        description.
+        """
+        candidates: Optional[Set[str]] = None
+
+        def narrow(ids: Iterable[str]) -> None:
+            nonlocal candidates
+            candidates = set(ids) if candidates is None else candidates & set(ids)
+
+        if query:
+            if self._search is None:
+                self._search = TaskSearchIndex(self.values())
+            narrow(self._search.search(query))
+        if flagged:
+            narrow(self._flagged_ids)
+        if tags:
+            narrow(set().union(*(self._tag_ids.get(tag, ()) for tag in tags)))
+        if due_by is not None:
+            narrow(self._ids_due_through(due_by))
+        if candidates is None:
+            candidates = set(self._active_ids) if not include_completed else set(self)
+        elif not include_completed:
+            candidates -= self._completed_ids
+        if flagged is False:
+            candidates -= self._flagged_ids
+        return candidates
+
+    def in_list_order(self, task_ids: Iterable[str]) -> List[Task]:
+        task_ids = set(task_ids)
+        if len(task_ids) == len(self):
+            return list(self.values())
+        return [
+            self[task_id] for task_id in sorted(task_ids, key=self._order.__getitem__)
+        ]
+
+    def _ids_due_through(self, last_day: datetime.date) -> List[str]:
+        if last_day == datetime.date.max:
+            end = len(self._due)
+        else:
+            # (next day, "") sorts before every entry due on the next day.
+            end = bisect.bisect_left(
+                self._due, (last_day + datetime.timedelta(days=1), "")
+            )
+        return [task_id for _, task_id in self._due[:end]]
+
+    def _reindex(self, task_id: str, keys: _IndexKeys) -> None:
+        old = self._keys.get(task_id)
+        if old == keys:
+            return
+        if self._search is not None and (
+            old is None
+            or (old.title, old.description) != (keys.title, keys.description)
+        ):
+            self._search.add(self[task_id])
+        if old is None or old.due_date != keys.due_date:
+            if old is not None and old.due_date is not None:
+                self._remove_due(old.due_date, task_id)
+            if keys.due_date is not None:
+                bisect.insort(self._due, (keys.due_date, task_id))
+        old_tags = old.tags if old is not None else frozenset()
+        for tag in old_tags - keys.tags:
+            self._discard_tag(tag, task_id)
+        for tag in keys.tags - old_tags:
+            self._tag_ids.setdefault(tag, set()).add(task_id)
+        if keys.is_flagged:
+            self._flagged_ids.add(task_id)
+        else:
+            self._flagged_ids.discard(task_id)
+        if old is None or old.completed != keys.completed:
+            if keys.completed:
+                self._active_ids.pop(task_id, None)
+                self._completed_ids.add(task_id)
+            else:
+                self._completed_ids.discard(task_id)
+                self._active_ids[task_id] = None
+                if old is not None:
+                    self._active_out_of_order = True
+        self._keys[task_id] = keys
+
+    def _unindex(self, task_id: str) -> None:
+        old = self._keys.pop(task_id, None)
+        self._order.pop(task_id, None)
+        if old is None:
+            return
+        if old.due_date is not None:
+            self._remove_due(old.due_date, task_id)
+        for tag in old.tags:
+            self._discard_tag(tag, task_id)
+        self._flagged_ids.discard(task_id)
+        self._active_ids.pop(task_id, None)
+        self._completed_ids.discard(task_id)
+        if self._search is not None:
+            self._search.discard(task_id)
+
+    def _remove_due(self, due_date: datetime.date, task_id: str) -> None:
+        position = bisect.bisect_left(self._due, (due_date, task_id))
+        if position < len(self._due) and self._due[position] == (due_date, task_id):
+            del self._due[position]
+
+    def _discard_tag(self, tag: str, task_id: str) -> None:
+        tag_ids = self._tag_ids.get(tag)
+        if tag_ids is not None:
+            tag_ids.discard(task_id)
+            if not tag_ids:
+                del self._tag_ids[tag]
@@ -1,36 +1,51 @@
 import asyncio
+import dataclasses
 import datetime
 import logging
 import os
 import sys
 from contextlib import asynccontextmanager
-from typing import cast
+from typing import Any, Awaitable, Callable, cast
 
 from textual.app import App, ComposeResult
 from textual import events
-from textual.widgets import Header, Footer, ListView, ListItem, Label, LoadingIndicator
+from textual.timer import Timer
+from textual.widgets import (
+    Header,
+    Footer,
+    Input,
+    ListView,
+    ListItem,
+    Label,
+    LoadingIndicator,
+)
 from textual.containers import Container, Horizontal
 from rich.text import Text
 
+from lazytask.domain.fuzzy_match import RankingCancelled
 from lazytask.domain.task import Task
 from lazytask.application.use_cases import (
     AddTask,
     GetTasks,
+    GetTasksForLists,
     CompleteTask,
     UpdateTask,
     GetLists,
     MoveTask,
 )
-from lazytask.presentation.edit_screen import EditScreen
-from lazytask.presentation.help_screen import HelpScreen
+from lazytask.presentation.filter_bar import FilterBar
 from lazytask.presentation.list_tabs import ListTabs
 from lazytask.presentation.task_detail import TaskDetail
-from lazytask.presentation.text_input_modal import TextInputModal
+from lazytask.presentation.task_row import render_task_row, task_row_signature
+from lazytask.presentation.task_view_model import TaskViewModel
+from lazytask.presentation.virtual_task_list import VirtualTaskList, VirtualTaskRow
+from lazytask.presentation.view_snapshot import (
+    ViewSnapshot,
+    load_view_snapshot,
+    save_view_snapshot,
+)
 from lazytask.presentation.theme import build_theme_css
 from lazytask.presentation.palette import get_palette
-from .date_picker_screen import DatePickerScreen
-from .select_list_screen import SelectListScreen
-from .sort_options_screen import SortOptionsScreen
 from lazytask.application.errors import DescriptionEditorError
 from lazytask.container import container
 
@@ -42,78 +57,64 @@ class TaskListItem(ListItem):
     def __init__(self, task: Task):
         super().__init__()
         self.data = task
+        self.signature = task_row_signature(task)
         self.add_class("task-list-item")
-        if task.completed:
-            self.add_class("completed")
-        if task.is_flagged:
-            self.add_class("flagged")
+        self._apply_task_classes()
         # eliminate extra spacing between items
         self.styles.margin = 0
 
-    def compose(self) -> ComposeResult:
-        status_token = "[x]" if self.data.completed else "[ ]"
-        self.meta_parts: list[str] = []
-        if self.data.tags:
-            self.meta_parts.append(f"tags: {','.join(self.data.tags)}")
-        if self.data.priority:
-            self.meta_parts.append(f"prio: {self.data.priority}")
-        if self.data.is_flagged:
-            self.meta_parts.append("flagged")
-        if self.data.recurring:
-            self.meta_parts.append(f"recurring: {self.data.recurring}")
-
-        status_color = (
-            PALETTE.success if self.data.completed else PALETTE.accent_primary
-        )
-        title_color = (
-            PALETTE.text_muted if self.data.completed else PALETTE.text_primary
-        )
-        meta_color = PALETTE.text_secondary
-        due_color = PALETTE.accent_primary
+    def _apply_task_classes(self) -> None:
+        self.set_class(self.data.completed, "completed")
+        self.set_class(self.data.is_flagged, "flagged")
 
-        due_text = Text()
-        if self.data.due_date:
-            today = datetime.date.today()
-            if self.data.completed:
-                due_color = PALETTE.success
-            elif self.data.due_date < today:
-                due_color = PALETTE.danger
-            elif self.data.due_date == today:
-                due_color = PALETTE.warning
-            else:
-                due_color = PALETTE.accent_primary
-            effective_due_color = due_color
-            due_text.append(
-                f"due: {self.data.due_date.strftime('%Y-%m-%d')}", style=due_color
+    def update_task(self, task: Task) -> None:
+        """Point this row at a newer copy of its task, re-rendering if needed."""
+        self.data = task
+        signature = task_row_signature(task)
+        if signature == self.signature:
+            return
+        self.signature = signature
+        self._apply_task_classes()
+        if not self.is_mounted:
+            return
+        display_text, title_color, due_text, due_color = self._render_task()
+        title_label = self.query_one("#task-title", Label)
+        title_label.update(display_text)
+        title_label.styles.color = title_color
+        due_label = self.query_one("#task-due-date", Label)
+        due_label.update(due_text)
+        due_label.styles.color = due_color
+
+    def _render_task(self) -> tuple[Text, str, Text, str]:
+        rendered = render_task_row(self.data)
+        self.meta_parts = rendered.meta_parts
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "TaskListItem render: title=%s title_color=%s due_color=%s classes=%s tags=%s",
+                self.data.title,
+                rendered.title_color,
+                rendered.due_color,
+                sorted(self.classes),
+                self.data.tags,
             )
-        else:
-            due_text.append("due: -", style=meta_color)
-            effective_due_color = meta_color
+        return (
+            rendered.display_text,
+            rendered.title_color,
+            rendered.due_text,
+            rendered.due_color,
+        )
 
-        display_text = Text()
-        display_text.append(status_token, style=status_color)
-        display_text.append(f" {self.data.title}", style=title_color)
-        if self.meta_parts:
-            display_text.append(f" ({', '.join(self.meta_parts)})", style=meta_color)
+    def compose(self) -> ComposeResult:
+        display_text, title_color, due_text, due_color = self._render_task()
 
         title_label = Label(display_text, id="task-title")
         title_label.styles.color = title_color
         title_label.styles.padding = 0
 
         due_label = Label(due_text, id="task-due-date")
-        due_label.styles.color = effective_due_color
+        due_label.styles.color = due_color
         due_label.styles.padding = 0
 
-        logger.debug(
-            "TaskListItem compose: title=%s status_color=%s title_color=%s due_color=%s classes=%s tags=%s",
-            self.data.title,
-            status_color,
-            title_color,
-            effective_due_color,
-            sorted(self.classes),
-            self.data.tags,
-        )
-
         yield Horizontal(
             title_label,
             due_label,
@@ -166,6 +167,7 @@ class LazyTaskApp(App):
         self.dark = True
         self.add_task_uc = container.get(AddTask)
         self.get_tasks_uc = container.get(GetTasks)
+        self.get_tasks_for_lists_uc = container.get(GetTasksForLists)
         self.complete_task_uc = container.get(CompleteTask)
         self.update_task_uc = container.get(UpdateTask)
         self.get_lists_uc = container.get(GetLists)
@@ -183,13 +185,60 @@ class LazyTaskApp(App):
             raise ValueError("LAZYTASK_LISTS must not be empty")
 
         self.available_lists = [name.strip() for name in lists_str.split(",")]
+
+        self.fetch_concurrency = self._positive_int_env("LAZYTASK_FETCH_CONCURRENCY", 4)
+        # Lists longer than this render through VirtualTaskList instead of one
+        # TaskListItem widget per task.
+        self.virtualize_threshold = self._positive_int_env(
+            "LAZYTASK_VIRTUALIZE_THRESHOLD", 1000
+        )
         self.current_list = "all"
+        self.task_view_model = TaskViewModel()
+        # Apply completes, due date changes and moves to the view immediately and
+        # commit them to the backend in the background.
+        self.optimistic_updates = os.environ.get(
+            "LAZYTASK_OPTIMISTIC_UPDATES", ""
+        ).strip().lower() in {"1", "true", "yes"}
+        self._pending_commits: set[asyncio.Task] = set()
+        # Bumped by every update_tasks_list call; see _is_latest_refresh.
+        self._refresh_generation = 0
+        self._refresh_task: asyncio.Task | None = None
+        # How many show_loading blocks are running.
+        self._loading = 0
+        # List name -> generation of the latest refresh that asked to refetch
+        # it, until a fetch started at or after that one finishes. A cancelled
+        # refresh would otherwise drop its refetch if the newer one had
+        # refetch=False.
+        self._refetch_requested: dict[str, int] = {}
+        # When set, the last rendered lists are saved here on exit and painted
+        # on the next start while the backend is revalidated in the background.
+        self.snapshot_path = os.environ.get("LAZYTASK_SNAPSHOT_PATH", "").strip()
+        self._revalidation: asyncio.Task | None = None
+        # Tracked from highlight events, since the widgets are gone by unmount.
+        self._highlighted_task_id: str | None = None
+        # Typing in the filter bar applies the filter once no key has been
+        # pressed for this long.
+        self.filter_debounce = 0.1
+        self._filter_timer: Timer | None = None
 
         self.title = f"LazyTask - {self.current_list}"
         self.show_overdue_only = True
         self.show_completed = False
         self.filter_query = ""
 
+    @staticmethod
+    def _positive_int_env(name: str, default: int) -> int:
+        value = os.environ.get(name, str(default)).strip()
+        try:
+            parsed = int(value)
+        except ValueError:
+            raise ValueError(
+                f"{name} must be a positive integer, got '{value}'"
+            ) from None
+        if parsed < 1:
+            raise ValueError(f"{name} must be a positive integer, got '{value}'")
+        return parsed
+
     @property
     def bindings(self):
         """Expose current bindings map for tests and footer updates."""
@@ -209,9 +258,19 @@ class LazyTaskApp(App):
 
     @asynccontextmanager
     async def show_loading(self):
+        """Show the loading indicator until every caller has finished.
+
+        Calls overlap when a refresh is superseded mid-fetch, so the indicator
+        is only hidden when the last one exits.
+        """
+        self._loading += 1
         self.query_one(LoadingIndicator).display = True
-        yield
-        self.query_one(LoadingIndicator).display = False
+        try:
+            yield
+        finally:
+            self._loading -= 1
+            if not self._loading:
+                self.query_one(LoadingIndicator).display = False
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -221,10 +280,16 @@ class LazyTaskApp(App):
         loading_indicator.display = False
         tasks_list = ListView(id="tasks_list")
         tasks_list.styles.margin = 0
+        virtual_tasks_list = VirtualTaskList(id="virtual_tasks_list")
+        virtual_tasks_list.display = False
+        filter_bar = FilterBar(id="filter_bar")
+        filter_bar.display = False
         yield Horizontal(
             Container(
+                filter_bar,
                 loading_indicator,
                 tasks_list,
+                virtual_tasks_list,
                 id="tasks_panel",
             ),
             TaskDetail(id="task_detail"),
@@ -250,10 +315,74 @@ class LazyTaskApp(App):
             )
         if not self.available_lists:
             self.available_lists = await self.get_lists_uc.execute()
+        if await self._restore_view_snapshot():
+            self._revalidation = asyncio.create_task(self.update_tasks_list())
+            return
         await self.update_tasks_list()
-        self.query_one(ListView).index = None
+        self._tasks_list().index = None
         self.query_one(TaskDetail).update_task(None)
 
+    async def on_unmount(self) -> None:
+        """Called when the app shuts down; persist any buffered task writes and
+        stop the backend's helper processes."""
+        # Building the container just to shut it down would only fail again.
+        if container.built:
+            container.task_manager.flush()
+            await container.task_manager.close()
+        if self.snapshot_path:
+            self._save_view_snapshot()
+
+    async def _restore_view_snapshot(self) -> bool:
+        """Render the lists saved on the last exit, if there is a usable snapshot."""
+        if not self.snapshot_path:
+            return False
+        snapshot = load_view_snapshot(self.snapshot_path)
+        if snapshot is None or (
+            snapshot.current_list != "all"
+            and snapshot.current_list not in self.available_lists
+        ):
+            return False
+        self.current_list = snapshot.current_list
+        self.sort_by = snapshot.sort_by
+        self.sort_reverse = snapshot.sort_reverse
+        self.filter_query = snapshot.filter_query
+        if self.filter_query:
+            # Show the restored filter, as the bar would while typing it, so it
+            # can be seen and edited or cleared with escape.
+            filter_bar = self.query_one(FilterBar)
+            with filter_bar.prevent(Input.Changed):
+                filter_bar.value = self.filter_query
+            filter_bar.display = True
+        self.show_overdue_only = snapshot.show_overdue_only
+        self.show_completed = snapshot.show_completed
+        for list_name, (tasks, include_completed) in snapshot.lists.items():
+            self.task_view_model.store(list_name, tasks, include_completed)
+        if self.task_view_model.tasks(self.current_list, self.show_completed) is None:
+            self.task_view_model.invalidate()
+            return False
+
+        await self.update_tasks_list(preserve_selection=False, refetch=False)
+        listed_task_ids = [task.id for task in self._listed_tasks()]
+        if snapshot.selected_task_id in listed_task_ids:
+            self._tasks_list().index = listed_task_ids.index(snapshot.selected_task_id)
+        return True
+
+    def _save_view_snapshot(self) -> None:
+        snapshot = ViewSnapshot(
+            current_list=self.current_list,
+            sort_by=self.sort_by,
+            sort_reverse=self.sort_reverse,
+            filter_query=self.filter_query,
+            show_overdue_only=self.show_overdue_only,
+            show_completed=self.show_completed,
+            selected_task_id=self._highlighted_task_id,
+            lists=self.task_view_model.lists(),
+        )
+        try:
+            save_view_snapshot(self.snapshot_path, snapshot)
+        except OSError as error:
+            logging.warning(f"Could not save view snapshot: {error}")
+
     async def switch_list(self, list_name: str):
         cleaned_list = list_name.strip()
         if not cleaned_list:
@@ -261,8 +390,7 @@ class LazyTaskApp(App):
             return
         self.current_list = cleaned_list
         self.filter_query = ""
-        list_view = self.query_one(ListView)
-        list_view.index = None
+        self._tasks_list().index = None
         await self.update_tasks_list(
             preserve_selection=False, select_first_if_available=True
         )
@@ -281,9 +409,7 @@ class LazyTaskApp(App):
         await self.switch_list(list_name)
 
     async def on_key(self, event: events.Key) -> None:
-        logging.debug(
-            f"on_key: key: {event.key}, index: {self.query_one(ListView).index}"
-        )
+        logging.debug(f"on_key: key: {event.key}, index: {self._tasks_list().index}")
         if (
             event.key
             in [
@@ -295,7 +421,7 @@ class LazyTaskApp(App):
                 "o",
                 "r",
             ]
-            and self.query_one(ListView).index is None
+            and self._tasks_list().index is None
         ):
             logging.debug("on_key: preventing default")
             event.prevent_default()
@@ -318,15 +444,44 @@ class LazyTaskApp(App):
                 if list_index < len(self.available_lists):
                     await self.switch_list(self.available_lists[list_index])
 
-    def _update_task_detail(self, item: ListItem | None) -> None:
-        if isinstance(item, TaskListItem):
+    def _update_task_detail(self, item: ListItem | VirtualTaskRow | None) -> None:
+        if isinstance(item, (TaskListItem, VirtualTaskRow)):
+            self._highlighted_task_id = item.data.id
             self.query_one(TaskDetail).update_task(item.data)
         else:
+            self._highlighted_task_id = None
             self.query_one(TaskDetail).update_task(None)
 
+    def _tasks_list(self) -> ListView | VirtualTaskList:
+        """The task list widget currently on screen."""
+        virtual_list = self.query_one(VirtualTaskList)
+        if virtual_list.display:
+            return virtual_list
+        return self.query_one(ListView)
+
+    def _listed_tasks(self) -> list[Task]:
+        tasks_list_view = self._tasks_list()
+        if isinstance(tasks_list_view, VirtualTaskList):
+            return list(tasks_list_view.tasks)
+        return [cast(TaskListItem, item).data for item in tasks_list_view.children]
+
+    def _highlighted_task(self) -> Task | None:
+        highlighted = self._tasks_list().highlighted_child
+        if isinstance(highlighted, (TaskListItem, VirtualTaskRow)):
+            return highlighted.data
+        return None
+
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         """Called when a task is highlighted."""
-        self._update_task_detail(event.item)
+        if event.list_view.display:
+            self._update_task_detail(event.item)
+
+    def on_virtual_task_list_highlighted(
+        self, event: VirtualTaskList.Highlighted
+    ) -> None:
+        """Called when a task is highlighted in the virtualized list."""
+        if event.task_list.display:
+            self._update_task_detail(event.item)
 
     async def on_list_view_selected(self, event: ListView.Selected) -> None:
         """Called when a task is selected."""
@@ -339,8 +494,61 @@ class LazyTaskApp(App):
         newly_added_task_id: str | None = None,
         completed_task_index: int | None = None,
         select_first_if_available: bool = False,
+        refetch: bool = True,
     ):
-        """Update the tasks list view."""
+        """Update the tasks list view.
+
+        With ``refetch=False`` the view is re-derived from the tasks last fetched
+        for the current list, and the backend is only asked if there are none.
+
+        Refreshes are single-flight: starting one cancels the refresh still in
+        flight, and only the latest may touch the list view. A superseded call
+        returns once it has been cancelled. A refetch it still owed is done by
+        the refresh that replaces it.
+        """
+        self._refresh_generation += 1
+        if refetch:
+            self._refetch_requested[self.current_list] = self._refresh_generation
+        previous = self._refresh_task
+        if previous is not None and not previous.done():
+            previous.cancel()
+        refresh = asyncio.create_task(
+            self._refresh_tasks_list(
+                self._refresh_generation,
+                filter_query,
+                preserve_selection,
+                newly_added_task_id,
+                completed_task_index,
+                select_first_if_available,
+            )
+        )
+        self._refresh_task = refresh
+        try:
+            await refresh
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise
+            logging.debug("update_tasks_list superseded by a newer refresh")
+
+    def _is_latest_refresh(self, generation: int) -> bool:
+        return generation == self._refresh_generation
+
+    def _finish_refetch(self, list_name: str, generation: int) -> None:
+        """Drop a list's pending refetch if the fetch of ``generation`` covered it."""
+        requested = self._refetch_requested.get(list_name)
+        if requested is not None and requested <= generation:
+            del self._refetch_requested[list_name]
+
+    async def _refresh_tasks_list(
+        self,
+        generation: int,
+        filter_query: str | None,
+        preserve_selection: bool,
+        newly_added_task_id: str | None,
+        completed_task_index: int | None,
+        select_first_if_available: bool,
+    ) -> None:
         logging.debug(
             f"update_tasks_list called with show_completed={self.show_completed}"
         )
@@ -349,119 +557,271 @@ class LazyTaskApp(App):
 
         self._register_list_bindings()
         self.query_one(ListTabs).update_lists(self.available_lists, self.current_list)
-        tasks_list_view = self.query_one(ListView)
         previous_task_id: str | None = None
         previous_index: int | None = None
         if preserve_selection:
-            highlighted = tasks_list_view.highlighted_child
-            if isinstance(highlighted, TaskListItem):
-                previous_task_id = highlighted.data.id
-            previous_index = tasks_list_view.index
+            highlighted_task = self._highlighted_task()
+            if highlighted_task is not None:
+                previous_task_id = highlighted_task.id
+            previous_index = self._tasks_list().index
+
+        tasks = (
+            None
+            if self.current_list in self._refetch_requested
+            else self.task_view_model.tasks(self.current_list, self.show_completed)
+        )
+        if tasks is None:
+            # The current list may change while the fetch is awaited.
+            fetched_list = self.current_list
+            include_completed = (
+                self.show_completed
+                or self.task_view_model.includes_completed(fetched_list)
+            )
+            async with self.show_loading():
+                try:
+                    if fetched_list == "all":
+                        fetched = await self._fetch_all_lists(
+                            include_completed, generation
+                        )
+                    else:
+                        fetched = await self.get_tasks_uc.execute(
+                            fetched_list, include_completed=include_completed
+                        )
+                except Exception as e:
+                    self._finish_refetch(fetched_list, generation)
+                    if self._is_latest_refresh(generation):
+                        self.notify(
+                            f"Error getting tasks: {e}",
+                            title="Error",
+                            severity="error",
+                        )
+                    return
+            self._finish_refetch(fetched_list, generation)
+            self.task_view_model.store(fetched_list, fetched, include_completed)
+            tasks = self.task_view_model.tasks(self.current_list, self.show_completed)
 
-        async with self.show_loading():
+        if not self._is_latest_refresh(generation):
+            return
+        if self.filter_query:
+            # Ranking a long list by the filter takes a while; do it off the
+            # event loop so keys are still handled meanwhile. Cancelling this
+            # coroutine doesn't stop the thread, so the ranking stops itself
+            # once a newer refresh starts.
             try:
-                if self.current_list == "all":
-                    all_tasks = []
-                    lists = self.available_lists
-                    for list_name in lists:
-                        tasks_in_list = await self.get_tasks_uc.execute(
-                            list_name, include_completed=self.show_completed
-                        )
-                        all_tasks.extend(tasks_in_list)
-                    tasks = all_tasks
-                else:
-                    tasks = await self.get_tasks_uc.execute(
-                        self.current_list, include_completed=self.show_completed
-                    )
-            except Exception as e:
-                self.notify(
-                    f"Error getting tasks: {e}", title="Error", severity="error"
+                visible = await asyncio.to_thread(
+                    self._visible_tasks,
+                    tasks or [],
+                    lambda: not self._is_latest_refresh(generation),
                 )
+            except RankingCancelled:
+                return
+            if not self._is_latest_refresh(generation):
                 return
-
-            # Clear the list after fetching data to minimize visible delay
-            await tasks_list_view.clear()
-
-        if self.show_overdue_only:
-            today = datetime.date.today()
-            tasks = [task for task in tasks if task.due_date and task.due_date <= today]
-
-        if self.filter_query:
-            tasks = [
-                task
-                for task in tasks
-                if self.filter_query.lower() in task.title.lower()
-            ]
-
-        if self.sort_by == "due_date":
-            tasks.sort(
-                key=lambda t: t.due_date or datetime.date.max, reverse=self.sort_reverse
-            )
-        elif self.sort_by == "creation_date":
-            tasks.sort(
-                key=lambda t: t.creation_date or datetime.datetime.max,
-                reverse=self.sort_reverse,
-            )
         else:
-            tasks.sort(key=lambda t: t.title.lower(), reverse=self.sort_reverse)
-
-        for task in tasks:
-            details = []
-            if task.due_date:
-                details.append(f"due: {task.due_date.strftime('%Y-%m-%d')}")
-            if task.tags:
-                details.append(f"tags: {','.join(task.tags)}")
-            if task.priority:
-                details.append(f"prio: {task.priority}")
-            if task.is_flagged:
-                details.append("flagged")
-
-            list_item = TaskListItem(task)
-            tasks_list_view.append(list_item)
+            visible = self._visible_tasks(tasks or [])
+        await self._show_tasks(visible)
         self.title = f"LazyTask - {self.current_list}"
 
+        tasks_list_view = self._tasks_list()
+        listed_task_ids = [task.id for task in self._listed_tasks()]
         if completed_task_index is not None:
-            num_tasks = len(tasks_list_view.children)
+            num_tasks = len(listed_task_ids)
             if num_tasks == 0:
                 tasks_list_view.index = None
             else:
                 new_index = min(completed_task_index, num_tasks - 1)
                 tasks_list_view.index = new_index
         elif newly_added_task_id:
-            for i, item in enumerate(tasks_list_view.children):
-                if cast(TaskListItem, item).data.id == newly_added_task_id:
-                    tasks_list_view.index = i
-                    break
+            if newly_added_task_id in listed_task_ids:
+                tasks_list_view.index = listed_task_ids.index(newly_added_task_id)
         elif preserve_selection:
             had_previous_selection = (
                 previous_task_id is not None or previous_index is not None
             )
             if previous_task_id:
-                for i, item in enumerate(tasks_list_view.children):
-                    if cast(TaskListItem, item).data.id == previous_task_id:
-                        tasks_list_view.index = i
-                        break
+                if previous_task_id in listed_task_ids:
+                    tasks_list_view.index = listed_task_ids.index(previous_task_id)
+                elif had_previous_selection and listed_task_ids:
+                    tasks_list_view.index = 0
                 else:
-                    if had_previous_selection and tasks_list_view.children:
-                        tasks_list_view.index = 0
-                    else:
-                        tasks_list_view.index = None
+                    tasks_list_view.index = None
             elif previous_index is not None and 0 <= previous_index < len(
-                tasks_list_view.children
+                listed_task_ids
             ):
                 tasks_list_view.index = previous_index
-            elif had_previous_selection and tasks_list_view.children:
+            elif had_previous_selection and listed_task_ids:
                 tasks_list_view.index = 0
             else:
                 tasks_list_view.index = None
         else:
-            if select_first_if_available and tasks_list_view.children:
+            if select_first_if_available and listed_task_ids:
                 tasks_list_view.index = 0
             else:
                 tasks_list_view.index = None
 
+    async def _fetch_all_lists(
+        self, include_completed: bool, generation: int
+    ) -> list[Task]:
+        """Fetch every configured list for the aggregate view, in list order."""
+        if self.get_tasks_for_lists_uc.supports_bulk_fetch:
+            tasks_by_list = await self.get_tasks_for_lists_uc.execute(
+                self.available_lists, include_completed=include_completed
+            )
+            return [task for tasks in tasks_by_list.values() for task in tasks]
+
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+
+        async def fetch_list(list_name: str) -> tuple[str, list[Task]]:
+            async with semaphore:
+                tasks_in_list = await self.get_tasks_uc.execute(
+                    list_name, include_completed=include_completed
+                )
+            return list_name, tasks_in_list
+
+        loaded: dict[str, list[Task]] = {}
+        pending = [
+            asyncio.ensure_future(fetch_list(list_name))
+            for list_name in self.available_lists
+        ]
+        try:
+            for next_loaded in asyncio.as_completed(pending):
+                list_name, tasks_in_list = await next_loaded
+                loaded[list_name] = tasks_in_list
+                if len(loaded) < len(pending) and self._is_latest_refresh(generation):
+                    # Show what has arrived so far while slower lists are pending.
+                    partial = self._ordered_tasks(loaded)
+                    if not self.show_completed:
+                        partial = [task for task in partial if not task.completed]
+                    await self._show_tasks(self._visible_tasks(partial))
+        finally:
+            for future in pending:
+                future.cancel()
+        return self._ordered_tasks(loaded)
+
+    async def _show_tasks(self, tasks: list[Task]) -> None:
+        """Render ``tasks``, switching to the virtualized list for large lists."""
+        list_view = self.query_one(ListView)
+        virtual_list = self.query_one(VirtualTaskList)
+        use_virtual = len(tasks) > self.virtualize_threshold
+        if use_virtual:
+            if list_view.display:
+                virtual_list.index = None
+            virtual_list.set_tasks(tasks)
+            await self._reconcile_task_items(list_view, [])
+        else:
+            virtual_list.set_tasks([])
+            await self._reconcile_task_items(list_view, tasks)
+        if virtual_list.display != use_virtual:
+            had_focus = list_view.has_focus or virtual_list.has_focus
+            virtual_list.display = use_virtual
+            list_view.display = not use_virtual
+            if had_focus:
+                self._tasks_list().focus()
+
+    async def _reconcile_task_items(
+        self, tasks_list_view: ListView, tasks: list[Task]
+    ) -> None:
+        """Make the list view show ``tasks`` in order, reusing rows by task ID.
+
+        Rows for tasks that are still visible are kept (and re-rendered only if
+        the task changed), moved if the order changed, and only the difference
+        is mounted or removed.
+        """
+        # Row positions are about to shift; drop the highlight like clear() did
+        # so callers can restore the selection afterwards.
+        tasks_list_view.index = None
+
+        existing: dict[str, TaskListItem] = {}
+        stale: list[TaskListItem] = []
+        for child in tasks_list_view.children:
+            item = cast(TaskListItem, child)
+            if item.data.id in existing:
+                stale.append(item)
+            else:
+                existing[item.data.id] = item
+
+        desired: list[TaskListItem] = []
+        reused: set[str] = set()
+        for task in tasks:
+            kept = existing.get(task.id)
+            if kept is None or task.id in reused:
+                desired.append(TaskListItem(task))
+                continue
+            reused.add(task.id)
+            kept.update_task(task)
+            desired.append(kept)
+        stale.extend(
+            item for task_id, item in existing.items() if task_id not in reused
+        )
+        if stale:
+            await tasks_list_view.remove_children(stale)
+
+        # Put the kept rows in their new relative order.
+        current = list(tasks_list_view.children)
+        kept_order = [item for item in desired if item.is_mounted]
+        for position, item in enumerate(kept_order):
+            if current[position] is not item:
+                tasks_list_view.move_child(item, before=position)
+                current.remove(item)
+                current.insert(position, item)
+
+        # Mount new rows in contiguous runs at their final positions.
+        position = 0
+        while position < len(desired):
+            if desired[position].is_mounted:
+                position += 1
+                continue
+            run_end = position
+            while run_end < len(desired) and not desired[run_end].is_mounted:
+                run_end += 1
+            new_items = desired[position:run_end]
+            if position < len(tasks_list_view.children):
+                await tasks_list_view.insert(position, new_items)
+            else:
+                await tasks_list_view.extend(new_items)
+            position = run_end
+
+    def _ordered_tasks(self, tasks_by_list: dict[str, list[Task]]) -> list[Task]:
+        return [
+            task
+            for list_name in self.available_lists
+            for task in tasks_by_list.get(list_name, [])
+        ]
+
+    def _visible_tasks(
+        self, tasks: list[Task], cancelled: Callable[[], bool] | None = None
+    ) -> list[Task]:
+        """Apply the overdue toggle, sort order and filter query to fetched tasks.
+
+        With a filter query, tasks are ranked by how well they match it and the
+        sort order only breaks ties. The ranking raises ``RankingCancelled``
+        once ``cancelled`` returns true.
+        """
+        if self.show_overdue_only:
+            today = datetime.date.today()
+            tasks = [task for task in tasks if task.due_date and task.due_date <= today]
+        else:
+            tasks = list(tasks)
+
+        if self.sort_by == "due_date":
+            tasks.sort(
+                key=lambda t: t.due_date or datetime.date.max, reverse=self.sort_reverse
+            )
+        elif self.sort_by == "creation_date":
+            tasks.sort(
+                key=lambda t: t.creation_date or datetime.datetime.max,
+                reverse=self.sort_reverse,
+            )
+        else:
+            tasks.sort(key=lambda t: t.title.lower(), reverse=self.sort_reverse)
+
+        if self.filter_query:
+            tasks = self.task_view_model.matching(tasks, self.filter_query, cancelled)
+        return tasks
+
     def action_add_task(self) -> None:
         """An action to add a task."""
+        from lazytask.presentation.text_input_modal import TextInputModal
 
         def on_submit(title: str | None) -> None:
             if title:
@@ -471,6 +831,7 @@ class LazyTaskApp(App):
 
     def action_add_task_due_today(self) -> None:
         """An action to add a task that is due today."""
+        from lazytask.presentation.text_input_modal import TextInputModal
 
         def on_submit(title: str | None) -> None:
             if title:
@@ -482,6 +843,7 @@ class LazyTaskApp(App):
 
     def action_switch_list(self) -> None:
         """An action to switch list."""
+        from lazytask.presentation.text_input_modal import TextInputModal
 
         def on_submit(list_name: str | None) -> None:
             if list_name:
@@ -493,9 +855,10 @@ class LazyTaskApp(App):
 
     def action_edit_date(self) -> None:
         """An action to edit a task's due date."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        from lazytask.presentation.date_picker_screen import DatePickerScreen
+
+        task = self._highlighted_task()
+        if task:
 
             def on_date_selected(new_date: datetime.date | None) -> None:
                 if new_date:
@@ -507,24 +870,21 @@ class LazyTaskApp(App):
 
     async def action_move_to_tomorrow(self) -> None:
         """An action to move a task to tomorrow."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        task = self._highlighted_task()
+        if task:
             tomorrow = datetime.date.today() + datetime.timedelta(days=1)
             await self._apply_due_date_update(task, tomorrow)
 
     async def action_due_today(self) -> None:
         """An action to set a task's due date to today."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        task = self._highlighted_task()
+        if task:
             await self._apply_due_date_update(task, datetime.date.today())
 
     async def action_move_to_next_monday(self) -> None:
         """An action to move a task to next monday."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        task = self._highlighted_task()
+        if task:
             today = datetime.date.today()
             days_until_monday = (0 - today.weekday() + 7) % 7
             if days_until_monday == 0:  # if today is monday, move to next monday
@@ -534,9 +894,8 @@ class LazyTaskApp(App):
 
     async def action_move_to_next_weekend(self) -> None:
         """An action to move a task to next weekend."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        task = self._highlighted_task()
+        if task:
             today = datetime.date.today()
             days_until_saturday = (5 - today.weekday() + 7) % 7
             if days_until_saturday == 0:  # if today is saturday, move to next saturday
@@ -546,11 +905,11 @@ class LazyTaskApp(App):
 
     def action_edit_task(self) -> None:
         """An action to edit a task."""
-        tasks_list = self.query_one(ListView)
-        if not tasks_list.highlighted_child:
-            return
+        from lazytask.presentation.edit_screen import EditScreen
 
-        task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        task = self._highlighted_task()
+        if not task:
+            return
 
         def on_close(updated_task: Task | None) -> None:
             if updated_task:
@@ -562,9 +921,10 @@ class LazyTaskApp(App):
 
     def action_move_task(self) -> None:
         """An action to move a task to another list."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        from lazytask.presentation.select_list_screen import SelectListScreen
+
+        task = self._highlighted_task()
+        if task:
 
             def on_list_selected(list_name: str | None) -> None:
                 if list_name:
@@ -583,6 +943,17 @@ class LazyTaskApp(App):
 
     async def move_task(self, task: Task, to_list: str):
         """Move a task to another list."""
+        if self.optimistic_updates:
+            # The target list's stored view doesn't have the task yet.
+            self.task_view_model.invalidate(to_list)
+            await self._apply_optimistically(
+                task,
+                dataclasses.replace(task, list_name=to_list),
+                lambda: self.move_task_uc.execute(task.id, task.list_name, to_list),
+                f"Could not move '{task.title}' to {to_list}",
+            )
+            return
+
         async with self.show_loading():
             await self.move_task_uc.execute(task.id, task.list_name, to_list)
             await self.update_tasks_list()
@@ -590,6 +961,17 @@ class LazyTaskApp(App):
     async def _apply_due_date_update(self, task: Task, new_date: datetime.date) -> None:
         """Apply a due date update and refresh list selection."""
         updates = {"due_date": new_date}
+        if self.optimistic_updates:
+            await self._apply_optimistically(
+                task,
+                dataclasses.replace(task, due_date=new_date),
+                lambda: self.update_task_uc.execute(task.id, updates, task.list_name),
+                f"Could not update the due date of '{task.title}'",
+                newly_added_task_id=task.id,
+                preserve_selection=False,
+            )
+            return
+
         async with self.show_loading():
             updated_task = await self.update_task_uc.execute(
                 task.id, updates, task.list_name
@@ -601,11 +983,71 @@ class LazyTaskApp(App):
             newly_added_task_id=highlight_task_id, preserve_selection=False
         )
 
+    async def _apply_optimistically(
+        self,
+        task: Task,
+        optimistic_task: Task,
+        commit: Callable[[], Awaitable[Task | None]],
+        failure_message: str,
+        **render_options: Any,
+    ) -> None:
+        """Show ``optimistic_task`` in place of ``task`` now; commit in the background.
+
+        When the commit returns a task it replaces the optimistic one (backends
+        that recreate tasks hand back a new ID); when it returns None the list is
+        refetched. When it fails, the task is put back as it was and the error is
+        reported. Until then, fetches that land keep showing the optimistic task.
+        """
+        previous = self.task_view_model.apply(task.id, optimistic_task)
+        hold = self.task_view_model.hold(task.id, optimistic_task)
+        await self.update_tasks_list(refetch=False, **render_options)
+        commit_task = asyncio.create_task(
+            self._commit_optimistic_update(
+                task.id, commit, previous, hold, failure_message
+            )
+        )
+        self._pending_commits.add(commit_task)
+        commit_task.add_done_callback(self._pending_commits.discard)
+
+    async def _commit_optimistic_update(
+        self,
+        task_id: str,
+        commit: Callable[[], Awaitable[Task | None]],
+        previous: dict[str, tuple[int, Task]],
+        hold: int,
+        failure_message: str,
+    ) -> None:
+        try:
+            result = await commit()
+        except Exception as error:
+            logging.exception(failure_message)
+            self.task_view_model.release(hold)
+            self.task_view_model.restore(task_id, previous)
+            self.notify(f"{failure_message}: {error}", title="Error", severity="error")
+            await self.update_tasks_list(refetch=False)
+            return
+
+        self.task_view_model.release(hold)
+        if not isinstance(result, Task):
+            # e.g. reminders-cli's complete doesn't return the task; ask the
+            # backend for the committed version.
+            await self.update_tasks_list()
+            return
+        highlighted_task = self._highlighted_task()
+        self.task_view_model.apply(task_id, result)
+        if highlighted_task is not None and highlighted_task.id == task_id:
+            await self.update_tasks_list(
+                refetch=False, newly_added_task_id=result.id, preserve_selection=False
+            )
+        else:
+            await self.update_tasks_list(refetch=False)
+
     def action_edit_title(self) -> None:
         """An action to edit a task's title."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        from lazytask.presentation.text_input_modal import TextInputModal
+
+        task = self._highlighted_task()
+        if task:
 
             def on_submit(new_title: str | None) -> None:
                 if new_title is not None:
@@ -630,13 +1072,10 @@ class LazyTaskApp(App):
 
     async def action_edit_description(self) -> None:
         """An action to edit a task's description using an external editor."""
-        tasks_list_view = self.query_one(ListView)
-        highlighted_item = tasks_list_view.highlighted_child
-        if highlighted_item is None:
+        task = self._highlighted_task()
+        if task is None:
             return
 
-        selected_task_item = cast(TaskListItem, highlighted_item)
-        task: Task = selected_task_item.data
         initial_description = task.description or ""
 
         try:
@@ -665,30 +1104,76 @@ class LazyTaskApp(App):
 
     async def action_refresh(self) -> None:
         """An action to refresh the list."""
+        container.task_manager.invalidate_cache()
         await self.update_tasks_list()
 
     async def action_clear_filter(self) -> None:
         """An action to clear the filter."""
-        await self.update_tasks_list("")
+        if self.query_one(FilterBar).display:
+            self._close_filter_bar()
+        await self.update_tasks_list("", refetch=False)
 
     def action_filter_tasks(self) -> None:
-        """An action to filter tasks."""
+        """Open the filter bar; the list narrows as the query is typed."""
+        filter_bar = self.query_one(FilterBar)
+        filter_bar.display = True
+        filter_bar.focus()
 
-        def on_submit(value: str | None) -> None:
-            async def filter_and_select():
-                await self.update_tasks_list(value or "", preserve_selection=False)
-                tasks_list_view = self.query_one(ListView)
-                if tasks_list_view.children:
-                    tasks_list_view.index = 0
-                else:
-                    tasks_list_view.index = None
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id != "filter_bar":
+            return
+        event.stop()
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(
+            self.filter_debounce, lambda: self._start_live_filter(event.value)
+        )
 
-            asyncio.create_task(filter_and_select())
+    def _start_live_filter(self, query: str) -> None:
+        """Filter the tasks already loaded, replacing a filter still running."""
+        self._filter_timer = None
+        self.run_worker(
+            self.update_tasks_list(
+                query,
+                preserve_selection=False,
+                select_first_if_available=True,
+                refetch=False,
+            ),
+            group="live_filter",
+            exclusive=True,
+        )
+
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id != "filter_bar":
+            return
+        event.stop()
+        self._close_filter_bar()
+        await self.update_tasks_list(
+            event.value,
+            preserve_selection=False,
+            select_first_if_available=True,
+            refetch=False,
+        )
 
-        self.push_screen(TextInputModal(prompt="Filter tasks:"), on_submit)
+    async def on_filter_bar_cancelled(self, message: FilterBar.Cancelled) -> None:
+        self._close_filter_bar()
+        await self.update_tasks_list("", refetch=False)
+
+    def _close_filter_bar(self) -> None:
+        """Hide and empty the filter bar, dropping a pending live filter."""
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+            self._filter_timer = None
+        self.workers.cancel_group(self, "live_filter")
+        filter_bar = self.query_one(FilterBar)
+        with filter_bar.prevent(Input.Changed):
+            filter_bar.value = ""
+        filter_bar.display = False
+        self._tasks_list().focus()
 
     def action_sort_tasks(self) -> None:
         """Open a modal to choose the sort field and direction."""
+        from lazytask.presentation.sort_options_screen import SortOptionsScreen
 
         def on_sort_selected(selection: tuple[str, bool] | None) -> None:
             if not selection:
@@ -699,7 +1184,7 @@ class LazyTaskApp(App):
 
             self.sort_by = selected_sort
             self.sort_reverse = selected_reverse
-            asyncio.create_task(self.update_tasks_list())
+            asyncio.create_task(self.update_tasks_list(refetch=False))
 
         self.push_screen(
             SortOptionsScreen(self.sort_by, self.sort_reverse), on_sort_selected
@@ -708,13 +1193,14 @@ class LazyTaskApp(App):
     async def action_toggle_sort_direction(self) -> None:
         """An action to toggle the sort direction."""
         self.sort_reverse = not self.sort_reverse
-        await self.update_tasks_list()
+        await self.update_tasks_list(refetch=False)
 
     def action_edit_recurring(self) -> None:
         """An action to edit a task's recurring status."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        from lazytask.presentation.text_input_modal import TextInputModal
+
+        task = self._highlighted_task()
+        if task:
 
             def on_submit(new_recurring: str | None) -> None:
                 if new_recurring is not None:
@@ -740,15 +1226,17 @@ class LazyTaskApp(App):
     async def action_toggle_overdue(self) -> None:
         """Toggle showing only overdue tasks."""
         self.show_overdue_only = not self.show_overdue_only
-        await self.update_tasks_list()
+        await self.update_tasks_list(refetch=False)
 
     async def action_toggle_completed(self) -> None:
         """Toggle showing completed tasks."""
         self.show_completed = not self.show_completed
-        await self.update_tasks_list()
+        await self.update_tasks_list(refetch=False)
 
     def action_show_help(self) -> None:
         """An action to show the help screen."""
+        from lazytask.presentation.help_screen import HelpScreen
+
         self.push_screen(HelpScreen())
 
     def _register_list_bindings(self) -> None:
@@ -770,22 +1258,19 @@ class LazyTaskApp(App):
 
     def action_cursor_down(self) -> None:
         """Move cursor down in the list."""
-        tasks_list = self.query_one(ListView)
+        tasks_list = self._tasks_list()
         logging.debug(f"cursor_down: index before: {tasks_list.index}")
-        if tasks_list.index is None and tasks_list.children:
+        if tasks_list.index is None and len(tasks_list):
             tasks_list.index = 0
-        elif (
-            tasks_list.index is not None
-            and tasks_list.index < len(tasks_list.children) - 1
-        ):
+        elif tasks_list.index is not None and tasks_list.index < len(tasks_list) - 1:
             tasks_list.index += 1
         logging.debug(f"cursor_down: index after: {tasks_list.index}")
 
     def action_cursor_up(self) -> None:
         """Move cursor up in the list."""
-        tasks_list = self.query_one(ListView)
+        tasks_list = self._tasks_list()
         logging.debug(f"cursor_up: index before: {tasks_list.index}")
-        if tasks_list.index is None and tasks_list.children:
+        if tasks_list.index is None and len(tasks_list):
             tasks_list.index = 0
         elif tasks_list.index is not None and tasks_list.index > 0:
             tasks_list.index -= 1
@@ -793,20 +1278,28 @@ class LazyTaskApp(App):
 
     def action_go_to_top(self) -> None:
         """Go to the top of the list."""
-        tasks_list = self.query_one(ListView)
+        tasks_list = self._tasks_list()
         tasks_list.index = 0
 
     def action_go_to_bottom(self) -> None:
         """Go to the bottom of the list."""
-        tasks_list = self.query_one(ListView)
-        tasks_list.index = len(tasks_list.children) - 1
+        tasks_list = self._tasks_list()
+        tasks_list.index = len(tasks_list) - 1
 
     async def action_complete_task(self) -> None:
         """An action to complete a task."""
-        tasks_list = self.query_one(ListView)
-        if tasks_list.highlighted_child:
-            current_index = tasks_list.index
-            task: Task = cast(TaskListItem, tasks_list.highlighted_child).data
+        task = self._highlighted_task()
+        if task:
+            current_index = self._tasks_list().index
+            if self.optimistic_updates:
+                await self._apply_optimistically(
+                    task,
+                    dataclasses.replace(task, completed=True),
+                    lambda: self.complete_task_uc.execute(task.id, task.list_name),
+                    f"Could not complete '{task.title}'",
+                    completed_task_index=current_index,
+                )
+                return
 
             await self.complete_task_uc.execute(task.id, task.list_name)
             await self.update_tasks_list(completed_task_index=current_index)
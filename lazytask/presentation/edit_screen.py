@@ -6,10 +6,10 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Switch, TextArea
 from textual.containers import Vertical
 
-from lazytask.domain.task import Task
+from lazytask.domain.task import Task, changed_fields
 from lazytask.presentation.date_picker_screen import DatePickerScreen
 from lazytask.container import container
-from lazytask.application.use_cases import GetTasks, UpdateTask
+from lazytask.application.use_cases import GetTask, UpdateTask
 
 
 class EditScreen(ModalScreen[Task | None]):
@@ -26,8 +26,11 @@ class EditScreen(ModalScreen[Task | None]):
         super().__init__(name=name, id=id, classes=classes)
         self._task_id = task_id
         self._list_name = list_name
-        self._task: Task | None = None
-        self.get_tasks_uc = container.get(GetTasks)
+        self._loaded_task: Task | None = None
+        # Edited separately so the loaded task stays a pristine baseline to diff
+        # against on save.
+        self._due_date: datetime.date | None = None
+        self.get_task_uc = container.get(GetTask)
         self.update_task_uc = container.get(UpdateTask)
 
     def on_mount(self) -> None:
@@ -35,9 +38,10 @@ class EditScreen(ModalScreen[Task | None]):
         self.query_one("#description").focus()
 
     async def load_task(self) -> None:
-        tasks = await self.get_tasks_uc.execute(self._list_name, include_completed=True)
-        self._task = next((t for t in tasks if t.id == self._task_id), None)
-        if not self._task:
+        self._loaded_task = await self.get_task_uc.execute(
+            self._task_id, self._list_name
+        )
+        if not self._loaded_task:
             self.app.notify(
                 f"Task with ID {self._task_id} not found.",
                 title="Error",
@@ -45,12 +49,17 @@ class EditScreen(ModalScreen[Task | None]):
             )
             self.dismiss()
             return
-        self.query_one("#description", TextArea).text = self._task.description or ""
-        self.query_one("#tags", Input).value = ",".join(self._task.tags)
-        self.query_one("#priority", Input).value = str(self._task.priority or "")
-        self.query_one("#flagged", Switch).value = self._task.is_flagged
+        self._due_date = self._loaded_task.due_date
+        self.query_one("#description", TextArea).text = (
+            self._loaded_task.description or ""
+        )
+        self.query_one("#tags", Input).value = ",".join(self._loaded_task.tags)
+        self.query_one("#priority", Input).value = str(self._loaded_task.priority or "")
+        self.query_one("#flagged", Switch).value = self._loaded_task.is_flagged
         self.query_one("#due-date-label", Label).update(
-            str(self._task.due_date) if self._task.due_date else "No due date"
+            str(self._loaded_task.due_date)
+            if self._loaded_task.due_date
+            else "No due date"
         )
 
     def compose(self) -> ComposeResult:
@@ -84,51 +93,60 @@ class EditScreen(ModalScreen[Task | None]):
         return str(self.query_one("#due-date-label").render())
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
-        if not self._task:
+        if not self._loaded_task:
             self.dismiss()
             return
 
         if event.button.id == "save":
-            priority_str = self.query_one("#priority", Input).value
-            priority = int(priority_str) if priority_str else None
+            priority_str = self.query_one("#priority", Input).value.strip()
+            try:
+                priority = int(priority_str) if priority_str else None
+            except ValueError:
+                self.app.notify(
+                    "Invalid priority. Please enter a number.",
+                    title="Error",
+                    severity="error",
+                )
+                return
             updates = {
                 "description": self.query_one("#description", TextArea).text,
                 "tags": [
                     tag.strip()
                     for tag in self.query_one("#tags", Input).value.split(",")
+                    if tag.strip()
                 ],
                 "priority": priority,
                 "is_flagged": self.query_one("#flagged", Switch).value,
-                "due_date": self._task.due_date,
+                "due_date": self._due_date,
             }
-            priority_str = self.query_one("#priority", Input).value
-            if priority_str:
-                try:
-                    updates["priority"] = int(priority_str)
-                except ValueError:
-                    self.app.notify(
-                        "Invalid priority. Please enter a number.",
-                        title="Error",
-                        severity="error",
-                    )
-                    return
+            # The form shows "" for a missing description/priority; don't treat
+            # those placeholders as edits.
+            if not updates["description"] and not self._loaded_task.description:
+                updates["description"] = self._loaded_task.description
+            if not priority and not self._loaded_task.priority:
+                updates["priority"] = self._loaded_task.priority
+
+            patch = changed_fields(self._loaded_task, updates)
+            if not patch:
+                self.dismiss(None)
+                return
 
             updated_task = await self.update_task_uc.execute(
-                self._task.id, updates, self._list_name
+                self._loaded_task.id, patch, self._list_name
             )
             self.dismiss(updated_task)
 
         elif event.button.id == "edit-due-date":
 
             def on_date_selected(new_date: datetime.date | None) -> None:
-                if self._task:
-                    self._task.due_date = new_date
+                if self._loaded_task:
+                    self._due_date = new_date
                     self.query_one("#due-date-label", Label).update(
                         str(new_date) if new_date else "No due date"
                     )
 
             self.app.push_screen(
-                DatePickerScreen(initial_date=self._task.due_date), on_date_selected
+                DatePickerScreen(initial_date=self._due_date), on_date_selected
             )
         else:
             self.dismiss()
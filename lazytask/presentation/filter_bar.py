@@ -0,0 +1,27 @@
+from textual.binding import Binding
+from textual.message import Message
+from textual.widgets import Input
+
+
+class FilterBar(Input):
+    """The inline filter prompt shown above the task list by ``/``.
+
+    The app listens for ``Input.Changed`` to filter as the user types and for
+    ``Input.Submitted`` to keep the filter and return to the list. Escape posts
+    ``FilterBar.Cancelled``.
+    """
+
+    BINDINGS = [Binding("escape", "cancel", "Clear filter", show=False)]
+
+    class Cancelled(Message):
+        """Escape was pressed in the filter bar."""
+
+    def __init__(self, **kwargs):
+        super().__init__(placeholder="Filter tasks", **kwargs)
+
+    def allow_focus(self) -> bool:
+        # Stay out of the focus chain (and away from key presses) while hidden.
+        return self.display and super().allow_focus()
+
+    def action_cancel(self) -> None:
+        self.post_message(self.Cancelled())
@@ -0,0 +1,88 @@
+import datetime
+from typing import NamedTuple
+
+from rich.control import strip_control_codes
+from rich.text import Span, Text
+
+from lazytask.domain.task import Task
+from lazytask.presentation.palette import Palette, get_palette
+
+PALETTE = get_palette()
+
+
+class TaskRowRender(NamedTuple):
+    display_text: Text
+    title_color: str
+    due_text: Text
+    due_color: str
+    meta_parts: tuple[str, ...]
+
+
+def task_row_signature(task: Task) -> tuple:
+    """Everything a task row's rendering depends on, for change detection."""
+    return (
+        task.title,
+        task.completed,
+        task.due_date,
+        tuple(task.tags),
+        task.priority,
+        task.is_flagged,
+        task.recurring,
+        # Due-date colouring is relative to today.
+        datetime.date.today(),
+    )
+
+
+def render_task_row(task: Task, palette: Palette = PALETTE) -> TaskRowRender:
+    """Styled title and due-date texts for a task row."""
+    completed, due_date = task.completed, task.due_date
+    status_token = "[x]" if completed else "[ ]"
+    meta_parts: list[str] = []
+    if task.tags:
+        meta_parts.append(f"tags: {','.join(task.tags)}")
+    if task.priority:
+        meta_parts.append(f"prio: {task.priority}")
+    if task.is_flagged:
+        meta_parts.append("flagged")
+    if task.recurring:
+        meta_parts.append(f"recurring: {task.recurring}")
+
+    status_color = palette.success if completed else palette.accent_primary
+    title_color = palette.text_muted if completed else palette.text_primary
+    meta_color = palette.text_secondary
+
+    # Texts are built with their spans in one go, which costs a fraction of
+    # appending them piece by piece. Text strips control codes from what it is
+    # given, so the title and tags are stripped first to keep the spans in place.
+    if due_date:
+        today = datetime.date.today()
+        if completed:
+            due_color = palette.success
+        elif due_date < today:
+            due_color = palette.danger
+        elif due_date == today:
+            due_color = palette.warning
+        else:
+            due_color = palette.accent_primary
+        due_plain = f"due: {due_date.isoformat()}"
+    else:
+        due_plain = "due: -"
+        due_color = meta_color
+    due_text = Text(due_plain, spans=[Span(0, len(due_plain), due_color)])
+
+    title_part = f"{status_token} {strip_control_codes(task.title)}"
+    spans = [
+        Span(0, len(status_token), status_color),
+        Span(len(status_token), len(title_part), title_color),
+    ]
+    if meta_parts:
+        meta_part = strip_control_codes(f" ({', '.join(meta_parts)})")
+        spans.append(
+            Span(len(title_part), len(title_part) + len(meta_part), meta_color)
+        )
+        title_part += meta_part
+    display_text = Text(title_part, spans=spans)
+
+    return TaskRowRender(
+        display_text, title_color, due_text, due_color, tuple(meta_parts)
+    )
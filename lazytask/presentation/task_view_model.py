@@ -0,0 +1,163 @@
+import itertools
+from typing import Callable
+
+from lazytask.domain.fuzzy_match import FuzzyMatcher
+from lazytask.domain.task import Task
+
+
+class TaskViewModel:
+    """The tasks last fetched for each list view.
+
+    Filtering, sorting and the overdue/completed toggles are re-derived from
+    these snapshots instead of asking the backend again. Once a list has been
+    fetched with its completed tasks, it keeps them, so toggling completed tasks
+    off and on again stays local. The filter query is matched by a
+    ``FuzzyMatcher``, which narrows its previous results as the query grows.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, list[Task]] = {}
+        self._with_completed: set[str] = set()
+        # Matchers no ranking is using. The app ranks on worker threads, and a
+        # superseded ranking may still be running when the next one starts.
+        self._idle_matchers: list[FuzzyMatcher] = []
+        # Held key -> (task ID, task shown in its place), oldest first.
+        self._held: dict[int, tuple[str, Task | None]] = {}
+        self._hold_keys = itertools.count()
+
+    def store(self, list_name: str, tasks: list[Task], include_completed: bool) -> None:
+        self._tasks[list_name] = list(tasks)
+        # A fetch that started before a held change was committed doesn't have it.
+        for task_id, updated in self._held.values():
+            self._replace(list_name, task_id, updated)
+        # Refetched tasks may be the same objects with their titles changed.
+        self._drop_matchers()
+        if include_completed:
+            self._with_completed.add(list_name)
+        else:
+            self._with_completed.discard(list_name)
+
+    def includes_completed(self, list_name: str) -> bool:
+        return list_name in self._with_completed
+
+    def tasks(self, list_name: str, include_completed: bool) -> list[Task] | None:
+        """The stored tasks for a list, or None if they have to be fetched."""
+        stored = self._tasks.get(list_name)
+        if stored is None:
+            return None
+        if include_completed:
+            return list(stored) if list_name in self._with_completed else None
+        return [task for task in stored if not task.completed]
+
+    def apply(self, task_id: str, updated: Task | None) -> dict[str, tuple[int, Task]]:
+        """Replace a task in every stored view, or drop it when ``updated`` is None.
+
+        A task whose list changed is dropped from that list's view but kept in
+        the "all" view. Returns the position and previous version of the task in
+        each touched view, for ``restore``.
+        """
+        previous: dict[str, tuple[int, Task]] = {}
+        self._drop_matchers()
+        for list_name in self._tasks:
+            replaced = self._replace(list_name, task_id, updated)
+            if replaced is not None:
+                previous[list_name] = replaced
+        return previous
+
+    def _replace(
+        self, list_name: str, task_id: str, updated: Task | None
+    ) -> tuple[int, Task] | None:
+        """``apply`` for one stored view; the position and task replaced, if any."""
+        tasks = self._tasks[list_name]
+        position = next(
+            (index for index, task in enumerate(tasks) if task.id == task_id),
+            None,
+        )
+        if position is None:
+            return None
+        keep = updated is not None and (
+            list_name == "all"
+            or not updated.list_name
+            or updated.list_name == list_name
+        )
+        self._tasks[list_name] = [
+            updated if task.id == task_id else task
+            for task in tasks
+            if task.id != task_id or keep
+        ]
+        return position, tasks[position]
+
+    def hold(self, task_id: str, updated: Task | None) -> int:
+        """Keep applying ``updated`` to tasks stored later, until ``release``.
+
+        For optimistic updates: a fetch that lands before the change is
+        committed would otherwise bring back the task as it was.
+        """
+        key = next(self._hold_keys)
+        self._held[key] = (task_id, updated)
+        return key
+
+    def release(self, key: int) -> None:
+        self._held.pop(key, None)
+
+    def matching(
+        self,
+        tasks: list[Task],
+        query: str,
+        cancelled: Callable[[], bool] | None = None,
+    ) -> list[Task]:
+        """The ``tasks`` whose title fuzzy-matches ``query``, best match first.
+
+        Safe to call from a worker thread: the ranking takes a matcher no other
+        ranking is using, and changes to the stored tasks never wait for it.
+        Raises ``RankingCancelled`` once ``cancelled`` returns true.
+        """
+        # Popping and appending are atomic, so no lock is needed. A matcher
+        # goes back to the list it came from, which a change to the stored
+        # tasks has replaced by then if its cached rankings may be stale.
+        idle = self._idle_matchers
+        try:
+            matcher = idle.pop()
+        except IndexError:
+            matcher = FuzzyMatcher()
+        try:
+            return matcher.rank(tasks, query, cancelled)
+        finally:
+            idle.append(matcher)
+
+    def _drop_matchers(self) -> None:
+        self._idle_matchers = []
+
+    def restore(self, task_id: str, previous: dict[str, tuple[int, Task]]) -> None:
+        """Put the task back as it was before the ``apply`` that returned ``previous``.
+
+        Only that task is touched, so changes other tasks got in the meantime
+        (say, another optimistic update that succeeded) are kept.
+        """
+        for list_name, (position, task) in previous.items():
+            tasks = self._tasks.get(list_name)
+            if tasks is None:
+                continue
+            others = [other for other in tasks if other.id != task_id]
+            if len(others) == len(tasks):
+                others.insert(min(position, len(others)), task)
+            else:
+                others = [task if other.id == task_id else other for other in tasks]
+            self._tasks[list_name] = others
+            self._drop_matchers()
+
+    def lists(self) -> dict[str, tuple[list[Task], bool]]:
+        """Every stored view, with whether it includes completed tasks."""
+        return {
+            list_name: (list(tasks), list_name in self._with_completed)
+            for list_name, tasks in self._tasks.items()
+        }
+
+    def invalidate(self, list_name: str | None = None) -> None:
+        if list_name is None:
+            self._tasks.clear()
+            self._with_completed.clear()
+            self._drop_matchers()
+            return
+        self._tasks.pop(list_name, None)
+        self._with_completed.discard(list_name)
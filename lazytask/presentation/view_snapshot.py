@@ -0,0 +1,79 @@
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+
+from lazytask.domain.task import Task, task_from_dict, task_to_dict
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class ViewSnapshot:
+    """The task lists last rendered, with the view state they were shown in."""
+
+    current_list: str
+    sort_by: str
+    sort_reverse: bool
+    filter_query: str
+    show_overdue_only: bool
+    show_completed: bool
+    selected_task_id: str | None = None
+    # list name -> (tasks, whether completed tasks were fetched)
+    lists: dict[str, tuple[list[Task], bool]] = field(default_factory=dict)
+
+
+def save_view_snapshot(path: str, snapshot: ViewSnapshot) -> None:
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "current_list": snapshot.current_list,
+        "sort_by": snapshot.sort_by,
+        "sort_reverse": snapshot.sort_reverse,
+        "filter_query": snapshot.filter_query,
+        "show_overdue_only": snapshot.show_overdue_only,
+        "show_completed": snapshot.show_completed,
+        "selected_task_id": snapshot.selected_task_id,
+        "lists": {
+            list_name: {
+                "include_completed": include_completed,
+                "tasks": [task_to_dict(task) for task in tasks],
+            }
+            for list_name, (tasks, include_completed) in snapshot.lists.items()
+        },
+    }
+    # Write to a temp file and rename so an interrupted save never leaves a
+    # half-written snapshot behind.
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+def load_view_snapshot(path: str) -> ViewSnapshot | None:
+    """Read a snapshot; a missing, unreadable or outdated file yields None."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+        return ViewSnapshot(
+            current_list=data["current_list"],
+            sort_by=data["sort_by"],
+            sort_reverse=data["sort_reverse"],
+            filter_query=data["filter_query"],
+            show_overdue_only=data["show_overdue_only"],
+            show_completed=data["show_completed"],
+            selected_task_id=data.get("selected_task_id"),
+            lists={
+                list_name: (
+                    [task_from_dict(task) for task in entry["tasks"]],
+                    entry["include_completed"],
+                )
+                for list_name, entry in data["lists"].items()
+            },
+        )
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        logging.warning(f"Ignoring unreadable view snapshot {path}: {error}")
+        return None
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+from lazytask.domain.task import Task
+from lazytask.presentation.palette import get_palette
+from lazytask.presentation.task_row import render_task_row
+
+PALETTE = get_palette()
+
+# Matches the width of the due-date label in TaskListItem rows.
+DUE_DATE_WIDTH = 16
+
+
+@dataclass(frozen=True)
+class VirtualTaskRow:
+    """Stand-in for a TaskListItem: the highlighted row of a VirtualTaskList."""
+
+    data: Task
+    index: int
+
+
+class VirtualTaskList(ScrollView, can_focus=True):
+    """Task list that only renders the rows in view.
+
+    Holds a plain sequence of tasks instead of one widget per task, and renders
+    rows on demand, keeping the ones in view plus ``overscan`` rows either side.
+    It mirrors the parts of ListView the app relies on: ``index``,
+    ``highlighted_child``, ``len()`` and a ``Highlighted`` message.
+    """
+
+    BINDINGS = [
+        Binding("down", "cursor_down", "Cursor down", show=False),
+        Binding("up", "cursor_up", "Cursor up", show=False),
+    ]
+
+    index = reactive[Optional[int]](None, init=False)
+
+    class Highlighted(Message):
+        """Posted when the highlighted row changes."""
+
+        def __init__(
+            self, task_list: "VirtualTaskList", item: Optional[VirtualTaskRow]
+        ):
+            super().__init__()
+            self.task_list = task_list
+            self.item = item
+
+        @property
+        def control(self) -> "VirtualTaskList":
+            return self.task_list
+
+    def __init__(
+        self,
+        overscan: int = 20,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+    ) -> None:
+        super().__init__(name=name, id=id, classes=classes)
+        self.overscan = overscan
+        self._tasks: list[Task] = []
+        self._rendered_rows: dict[int, Strip] = {}
+        self._rendered_width = 0
+
+    @property
+    def tasks(self) -> Sequence[Task]:
+        return self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def set_tasks(self, tasks: Sequence[Task]) -> None:
+        """Replace the backing tasks; keeps the index, clamped to the new length."""
+        self._tasks = list(tasks)
+        self._rendered_rows.clear()
+        self.virtual_size = Size(self.size.width, len(self._tasks))
+        if self.index is not None:
+            self.index = self.index
+        self.refresh()
+
+    @property
+    def highlighted_child(self) -> Optional[VirtualTaskRow]:
+        if self.index is None or not 0 <= self.index < len(self._tasks):
+            return None
+        return VirtualTaskRow(self._tasks[self.index], self.index)
+
+    def validate_index(self, index: Optional[int]) -> Optional[int]:
+        if index is None or not self._tasks:
+            return None
+        return max(0, min(index, len(self._tasks) - 1))
+
+    def watch_index(self, old_index: Optional[int], new_index: Optional[int]) -> None:
+        for row in (old_index, new_index):
+            if row is not None:
+                self._rendered_rows.pop(row, None)
+        if new_index is not None:
+            self.scroll_to_region(
+                Region(0, new_index, max(self.size.width, 1), 1), animate=False
+            )
+        self.refresh()
+        self.post_message(self.Highlighted(self, self.highlighted_child))
+
+    def action_cursor_down(self) -> None:
+        if self.index is None:
+            self.index = 0
+        elif self.index < len(self._tasks) - 1:
+            self.index += 1
+
+    def action_cursor_up(self) -> None:
+        if self.index is None:
+            self.index = 0
+        elif self.index > 0:
+            self.index -= 1
+
+    def on_click(self, event: events.Click) -> None:
+        row = self.scroll_offset.y + event.y
+        if 0 <= row < len(self._tasks):
+            self.index = row
+
+    def on_resize(self, event: events.Resize) -> None:
+        self.virtual_size = Size(event.size.width, len(self._tasks))
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        row = self.scroll_offset.y + y
+        if width != self._rendered_width:
+            self._rendered_rows.clear()
+            self._rendered_width = width
+        if not 0 <= row < len(self._tasks):
+            return Strip.blank(width, self.rich_style)
+
+        strip = self._rendered_rows.get(row)
+        if strip is None:
+            strip = self._render_row(row, width)
+            self._rendered_rows[row] = strip
+            self._evict_rows_outside_window()
+        return strip
+
+    def _evict_rows_outside_window(self) -> None:
+        top = self.scroll_offset.y - self.overscan
+        bottom = self.scroll_offset.y + self.size.height + self.overscan
+        for row in [row for row in self._rendered_rows if not top <= row < bottom]:
+            del self._rendered_rows[row]
+
+    def _render_row(self, row: int, width: int) -> Strip:
+        rendered = render_task_row(self._tasks[row])
+        title_width = max(width - DUE_DATE_WIDTH - 2, 0)
+        title = rendered.display_text.copy()
+        title.truncate(title_width, overflow="ellipsis", pad=True)
+        due = rendered.due_text.copy()
+        due.align("right", DUE_DATE_WIDTH)
+
+        line = Text(" ")
+        line.append_text(title)
+        line.append_text(due)
+        line.append(" ")
+        base_style = self.rich_style
+        if row == self.index:
+            base_style += Style(bgcolor=PALETTE.highlight_background, bold=True)
+        segments = list(line.render(self.app.console))
+        return (
+            Strip(Segment.apply_style(segments, base_style))
+            .extend_cell_length(width, base_style)
+            .crop(0, width)
+        )
@@ -1,15 +1,15 @@
 import argparse
 import asyncio
 import json
+import sys
 from typing import Any
 
-from textual.widgets import Label, ListView
-
-from lazytask.presentation.app import LazyTaskApp, TaskListItem
-
 
 def capture_list_snapshot() -> list[dict[str, Any]]:
     """Render the app headlessly and capture styling details for each list entry."""
+    from textual.widgets import Label, ListView
+
+    from lazytask.presentation.app import LazyTaskApp, TaskListItem
 
     async def _capture_snapshot(app: LazyTaskApp) -> list[dict[str, Any]]:
         async with app.run_test() as pilot:
@@ -41,6 +41,12 @@ def capture_list_snapshot() -> list[dict[str, Any]]:
 
 
 def main():
+    # Scripting subcommands never import the TUI; see lazytask/commands.py.
+    if len(sys.argv) > 1 and sys.argv[1] in ("add", "ls", "done", "export"):
+        from lazytask.commands import main as run_command
+
+        sys.exit(run_command(sys.argv[1:]))
+
     parser = argparse.ArgumentParser(description="LazyTask CLI entry point.")
     parser.add_argument(
         "--debug-list-snapshot",
@@ -57,6 +63,8 @@ def main():
         print(json.dumps(snapshot, indent=2))
         return
 
+    from lazytask.presentation.app import LazyTaskApp
+
     app = LazyTaskApp()
     app.run()
 
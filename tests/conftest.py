@@ -1,3 +1,5 @@
+from typing import Callable
+
 import pytest
 from lazytask.container import container
 from lazytask.infrastructure.mock_task_manager import MockTaskManager
@@ -32,3 +34,19 @@ async def app(
     # filter up-front so they can operate without additional toggling.
     app.show_overdue_only = False
     return app
+
+
+@pytest.fixture
+def make_app(monkeypatch) -> Callable[..., LazyTaskApp]:
+    """Builds a LazyTaskApp over the comma-separated ``lists``, with the
+    overdue-only filter off. Tests replace its use cases themselves."""
+
+    def make(lists: str, fetch_concurrency: int | None = None) -> LazyTaskApp:
+        monkeypatch.setenv("LAZYTASK_LISTS", lists)
+        if fetch_concurrency is not None:
+            monkeypatch.setenv("LAZYTASK_FETCH_CONCURRENCY", str(fetch_concurrency))
+        app = LazyTaskApp()
+        app.show_overdue_only = False
+        return app
+
+    return make
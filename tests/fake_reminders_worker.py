@@ -0,0 +1,113 @@
+"""Stand-in for `reminders worker` so the worker protocol runs without EventKit.
+
+Reads line-delimited JSON requests from stdin and answers on stdout, keeping
+reminders in memory. The extra `crash` command exits without answering so tests
+can exercise restarts, and `hang` is never answered.
+"""
+
+import itertools
+import json
+import sys
+from typing import Any
+
+
+def parse_options(args: list[str]) -> tuple[list[str], dict[str, Any]]:
+    positional: list[str] = []
+    options: dict[str, Any] = {}
+    iterator = iter(args)
+    for arg in iterator:
+        if arg == "--include-completed":
+            options["include_completed"] = True
+        elif arg.startswith("--"):
+            options[arg[2:]] = next(iterator)
+        else:
+            positional.append(arg)
+    return positional, options
+
+
+class FakeReminders:
+    def __init__(self, lists: list[str]):
+        self.reminders: dict[str, list[dict[str, Any]]] = {name: [] for name in lists}
+        self.ids = itertools.count(1)
+
+    def find(self, list_name: str, reminder_id: str) -> dict[str, Any]:
+        for reminder in self.reminders.get(list_name, []):
+            if reminder["externalId"] == reminder_id:
+                return reminder
+        raise ValueError(f"No reminder '{reminder_id}' on '{list_name}'")
+
+    def visible(
+        self, reminders: list[dict[str, Any]], options: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        if options.get("include_completed"):
+            return reminders
+        return [reminder for reminder in reminders if not reminder["isCompleted"]]
+
+    def run(self, args: list[str]) -> Any:
+        command, *rest = args
+        positional, options = parse_options(rest)
+        if command == "show-lists":
+            return list(self.reminders)
+        if command == "show-all":
+            return self.visible(
+                [r for reminders in self.reminders.values() for r in reminders],
+                options,
+            )
+        if command == "show":
+            if positional[0] not in self.reminders:
+                raise ValueError(f"No reminders list matching {positional[0]}")
+            return self.visible(self.reminders[positional[0]], options)
+        if command == "add":
+            list_name, title = positional
+            reminder = {
+                "externalId": f"fake-{next(self.ids)}",
+                "title": title,
+                "list": list_name,
+                "isCompleted": False,
+                "notes": options.get("notes"),
+                "dueDate": options.get("due-date"),
+                "priority": 0,
+            }
+            self.reminders.setdefault(list_name, []).append(reminder)
+            return reminder
+        if command == "complete":
+            self.find(*positional)["isCompleted"] = True
+            return None
+        if command == "delete":
+            list_name, reminder_id = positional
+            self.reminders[list_name].remove(self.find(list_name, reminder_id))
+            return None
+        if command == "edit":
+            reminder = self.find(*positional[:2])
+            if len(positional) > 2:
+                reminder["title"] = positional[2]
+            if "notes" in options:
+                reminder["notes"] = options["notes"]
+            return None
+        raise ValueError(f"Unknown command '{command}'")
+
+
+def main() -> None:
+    lists = sys.argv[1].split(",") if len(sys.argv) > 1 else ["develop"]
+    fake = FakeReminders(lists)
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["args"] == ["crash"]:
+            sys.exit(3)
+        if request["args"] == ["hang"]:
+            continue
+        try:
+            result = fake.run(request["args"])
+            response = {
+                "id": request["id"],
+                "ok": True,
+                "output": json.dumps(result) if result is not None else "",
+            }
+        except Exception as error:
+            response = {"id": request["id"], "ok": False, "error": str(error)}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,25 @@ async def test_app_quits_on_q_press():
         assert app._exit
 
 
+async def test_app_closes_the_backend_on_exit(
+    app: LazyTaskApp, mock_task_manager, monkeypatch
+):
+    """
+    Verify that quitting stops the backend's helper processes.
+    """
+    closed = []
+
+    async def close():
+        closed.append(True)
+
+    monkeypatch.setattr(mock_task_manager, "close", close)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert closed == []
+
+    assert closed == [True]
+
+
 async def test_app_starts_in_all_view():
     """
     Verify that the application starts in the "all" view.
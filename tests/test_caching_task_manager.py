@@ -0,0 +1,185 @@
+import dataclasses
+from typing import Optional
+
+import pytest
+
+from lazytask.container import DependencyContainer
+from lazytask.domain.task import Task
+from lazytask.infrastructure.caching_task_manager import CachingTaskManager
+from lazytask.infrastructure.mock_task_manager import MockTaskManager
+
+
+class CountingTaskManager(MockTaskManager):
+    def __init__(self):
+        super().__init__(use_persistence=False)
+        self.get_tasks_calls: list[tuple[str, bool]] = []
+
+    async def get_tasks(self, list_name="develop", include_completed=False):
+        self.get_tasks_calls.append((list_name, include_completed))
+        return await super().get_tasks(list_name, include_completed)
+
+
+class RecreatingTaskManager(CountingTaskManager):
+    """Mimics reminders-cli: edits hand back a new ID, completes return nothing."""
+
+    async def edit_task_full(self, task_id, updates, list_name="develop"):
+        original = self._tasks[list_name].pop(task_id)
+        recreated = dataclasses.replace(original, id=f"{task_id}-new", **updates)
+        self._tasks[list_name][recreated.id] = recreated
+        return recreated
+
+    async def complete_task(self, task_id, list_name="develop") -> Optional[Task]:
+        await super().complete_task(task_id, list_name)
+        return None
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def backend() -> CountingTaskManager:
+    return CountingTaskManager()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(backend, clock) -> CachingTaskManager:
+    return CachingTaskManager(backend, ttl=10, clock=clock)
+
+
+def titles(tasks: list[Task]) -> list[str]:
+    return sorted(task.title for task in tasks)
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_are_served_from_cache(cache, backend):
+    await backend.add_task("Task 1")
+
+    await cache.get_tasks("develop")
+    await cache.get_tasks("develop")
+
+    assert backend.get_tasks_calls == [("develop", False)]
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(cache, backend, clock):
+    await cache.get_tasks("develop")
+    clock.now = 11
+
+    await cache.get_tasks("develop")
+
+    assert len(backend.get_tasks_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_task_patches_cached_lists(cache, backend):
+    await cache.get_tasks("develop")
+    await cache.get_tasks("develop", include_completed=True)
+
+    await cache.add_task("New task", "develop")
+
+    assert titles(await cache.get_tasks("develop")) == ["New task"]
+    assert titles(await cache.get_tasks("develop", True)) == ["New task"]
+    assert len(backend.get_tasks_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_complete_task_moves_task_out_of_active_view(cache, backend):
+    task = await backend.add_task("Finish me")
+    await cache.get_tasks("develop")
+    await cache.get_tasks("develop", include_completed=True)
+
+    await cache.complete_task(task.id, "develop")
+
+    assert await cache.get_tasks("develop") == []
+    completed = await cache.get_tasks("develop", include_completed=True)
+    assert [task.completed for task in completed] == [True]
+    assert len(backend.get_tasks_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_move_task_patches_both_lists(cache, backend):
+    task = await backend.add_task("Move me", "develop")
+    await cache.get_tasks("develop")
+    await cache.get_tasks("develop2")
+
+    await cache.move_task(task.id, "develop", "develop2")
+
+    assert await cache.get_tasks("develop") == []
+    assert titles(await cache.get_tasks("develop2")) == ["Move me"]
+    assert len(backend.get_tasks_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_recreated_task_replaces_cached_entry(clock):
+    backend = RecreatingTaskManager()
+    cache = CachingTaskManager(backend, ttl=10, clock=clock)
+    task = await backend.add_task("Recreated")
+    await cache.get_tasks("develop")
+
+    await cache.edit_task_full(task.id, {"description": "notes"}, "develop")
+
+    cached = await cache.get_tasks("develop")
+    assert [(task.id, task.description) for task in cached] == [
+        (f"{task.id}-new", "notes")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_complete_without_result_patches_cached_copy(clock):
+    backend = RecreatingTaskManager()
+    cache = CachingTaskManager(backend, ttl=10, clock=clock)
+    task = await backend.add_task("Done")
+    await cache.get_tasks("develop")
+
+    await cache.complete_task(task.id, "develop")
+
+    assert await cache.get_tasks("develop") == []
+    assert len(backend.get_tasks_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_forces_refetch(cache, backend):
+    await cache.get_tasks("develop")
+
+    cache.invalidate_cache()
+    await cache.get_tasks("develop")
+
+    assert len(backend.get_tasks_calls) == 2
+
+
+async def test_batch_mutations_patch_cached_lists(cache, backend):
+    first, second = [
+        result.task
+        for result in await cache.add_tasks([{"title": "First"}, {"title": "Second"}])
+    ]
+    await cache.get_tasks("develop")
+
+    await cache.complete_tasks([first.id])
+    await cache.edit_tasks({second.id: {"title": "Renamed"}})
+
+    assert [(task.id, task.title) for task in await cache.get_tasks("develop")] == [
+        (second.id, "Renamed")
+    ]
+    assert backend.get_tasks_calls == [("develop", False)]
+
+
+def test_container_rejects_non_numeric_cache_ttl(tmp_path, monkeypatch):
+    monkeypatch.setenv("LAZYTASK_TASK_MANAGER", "sqlite")
+    monkeypatch.setenv("LAZYTASK_SQLITE_PATH", str(tmp_path / "container.db"))
+    monkeypatch.setenv("LAZYTASK_CACHE_TTL", "5m")
+
+    with pytest.raises(ValueError, match="LAZYTASK_CACHE_TTL value '5m'"):
+        DependencyContainer()
+
+    monkeypatch.setenv("LAZYTASK_CACHE_TTL", "2.5")
+    assert isinstance(DependencyContainer().task_manager, CachingTaskManager)
@@ -0,0 +1,148 @@
+import asyncio
+import datetime
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from lazytask.commands import main
+
+
+@pytest.fixture(autouse=True)
+def lists(monkeypatch, mock_task_manager):
+    monkeypatch.setenv("LAZYTASK_LISTS", "develop,develop2")
+
+
+def test_add_prints_the_new_task_id(mock_task_manager, capsys):
+    assert main(["add", "Write", "report", "--list", "develop2", "--due", "today"]) == 0
+
+    task_id = capsys.readouterr().out.strip()
+    [task] = asyncio.run(mock_task_manager.get_tasks("develop2"))
+    assert (task.id, task.title, task.due_date) == (
+        task_id,
+        "Write report",
+        datetime.date.today(),
+    )
+
+
+def test_ls_filters_overdue_tasks_across_lists(mock_task_manager, capsys):
+    yesterday = datetime.date.today() - datetime.timedelta(days=1)
+    asyncio.run(mock_task_manager.add_task("Late", "develop", due_date=yesterday))
+    asyncio.run(mock_task_manager.add_task("Someday", "develop"))
+    asyncio.run(mock_task_manager.add_task("Also late", "develop2", due_date=yesterday))
+
+    assert main(["ls", "--overdue", "--json"]) == 0
+
+    listed = json.loads(capsys.readouterr().out)
+    assert [(task["title"], task["list_name"]) for task in listed] == [
+        ("Late", "develop"),
+        ("Also late", "develop2"),
+    ]
+    assert listed[0]["due_date"] == yesterday.isoformat()
+
+
+def test_subcommands_close_the_backend(mock_task_manager, monkeypatch):
+    loops = []
+
+    async def close():
+        loops.append(asyncio.get_running_loop())
+
+    monkeypatch.setattr(mock_task_manager, "close", close)
+    assert main(["ls"]) == 0
+    assert len(loops) == 1
+
+
+def test_done_completes_tasks_and_reports_unknown_ids(mock_task_manager, capsys):
+    task = asyncio.run(mock_task_manager.add_task("Finish me", "develop2"))
+
+    assert main(["done", task.id]) == 0
+    assert main(["done", "missing"]) == 1
+
+    assert "missing: no such task" in capsys.readouterr().err
+    assert asyncio.run(mock_task_manager.get_tasks("develop2", True))[0].completed
+
+
+def test_export_includes_completed_tasks(mock_task_manager, capsys):
+    task = asyncio.run(mock_task_manager.add_task("Done already", "develop"))
+    asyncio.run(mock_task_manager.complete_task(task.id, "develop"))
+
+    assert main(["export"]) == 0
+
+    exported = json.loads(capsys.readouterr().out)
+    assert [entry["title"] for entry in exported["develop"]] == ["Done already"]
+    assert exported["develop2"] == []
+
+
+def test_backend_errors_are_reported_without_a_traceback(mock_task_manager, capsys):
+    async def failing_get_tasks(list_name="develop", include_completed=False):
+        raise RuntimeError("reminders-cli exited with status 1")
+
+    mock_task_manager.get_tasks = failing_get_tasks
+
+    assert main(["ls"]) == 1
+    assert capsys.readouterr().err == ("lazytask: reminders-cli exited with status 1\n")
+
+
+def test_configuration_errors_are_reported_without_a_traceback(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-m", "lazytask.commands", "ls"],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={
+            **os.environ,
+            "PYTHONPATH": str(Path(__file__).parents[1]),
+            "LAZYTASK_CACHE_TTL": "soon",
+        },
+    )
+
+    assert result.returncode == 1
+    assert result.stderr.startswith("lazytask: Invalid LAZYTASK_CACHE_TTL value")
+    assert "Traceback" not in result.stderr
+
+
+def test_commands_do_not_import_the_tui(tmp_path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from lazytask.commands import main; main(['ls']); "
+            "print(sorted(m for m in sys.modules "
+            "if m.split('.')[0] in ('textual', 'rich') "
+            "or m.startswith('lazytask.presentation')))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        # Run elsewhere so the mock backend's JSON file lands in tmp_path.
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[1])},
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_ls_imports_only_what_the_configuration_uses(tmp_path):
+    env = {**os.environ, "PYTHONPATH": str(Path(__file__).parents[1])}
+    env.pop("LAZYTASK_TASK_MANAGER", None)
+    env.pop("LAZYTASK_CACHE_TTL", None)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from lazytask.commands import main; main(['ls']); "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith('lazytask.infrastructure.') "
+            "and not m.endswith(('mock_task_manager', 'task_index'))))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tmp_path,
+        env=env,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.widgets import ListView
+
+from lazytask.domain.task import Task
+from lazytask.presentation.app import LazyTaskApp
+
+
+@pytest.mark.asyncio
+async def test_all_view_fetches_with_bounded_concurrency(make_app):
+    app = make_app("a,b,c,d,e", fetch_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+    delays = {"a": 0.05, "b": 0.01, "c": 0.03, "d": 0.0, "e": 0.02}
+
+    async def get_tasks(list_name, include_completed=False):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(delays[list_name])
+        in_flight -= 1
+        return [Task(id=list_name, title=f"Task {list_name}", list_name=list_name)]
+
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks)
+
+    async with app.run_test() as pilot:
+        await pilot.pause(0.2)
+
+        list_view = app.query_one(ListView)
+        assert max_in_flight == 2
+        assert [item.data.id for item in list_view.children] == [
+            "a",
+            "b",
+            "c",
+            "d",
+            "e",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_all_view_renders_lists_as_they_arrive(make_app):
+    app = make_app("fast,slow", fetch_concurrency=2)
+    release_slow = asyncio.Event()
+    release_slow.set()
+    fast_tasks: list[Task] = []
+
+    async def get_tasks(list_name, include_completed=False):
+        if list_name == "slow":
+            await release_slow.wait()
+            return [Task(id="slow", title="Task slow", list_name=list_name)]
+        fast_tasks.append(Task(id=f"fast-{len(fast_tasks)}", title="Task fast"))
+        return list(fast_tasks)
+
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        release_slow.clear()
+        refresh = asyncio.create_task(app.update_tasks_list())
+        list_view = app.query_one(ListView)
+        for _ in range(50):
+            await pilot.pause(0.02)
+            if "slow" not in [item.data.id for item in list_view.children]:
+                break
+
+        assert [item.data.id for item in list_view.children] == ["fast-0", "fast-1"]
+        assert not refresh.done()
+
+        release_slow.set()
+        await refresh
+        await pilot.pause()
+        assert [item.data.id for item in list_view.children] == [
+            "fast-0",
+            "fast-1",
+            "slow",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_all_view_uses_bulk_fetch_when_supported(make_app):
+    app = make_app("develop,develop2", fetch_concurrency=2)
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(return_value=[])
+    app.get_tasks_for_lists_uc = MagicMock(supports_bulk_fetch=True)
+    app.get_tasks_for_lists_uc.execute = AsyncMock(
+        return_value={
+            "develop": [Task(id="1", title="Bulk task", list_name="develop")],
+            "develop2": [],
+        }
+    )
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+
+        assert len(app.query_one(ListView).children) == 1
+        app.get_tasks_uc.execute.assert_not_called()
+
+
+def test_fetch_concurrency_must_be_positive(monkeypatch):
+    monkeypatch.setenv("LAZYTASK_LISTS", "develop")
+    monkeypatch.setenv("LAZYTASK_FETCH_CONCURRENCY", "0")
+
+    with pytest.raises(ValueError, match="LAZYTASK_FETCH_CONCURRENCY"):
+        LazyTaskApp()
@@ -4,3 +4,61 @@ import pytest
 @pytest.fixture(autouse=True)
 def set_env(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setenv("LAZYTASK_LISTS", "develop,develop2")
+
+
+async def open_edit_screen(app, pilot, task):
+    from lazytask.presentation.edit_screen import EditScreen
+
+    results = []
+    app.push_screen(
+        EditScreen(task_id=task.id, list_name=task.list_name), results.append
+    )
+    await pilot.pause()
+    assert isinstance(app.screen, EditScreen)
+    return app.screen, results
+
+
+async def save(pilot, screen):
+    from textual.widgets import Button
+
+    screen.query_one("#save", Button).press()
+    await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_saving_unchanged_task_skips_backend(app, mock_task_manager):
+    from unittest.mock import AsyncMock
+
+    task = await mock_task_manager.add_task(
+        "Untouched", "develop", tags=["home"], priority=2
+    )
+    mock_task_manager.edit_task_full = AsyncMock()
+
+    async with app.run_test() as pilot:
+        screen, results = await open_edit_screen(app, pilot, task)
+        await save(pilot, screen)
+
+    mock_task_manager.edit_task_full.assert_not_awaited()
+    assert results == [None]
+
+
+@pytest.mark.asyncio
+async def test_saving_sends_only_changed_fields(app, mock_task_manager):
+    from unittest.mock import AsyncMock
+
+    from textual.widgets import Input
+
+    task = await mock_task_manager.add_task(
+        "Edited", "develop", description="notes", tags=["home"]
+    )
+    edit_task_full = AsyncMock(wraps=mock_task_manager.edit_task_full)
+    mock_task_manager.edit_task_full = edit_task_full
+
+    async with app.run_test() as pilot:
+        screen, results = await open_edit_screen(app, pilot, task)
+        screen.query_one("#priority", Input).value = "1"
+        await save(pilot, screen)
+
+    edit_task_full.assert_awaited_once_with(task.id, {"priority": 1}, "develop")
+    assert results[0].priority == 1
+    assert results[0].description == "notes"
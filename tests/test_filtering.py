@@ -1,3 +1,7 @@
+import asyncio
+import threading
+
+from lazytask.domain.fuzzy_match import FuzzyMatcher, RankingCancelled
 from lazytask.presentation.app import LazyTaskApp
 from lazytask.infrastructure.mock_task_manager import MockTaskManager
 
@@ -145,3 +149,96 @@ async def test_filtering_clears_when_switching_to_all_list_mode(
 
         assert len(tasks_list.children) == 1
         assert app.filter_query == ""
+
+
+async def test_filtering_ranks_best_matches_first(
+    app: LazyTaskApp, mock_task_manager: MockTaskManager
+):
+    """
+    Verify that the filter matches fuzzily and lists the best matches first,
+    ahead of the title sort order.
+    """
+    await mock_task_manager.add_task("Cleanup the repo")
+    await mock_task_manager.add_task("Report")
+    await mock_task_manager.add_task("Groceries")
+    await mock_task_manager.add_task("Read emails properly")
+
+    async with app.run_test() as pilot:
+        await app.update_tasks_list(filter_query="rep")
+        await pilot.pause()
+        titles = [item.data.title for item in app.query_one("ListView").children]
+
+        assert titles == ["Report", "Cleanup the repo", "Read emails properly"]
+
+
+async def test_filter_bar_narrows_while_typing(
+    app: LazyTaskApp, mock_task_manager: MockTaskManager
+):
+    """
+    Verify that the list narrows as the query is typed, without pressing enter,
+    and that escape clears the filter again.
+    """
+    await mock_task_manager.add_task("Write report")
+    await mock_task_manager.add_task("Call mom")
+    await mock_task_manager.add_task("Review report")
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        tasks_list = app.query_one("#tasks_list")
+        assert len(tasks_list.children) == 3
+
+        await pilot.press("/")
+        await pilot.press("r", "e", "p")
+        await pilot.pause(app.filter_debounce + 0.2)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert app.filter_query == "rep"
+        assert len(tasks_list.children) == 2
+        assert app.query_one("#filter_bar").has_focus
+
+        await pilot.press("escape")
+        await pilot.pause()
+        assert app.filter_query == ""
+        assert len(tasks_list.children) == 3
+        assert not app.query_one("#filter_bar").display
+        assert tasks_list.has_focus
+
+
+async def test_superseded_filter_stops_ranking(
+    app: LazyTaskApp, mock_task_manager: MockTaskManager, monkeypatch
+):
+    """
+    Verify that a ranking still running in its thread stops once a newer
+    refresh replaces the one that started it.
+    """
+    await mock_task_manager.add_task("Report")
+    await mock_task_manager.add_task("Call mom")
+    ranking = threading.Event()
+    release = threading.Event()
+    stopped = threading.Event()
+    rank = FuzzyMatcher.rank
+
+    def slow_rank(self, tasks, query, cancelled=None):
+        ranking.set()
+        release.wait(2)
+        try:
+            return rank(self, tasks, query, cancelled)
+        except RankingCancelled:
+            stopped.set()
+            raise
+
+    monkeypatch.setattr(FuzzyMatcher, "rank", slow_rank)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        filtering = asyncio.create_task(
+            app.update_tasks_list(filter_query="rep", refetch=False)
+        )
+        assert await asyncio.to_thread(ranking.wait, 2)
+
+        await app.update_tasks_list(filter_query="", refetch=False)
+        release.set()
+        assert await asyncio.to_thread(stopped.wait, 2)
+        await filtering
+        await pilot.pause()
+        titles = [item.data.title for item in app.query_one("ListView").children]
+        assert sorted(titles) == ["Call mom", "Report"]
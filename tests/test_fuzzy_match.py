@@ -0,0 +1,114 @@
+import pytest
+
+from lazytask.domain.fuzzy_match import MATCH_LIMIT, FuzzyMatcher, RankingCancelled
+from lazytask.domain.task import Task
+from lazytask.presentation.task_view_model import TaskViewModel
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+def rank(titles, query, limit=MATCH_LIMIT):
+    tasks = [Task(id=title, title=title) for title in titles]
+    return ids(FuzzyMatcher(limit).rank(tasks, query))
+
+
+def test_rank_requires_characters_in_order():
+    assert rank(["Write report", "trw"], "wrt") == ["Write report"]
+    assert rank(["write report"], "WRT") == ["write report"]
+    # Punctuation in the query matches any punctuation or space.
+    assert rank(["follow-up call", "followup"], "follow up") == ["follow-up call"]
+    assert rank(["b", "a"], "") == ["b", "a"]
+
+
+def test_rank_prefers_word_starts_runs_and_matching_case():
+    # Word starts beat matches inside a word.
+    assert rank(["sharp", "read papers"], "rp") == ["read papers", "sharp"]
+    # A contiguous run beats the same characters spread out.
+    assert rank(["pxoxrxt", "export"], "port") == ["export", "pxoxrxt"]
+    # A run at a word start beats one inside a word.
+    assert rank(["export", "portal"], "port") == ["portal", "export"]
+    # The same case scores higher, but other cases still match.
+    assert rank(["report", "Report"], "Re") == ["Report", "report"]
+    assert rank(["Report", "report"], "re") == ["Report", "report"]
+    # Shorter gaps beat longer ones.
+    assert rank(["a....b", "a..b"], "ab") == ["a..b", "a....b"]
+
+
+def test_rank_orders_by_score_then_length_then_position():
+    tasks = [
+        Task(id="1", title="Cleanup the repo"),
+        Task(id="2", title="Report"),
+        Task(id="3", title="Groceries"),
+        Task(id="4", title="Reply"),
+        Task(id="5", title="Report"),
+    ]
+
+    ranked = FuzzyMatcher().rank(tasks, "rep")
+
+    # Equal scores go to the shorter title first.
+    assert [task.id for task in ranked] == ["4", "2", "5", "1"]
+
+
+def test_rank_returns_only_the_best_matches():
+    titles = ["xrayx", "report", "order", "rx", "r"]
+
+    assert rank(titles, "r", limit=2) == ["r", "rx"]
+    # Runs at word starts outscore everything else, so there is no need to
+    # score the rest once there are enough of them.
+    assert rank(titles, "r", limit=3) == ["r", "rx", "report"]
+    assert rank(titles, "r", limit=4) == ["r", "rx", "report", "xrayx"]
+
+
+def test_rank_narrows_from_the_previous_query():
+    tasks = [Task(id="1", title="alpha"), Task(id="2", title="beta")]
+    matcher = FuzzyMatcher()
+    assert ids(matcher.rank(tasks, "a")) == ["1", "2"]
+    assert ids(matcher.rank(tasks, "al")) == ["1"]
+
+    # "beta" was ruled out for "al", so a longer query doesn't look at it again,
+    # and deleting a character returns the earlier ranking.
+    tasks[1].title = "alp"
+    assert ids(matcher.rank(tasks, "alp")) == ["1"]
+    assert ids(matcher.rank(tasks, "a")) == ["1", "2"]
+
+    matcher.reset()
+    assert ids(matcher.rank(tasks, "alp")) == ["2", "1"]
+    # Different tasks start over, too.
+    assert ids(matcher.rank(tasks[:1], "alp")) == ["1"]
+
+
+def test_rank_stops_once_cancelled():
+    tasks = [Task(id=str(index), title=f"task {index}") for index in range(10_000)]
+    matcher = FuzzyMatcher()
+    checks = []
+
+    def cancelled():
+        checks.append(True)
+        return len(checks) > 1
+
+    with pytest.raises(RankingCancelled):
+        matcher.rank(tasks, "task", cancelled)
+    # It stopped before searching the second chunk of titles.
+    assert len(checks) == 2
+
+    # The matcher is still usable.
+    assert ids(matcher.rank(tasks, "task 9999")) == ["9999"]
+
+
+def test_view_model_matching_follows_replaced_tasks():
+    model = TaskViewModel()
+    task = Task(id="1", title="Draft", list_name="develop")
+    model.store("develop", [task], include_completed=False)
+    assert model.matching([task], "DRFT") == [task]
+
+    renamed = Task(id="1", title="Final", list_name="develop")
+    previous = model.apply("1", renamed)
+    tasks = model.tasks("develop", include_completed=False)
+    assert model.matching(tasks, "fin") == [renamed]
+    assert model.matching(tasks, "draft") == []
+
+    model.restore("1", previous)
+    tasks = model.tasks("develop", include_completed=False)
+    assert model.matching(tasks, "draft") == [task]
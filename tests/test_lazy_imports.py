@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_app_import_defers_screens():
+    loaded = run_python(
+        "import sys, lazytask.presentation.app; "
+        "print(sorted(m for m in ('pendulum', 'textual_datepicker', "
+        "'lazytask.presentation.edit_screen') if m in sys.modules))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_container_is_built_on_first_use():
+    output = run_python(
+        "from lazytask.container import container, DependencyContainer; "
+        "print(container._container is None); "
+        "container.get_lists; "
+        "print(isinstance(container._container, DependencyContainer))"
+    )
+
+    assert output.splitlines() == ["True", "True"]
@@ -0,0 +1,58 @@
+from typing import cast
+
+import pytest
+from textual.widgets import Label, ListView
+
+from lazytask.presentation.app import TaskListItem
+
+
+def rows(app) -> list[TaskListItem]:
+    return [cast(TaskListItem, item) for item in app.query_one(ListView).children]
+
+
+@pytest.mark.asyncio
+async def test_refresh_reuses_rows_by_task_id(app, mock_task_manager):
+    first = await mock_task_manager.add_task("Alpha", "develop")
+    second = await mock_task_manager.add_task("Beta", "develop")
+    await mock_task_manager.add_task("Gamma", "develop")
+
+    async with app.run_test() as pilot:
+        app.sort_by = "title"
+        await app.update_tasks_list()
+        await pilot.pause()
+        before = {item.data.id: item for item in rows(app)}
+
+        await mock_task_manager.edit_task_priority(second.id, 1, "develop")
+        await mock_task_manager.complete_task(first.id, "develop")
+        added = await mock_task_manager.add_task("Delta", "develop")
+        await app.update_tasks_list()
+        await pilot.pause()
+
+        after = rows(app)
+        assert [item.data.title for item in after] == ["Beta", "Delta", "Gamma"]
+        assert after[0] is before[second.id]
+        assert after[2] is before[after[2].data.id]
+        assert first.id not in [item.data.id for item in after]
+        assert after[1].data.id == added.id
+        assert "prio: 1" in str(after[0].query_one("#task-title", Label).render())
+
+
+@pytest.mark.asyncio
+async def test_reordering_moves_existing_rows(app, mock_task_manager):
+    for title in ("Alpha", "Beta", "Gamma"):
+        await mock_task_manager.add_task(title, "develop")
+
+    async with app.run_test() as pilot:
+        app.sort_by = "title"
+        await app.update_tasks_list()
+        await pilot.pause()
+        before = rows(app)
+
+        app.sort_reverse = True
+        await app.update_tasks_list()
+        await pilot.pause()
+
+        after = rows(app)
+        assert [item.data.title for item in after] == ["Gamma", "Beta", "Alpha"]
+        assert after == list(reversed(before))
+        assert all(a is b for a, b in zip(after, reversed(before)))
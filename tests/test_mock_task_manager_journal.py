@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from lazytask.infrastructure.mock_task_manager import MockTaskManager
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / "journal_tasks.json"
+
+
+def read_journal(snapshot_path) -> list[dict]:
+    journal_path = f"{snapshot_path}.journal"
+    with open(journal_path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.mark.asyncio
+async def test_mutations_append_records_instead_of_rewriting_snapshot(snapshot_path):
+    manager = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    task = await manager.add_task("Journaled")
+    await manager.complete_task(task.id)
+
+    assert not snapshot_path.exists()
+    assert [record["op"] for record in read_journal(snapshot_path)] == ["put", "put"]
+
+
+@pytest.mark.asyncio
+async def test_reload_replays_snapshot_and_journal_tail(snapshot_path):
+    manager = MockTaskManager(
+        file_path=str(snapshot_path), use_journal=True, compact_threshold=2
+    )
+    first = await manager.add_task("Folded into snapshot")
+    await manager.add_task("Also folded")
+    moved = await manager.add_task("Still in journal")
+    await manager.move_task(moved.id, "develop", "develop2")
+    await manager.complete_task(first.id)
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+
+    develop_titles = sorted(
+        task.title
+        for task in await reloaded.get_tasks("develop", include_completed=True)
+    )
+    assert develop_titles == ["Also folded", "Folded into snapshot"]
+    assert [task.title for task in await reloaded.get_tasks("develop2")] == [
+        "Still in journal"
+    ]
+    assert (await reloaded.get_task(first.id)).completed is True
+
+
+@pytest.mark.asyncio
+async def test_compaction_folds_journal_into_snapshot(snapshot_path):
+    manager = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await manager.add_task("Task 1")
+    await manager.add_task("Task 2")
+
+    manager.compact()
+
+    assert read_journal(snapshot_path) == []
+    with open(snapshot_path) as f:
+        assert len(json.load(f)["develop"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_truncated_final_record_is_ignored(snapshot_path):
+    manager = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await manager.add_task("Survives")
+    with open(f"{snapshot_path}.journal", "a") as f:
+        f.write('{"op":"put","list":"develop","task":{"id"')
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+
+    assert [task.title for task in await reloaded.get_tasks()] == ["Survives"]
+
+
+@pytest.mark.asyncio
+async def test_appends_after_truncated_record_survive_reload(snapshot_path):
+    manager = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await manager.add_task("Survives")
+    with open(f"{snapshot_path}.journal", "a") as f:
+        f.write('{"op":"put","list":"develop","task":{"id"')
+
+    reopened = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await reopened.add_task("First after crash")
+    await reopened.add_task("Second after crash")
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    assert [task.title for task in await reloaded.get_tasks()] == [
+        "Survives",
+        "First after crash",
+        "Second after crash",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_final_record_without_newline_is_kept(snapshot_path):
+    manager = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await manager.add_task("Unterminated")
+    journal_path = f"{snapshot_path}.journal"
+    with open(journal_path) as f:
+        journal = f.read()
+    with open(journal_path, "w") as f:
+        f.write(journal.rstrip("\n"))
+
+    reopened = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await reopened.add_task("Next")
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    assert [task.title for task in await reloaded.get_tasks()] == [
+        "Unterminated",
+        "Next",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_clear_is_replayed(snapshot_path):
+    manager = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    await manager.add_task("Gone after clear")
+    await manager.clear_tasks()
+    await manager.add_task("Kept")
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+
+    assert [task.title for task in await reloaded.get_tasks()] == ["Kept"]
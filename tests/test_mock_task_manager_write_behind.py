@@ -0,0 +1,94 @@
+import json
+import time
+
+import pytest
+
+from lazytask.container import container
+from lazytask.infrastructure.mock_task_manager import MockTaskManager
+from lazytask.presentation.app import LazyTaskApp
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / "write_behind_tasks.json"
+
+
+def read_titles(snapshot_path) -> list[str]:
+    with open(snapshot_path) as f:
+        data = json.load(f)
+    return sorted(task["title"] for tasks in data.values() for task in tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_mutations_are_not_written_synchronously(snapshot_path):
+    manager = MockTaskManager(
+        file_path=str(snapshot_path), write_behind=True, write_behind_delay=60
+    )
+    await manager.add_task("Buffered")
+
+    assert not snapshot_path.exists()
+    manager.flush()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_coalesced_mutations(snapshot_path):
+    manager = MockTaskManager(
+        file_path=str(snapshot_path), write_behind=True, write_behind_delay=60
+    )
+    first = await manager.add_task("Task 1")
+    await manager.add_task("Task 2")
+    await manager.complete_task(first.id)
+
+    manager.flush()
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path))
+    assert read_titles(snapshot_path) == ["Task 1", "Task 2"]
+    assert (await reloaded.get_task(first.id)).completed is True
+
+
+@pytest.mark.asyncio
+async def test_background_thread_writes_after_window(snapshot_path):
+    manager = MockTaskManager(
+        file_path=str(snapshot_path), write_behind=True, write_behind_delay=0.01
+    )
+    await manager.add_task("Written in background")
+
+    deadline = time.monotonic() + 2
+    while not snapshot_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert read_titles(snapshot_path) == ["Written in background"]
+
+
+@pytest.mark.asyncio
+async def test_write_behind_with_journal_flushes_pending_records(snapshot_path):
+    manager = MockTaskManager(
+        file_path=str(snapshot_path),
+        use_journal=True,
+        write_behind=True,
+        write_behind_delay=60,
+    )
+    await manager.add_task("Journaled later")
+    manager.flush()
+
+    reloaded = MockTaskManager(file_path=str(snapshot_path), use_journal=True)
+    assert [task.title for task in await reloaded.get_tasks()] == ["Journaled later"]
+
+
+@pytest.mark.asyncio
+async def test_app_flushes_pending_writes_on_exit(
+    snapshot_path, description_editor_stub, monkeypatch
+):
+    monkeypatch.setenv("LAZYTASK_LISTS", "develop")
+    manager = MockTaskManager(
+        file_path=str(snapshot_path), write_behind=True, write_behind_delay=60
+    )
+    container.set_task_manager(manager)
+    app = LazyTaskApp()
+
+    async with app.run_test() as pilot:
+        await app.add_task("Saved on exit")
+        await pilot.pause()
+        assert not snapshot_path.exists()
+
+    assert read_titles(snapshot_path) == ["Saved on exit"]
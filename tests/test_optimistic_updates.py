@@ -0,0 +1,186 @@
+import asyncio
+import dataclasses
+import datetime
+
+import pytest
+from textual.widgets import ListView
+
+
+def listed(app) -> list:
+    return [item.data for item in app.query_one(ListView).children]
+
+
+async def settle(app, pilot) -> None:
+    await asyncio.gather(*app._pending_commits)
+    await pilot.pause()
+
+
+@pytest.mark.asyncio
+async def test_complete_shows_before_backend_finishes(app, mock_task_manager):
+    first = await mock_task_manager.add_task("First", "develop")
+    await mock_task_manager.add_task("Second", "develop")
+    app.optimistic_updates = True
+    release = asyncio.Event()
+    complete_task = mock_task_manager.complete_task
+
+    async def slow_complete(task_id, list_name="develop"):
+        await release.wait()
+        return await complete_task(task_id, list_name)
+
+    mock_task_manager.complete_task = slow_complete
+
+    async with app.run_test() as pilot:
+        app.query_one(ListView).index = 0
+        await pilot.press("c")
+        await pilot.pause()
+
+        assert [task.title for task in listed(app)] == ["Second"]
+        assert not (await mock_task_manager.get_task(first.id, "develop")).completed
+
+        release.set()
+        await settle(app, pilot)
+        assert (await mock_task_manager.get_task(first.id, "develop")).completed
+        assert [task.title for task in listed(app)] == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_rolls_back_and_notifies(app, mock_task_manager):
+    await mock_task_manager.add_task("Stays", "develop")
+    app.optimistic_updates = True
+    notifications = []
+    app.notify = lambda message, **kwargs: notifications.append(message)
+
+    async def failing_complete(task_id, list_name="develop"):
+        raise RuntimeError("backend down")
+
+    mock_task_manager.complete_task = failing_complete
+
+    async with app.run_test() as pilot:
+        app.query_one(ListView).index = 0
+        await pilot.press("c")
+        await settle(app, pilot)
+
+        assert [task.title for task in listed(app)] == ["Stays"]
+        assert not listed(app)[0].completed
+        assert notifications == ["Could not complete 'Stays': backend down"]
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_keeps_overlapping_successful_update(
+    app, mock_task_manager
+):
+    await mock_task_manager.add_task("Fails", "develop")
+    second = await mock_task_manager.add_task("Succeeds", "develop")
+    await mock_task_manager.add_task("Untouched", "develop")
+    app.optimistic_updates = True
+    app.notify = lambda message, **kwargs: None
+    release = asyncio.Event()
+    get_task = mock_task_manager.get_task
+
+    async def complete(task_id, list_name="develop"):
+        if task_id == second.id:
+            # Hand back a copy, like sqlite does, so the view's old object stays
+            # uncompleted.
+            return dataclasses.replace(
+                await get_task(task_id, list_name), completed=True
+            )
+        await release.wait()
+        raise RuntimeError("backend down")
+
+    mock_task_manager.complete_task = complete
+
+    async with app.run_test() as pilot:
+        app.query_one(ListView).index = 0
+        await pilot.press("c")
+        await pilot.pause()
+        assert [task.title for task in listed(app)] == ["Succeeds", "Untouched"]
+
+        app.query_one(ListView).index = 0
+        await pilot.press("c")
+        await pilot.pause()
+        assert [task.title for task in listed(app)] == ["Untouched"]
+
+        release.set()
+        await settle(app, pilot)
+        assert [task.title for task in listed(app)] == ["Fails", "Untouched"]
+
+
+@pytest.mark.asyncio
+async def test_due_date_change_adopts_recreated_task_id(app, mock_task_manager):
+    task = await mock_task_manager.add_task("Recreated", "develop")
+    app.optimistic_updates = True
+    today = datetime.date.today()
+
+    async def recreating_edit(task_id, updates, list_name="develop"):
+        return dataclasses.replace(task, id="new-id", due_date=updates["due_date"])
+
+    mock_task_manager.edit_task_full = recreating_edit
+
+    async with app.run_test() as pilot:
+        app.query_one(ListView).index = 0
+        await pilot.press("t")
+        await settle(app, pilot)
+
+        assert [(t.id, t.due_date) for t in listed(app)] == [("new-id", today)]
+        assert app.query_one(ListView).highlighted_child.data.id == "new-id"
+
+
+@pytest.mark.asyncio
+async def test_refetch_during_commit_keeps_optimistic_update(app, mock_task_manager):
+    first = await mock_task_manager.add_task("First", "develop")
+    await mock_task_manager.add_task("Second", "develop")
+    app.optimistic_updates = True
+    release = asyncio.Event()
+    complete_task = mock_task_manager.complete_task
+
+    async def slow_complete(task_id, list_name="develop"):
+        await release.wait()
+        return await complete_task(task_id, list_name)
+
+    mock_task_manager.complete_task = slow_complete
+
+    async with app.run_test() as pilot:
+        app.query_one(ListView).index = 0
+        await pilot.press("c")
+        await pilot.pause()
+
+        # The backend still has the task open, but the commit is under way.
+        await app.update_tasks_list()
+        await pilot.pause()
+        assert [task.title for task in listed(app)] == ["Second"]
+
+        release.set()
+        await settle(app, pilot)
+        assert (await mock_task_manager.get_task(first.id, "develop")).completed
+        assert [task.title for task in listed(app)] == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_commit_without_a_task_refetches(app, mock_task_manager):
+    await mock_task_manager.add_task("First", "develop")
+    await mock_task_manager.add_task("Second", "develop")
+    app.optimistic_updates = True
+    complete_task = mock_task_manager.complete_task
+    get_tasks = mock_task_manager.get_tasks
+    fetches = []
+
+    async def complete_without_task(task_id, list_name="develop"):
+        # Like reminders-cli, which prints nothing for complete.
+        await complete_task(task_id, list_name)
+        return None
+
+    async def counting_get_tasks(*args, **kwargs):
+        fetches.append(args)
+        return await get_tasks(*args, **kwargs)
+
+    mock_task_manager.complete_task = complete_without_task
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        mock_task_manager.get_tasks = counting_get_tasks
+        app.query_one(ListView).index = 0
+        await pilot.press("c")
+        await settle(app, pilot)
+
+        assert fetches
+        assert [task.title for task in listed(app)] == ["Second"]
@@ -0,0 +1,152 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.widgets import ListView
+
+from lazytask.domain.task import Task
+
+
+@pytest.mark.asyncio
+async def test_newer_refresh_cancels_the_one_in_flight(make_app):
+    app = make_app("slow,fast")
+    release_slow = asyncio.Event()
+    slow_started = asyncio.Event()
+    slow_cancelled = False
+
+    async def get_tasks(list_name, include_completed=False):
+        nonlocal slow_cancelled
+        if list_name == "slow":
+            slow_started.set()
+            try:
+                await release_slow.wait()
+            except asyncio.CancelledError:
+                slow_cancelled = True
+                raise
+        return [Task(id=list_name, title=f"Task {list_name}", list_name=list_name)]
+
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks)
+
+    release_slow.set()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        release_slow.clear()
+        slow_started.clear()
+
+        app.current_list = "slow"
+        superseded = asyncio.create_task(app.update_tasks_list())
+        await slow_started.wait()
+        app.current_list = "fast"
+        await app.update_tasks_list()
+        await superseded
+        await pilot.pause()
+
+        assert slow_cancelled
+        assert [item.data.id for item in app.query_one(ListView).children] == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_superseded_refresh_leaves_the_loading_indicator_hidden(make_app):
+    app = make_app("slow,fast")
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(return_value=[])
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        never = asyncio.Event()
+
+        async def get_tasks_forever(list_name, include_completed=False):
+            await never.wait()
+
+        app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks_forever)
+
+        app.current_list = "slow"
+        superseded = asyncio.create_task(app.update_tasks_list())
+        await pilot.pause()
+        app.current_list = "all"
+        await app.update_tasks_list(refetch=False)
+        await superseded
+
+        assert not app.query_one("#tasks_loading").display
+
+
+@pytest.mark.asyncio
+async def test_superseded_fetch_keeps_the_loading_indicator_for_the_newer_one(
+    make_app,
+):
+    app = make_app("slow,fast")
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(return_value=[])
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def get_tasks(list_name, include_completed=False):
+            started.append(list_name)
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                # Like a backend waiting for its subprocess to exit, the
+                # superseded fetch finishes after the newer one has started.
+                await asyncio.sleep(0.1)
+                raise
+            return []
+
+        app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks)
+
+        app.current_list = "slow"
+        superseded = asyncio.create_task(app.update_tasks_list())
+        await pilot.pause()
+        app.current_list = "fast"
+        newer = asyncio.create_task(app.update_tasks_list())
+        await superseded
+        await pilot.pause()
+
+        assert started == ["slow", "fast"]
+        assert app.query_one("#tasks_loading").display
+        release.set()
+        await newer
+        assert not app.query_one("#tasks_loading").display
+
+
+@pytest.mark.asyncio
+async def test_superseding_refresh_keeps_the_pending_refetch(make_app):
+    app = make_app("slow,fast")
+    backend = {"fast": ["one", "two"]}
+    release = asyncio.Event()
+
+    async def get_tasks(list_name, include_completed=False):
+        await release.wait()
+        # Fresh copies on every call, like the sqlite and reminders backends.
+        return [
+            Task(id=task_id, title=task_id, list_name=list_name)
+            for task_id in backend[list_name]
+        ]
+
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks)
+
+    release.set()
+    async with app.run_test() as pilot:
+        app.current_list = "fast"
+        await app.update_tasks_list()
+        await pilot.pause()
+        release.clear()
+
+        # The backend completed "one"; refetch, but rerender before it returns.
+        backend["fast"] = ["two"]
+        refetching = asyncio.create_task(app.update_tasks_list())
+        await pilot.pause()
+        rerender = asyncio.create_task(app.update_tasks_list(refetch=False))
+        await pilot.pause()
+        release.set()
+        await asyncio.gather(refetching, rerender)
+        await pilot.pause()
+
+        assert [item.data.id for item in app.query_one(ListView).children] == ["two"]
+        app.get_tasks_uc.execute.reset_mock()
+        await app.update_tasks_list(refetch=False)
+        app.get_tasks_uc.execute.assert_not_awaited()
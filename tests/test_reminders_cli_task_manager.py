@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 from typing import Any, Dict, List
 
@@ -298,3 +299,254 @@ def test_reminders_cli_parse_handles_zulu_datetime():
 
     assert task.due_date == datetime.date(2024, 9, 7)
     assert task.creation_date is not None
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_get_tasks_for_lists_uses_single_show_all(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    manager = RemindersCliTaskManager()
+    commands: List[List[str]] = []
+
+    async def fake_run_cli_command(self, command: List[str]) -> Any:
+        commands.append(command)
+        return [
+            {"externalId": "1", "title": "Develop task", "list": "develop"},
+            {"externalId": "2", "title": "Other list task", "list": "shopping"},
+            {"externalId": "3", "title": "Develop 2 task", "list": "develop2"},
+            {"externalId": "4", "title": "Another develop task", "list": "develop"},
+        ]
+
+    monkeypatch.setattr(
+        RemindersCliTaskManager, "_run_cli_command", fake_run_cli_command
+    )
+
+    tasks_by_list = await manager.get_tasks_for_lists(
+        ["develop2", "develop", "empty"], include_completed=True
+    )
+
+    assert commands == [["show-all", "--format", "json", "--include-completed"]]
+    assert {
+        list_name: [task.id for task in tasks]
+        for list_name, tasks in tasks_by_list.items()
+    } == {"develop2": ["3"], "develop": ["1", "4"], "empty": []}
+    assert list(tasks_by_list) == ["develop2", "develop", "empty"]
+
+
+def _install_recording_cli(
+    monkeypatch: pytest.MonkeyPatch, original_task: Task
+) -> List[List[str]]:
+    commands: List[List[str]] = []
+
+    async def fake_get_tasks(
+        self, list_name: str = "develop", include_completed: bool = False
+    ) -> List[Task]:
+        commands.append(["show", list_name])
+        return [original_task]
+
+    async def fake_run_cli_command(self, command: List[str]) -> Dict[str, Any]:
+        commands.append(command)
+        if command[0] == "add":
+            return {"externalId": "new-id", "title": command[2], "list": command[1]}
+        return {}
+
+    monkeypatch.setattr(RemindersCliTaskManager, "get_tasks", fake_get_tasks)
+    monkeypatch.setattr(
+        RemindersCliTaskManager, "_run_cli_command", fake_run_cli_command
+    )
+    return commands
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_edit_task_full_recreates_once(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    original_task = Task(
+        id="task-id",
+        title="Edit me",
+        list_name="develop",
+        description="Old notes",
+        due_date=datetime.date(2024, 8, 20),
+        priority=0,
+    )
+    commands = _install_recording_cli(monkeypatch, original_task)
+
+    updated_task = await RemindersCliTaskManager().edit_task_full(
+        "task-id",
+        {
+            "description": "New notes",
+            "priority": 1,
+            "due_date": datetime.date(2024, 9, 1),
+            "tags": [""],
+            "is_flagged": False,
+        },
+        "develop",
+    )
+
+    assert commands == [
+        ["show", "develop"],
+        [
+            "add",
+            "develop",
+            "Edit me",
+            "--format",
+            "json",
+            "--due-date",
+            "2024-09-01",
+            "--notes",
+            "New notes",
+            "--priority",
+            "high",
+        ],
+        ["delete", "develop", "task-id"],
+    ]
+    assert updated_task.id == "new-id"
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_edit_task_full_uses_edit_for_notes_only(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    original_task = Task(
+        id="task-id",
+        title="Edit me",
+        list_name="develop",
+        description="Old notes",
+        due_date=datetime.date(2024, 8, 20),
+        priority=1,
+    )
+    commands = _install_recording_cli(monkeypatch, original_task)
+
+    updated_task = await RemindersCliTaskManager().edit_task_full(
+        "task-id",
+        {"description": "New notes", "priority": 1, "due_date": "2024-08-20"},
+        "develop",
+    )
+
+    assert commands == [
+        ["show", "develop"],
+        ["edit", "develop", "task-id", "--notes", "New notes"],
+    ]
+    assert (updated_task.id, updated_task.description) == ("task-id", "New notes")
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_edit_task_full_skips_unchanged_fields(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    original_task = Task(
+        id="task-id",
+        title="Edit me",
+        list_name="develop",
+        due_date=datetime.date(2024, 8, 20),
+    )
+    commands = _install_recording_cli(monkeypatch, original_task)
+
+    updated_task = await RemindersCliTaskManager().edit_task_full(
+        "task-id",
+        {"description": "", "priority": None, "due_date": datetime.date(2024, 8, 20)},
+        "develop",
+    )
+
+    assert commands == [["show", "develop"]]
+    assert updated_task is original_task
+
+
+def _install_show_cli(
+    monkeypatch: pytest.MonkeyPatch, reminders: List[Dict[str, Any]]
+) -> List[List[str]]:
+    commands: List[List[str]] = []
+
+    async def fake_run_cli_command(self, command: List[str]) -> Any:
+        commands.append(command)
+        if command[0] == "show":
+            return reminders
+        return {}
+
+    monkeypatch.setattr(
+        RemindersCliTaskManager, "_run_cli_command", fake_run_cli_command
+    )
+    return commands
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_get_task_uses_index_after_list_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    commands = _install_show_cli(
+        monkeypatch,
+        [
+            {"externalId": "a", "title": "First", "list": "develop"},
+            {"externalId": "b", "title": "Second", "list": "develop"},
+        ],
+    )
+    manager = RemindersCliTaskManager()
+
+    await manager.get_tasks("develop")
+    task = await manager.get_task("b", "develop")
+
+    assert task is not None and task.title == "Second"
+    assert commands == [["show", "develop", "--format", "json"]]
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_get_task_fetches_once_when_cold(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    commands = _install_show_cli(
+        monkeypatch, [{"externalId": "a", "title": "First", "list": "develop"}]
+    )
+    manager = RemindersCliTaskManager()
+
+    assert (await manager.get_task("a", "develop")).title == "First"
+    assert (await manager.get_task("a", "develop")).title == "First"
+    assert await manager.get_task("missing", "develop") is None
+
+    show = ["show", "develop", "--format", "json", "--include-completed"]
+    assert commands == [show, show]
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_edit_description_patches_indexed_task(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    commands = _install_show_cli(
+        monkeypatch, [{"externalId": "a", "title": "First", "list": "develop"}]
+    )
+    manager = RemindersCliTaskManager()
+    await manager.get_tasks("develop")
+
+    updated_task = await manager.edit_task_description("a", "notes", "develop")
+
+    assert updated_task.description == "notes"
+    assert (await manager.get_task("a", "develop")).description == "notes"
+    assert commands[1:] == [["edit", "develop", "a", "--notes", "notes"]]
+
+
+@pytest.mark.asyncio
+async def test_reminders_cli_batches_run_with_bounded_concurrency(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_run_cli_command(self, command: List[str]) -> Any:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if command[2] == "bad":
+            raise Exception("CLI command failed with error: No reminder 'bad'")
+        return {}
+
+    monkeypatch.setattr(
+        RemindersCliTaskManager, "_run_cli_command", fake_run_cli_command
+    )
+    manager = RemindersCliTaskManager(batch_concurrency=2)
+
+    results = await manager.complete_tasks(["1", "bad", "3", "4", "5"], "develop")
+
+    assert max_in_flight == 2
+    assert [result.ok for result in results] == [True, False, True, True, True]
+    assert "No reminder 'bad'" in str(results[1].error)
@@ -0,0 +1,129 @@
+import asyncio
+import datetime
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lazytask.infrastructure.reminders_cli_task_manager import (
+    RemindersCliTaskManager,
+)
+from lazytask.infrastructure.reminders_cli_worker import RemindersCliWorker
+
+FAKE_WORKER = Path(__file__).with_name("fake_reminders_worker.py")
+
+
+@pytest.fixture
+async def worker():
+    worker = RemindersCliWorker([sys.executable, str(FAKE_WORKER), "develop,other"])
+    yield worker
+    await worker.close()
+
+
+@pytest.mark.asyncio
+async def test_task_manager_round_trips_through_worker(worker):
+    manager = RemindersCliTaskManager(worker=worker)
+
+    added = await manager.add_task("From worker", "develop", description="notes")
+    tasks = await manager.get_tasks("develop")
+
+    assert [(task.id, task.title, task.description) for task in tasks] == [
+        (added.id, "From worker", "notes")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_requests_share_one_process(worker):
+    manager = RemindersCliTaskManager(worker=worker)
+
+    added = await asyncio.gather(
+        *(manager.add_task(f"Task {index}", "develop") for index in range(20))
+    )
+
+    assert [task.title for task in added] == [f"Task {index}" for index in range(20)]
+    assert len({task.id for task in added}) == 20
+    assert worker.restarts == 0
+
+
+@pytest.mark.asyncio
+async def test_command_errors_are_reported_per_request(worker):
+    manager = RemindersCliTaskManager(worker=worker)
+
+    with pytest.raises(Exception, match="CLI command failed with error: No reminders"):
+        await manager.get_tasks("missing")
+    assert await manager.get_lists() == ["develop", "other"]
+
+
+@pytest.mark.asyncio
+async def test_worker_restarts_after_crash(worker):
+    with pytest.raises(RuntimeError, match="worker exited with code 3"):
+        await worker.request(["crash"])
+
+    assert await worker.request(["show-lists", "--format", "json"]) == (
+        '["develop", "other"]'
+    )
+    assert worker.restarts == 1
+
+
+@pytest.mark.asyncio
+async def test_unanswered_request_times_out(worker):
+    worker.timeout = 0.2
+
+    with pytest.raises(RuntimeError, match="didn't answer command"):
+        await worker.request(["hang"])
+
+    assert worker._pending == {}
+    assert await worker.request(["show-lists", "--format", "json"]) == (
+        '["develop", "other"]'
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_fails_if_the_worker_exited_meanwhile(worker, monkeypatch):
+    process = await worker._ensure_started()
+    process.kill()
+    await worker._reader_task
+
+    # The process exits after _ensure_started handed it out but before the
+    # request is registered, so the reader has already failed what was pending.
+    # Writing to its stdin may still seem to work while the pipe drains.
+    async def ensure_started():
+        return process
+
+    monkeypatch.setattr(worker, "_ensure_started", ensure_started)
+    monkeypatch.setattr(process.stdin, "write", lambda data: None)
+    monkeypatch.setattr(process.stdin, "drain", AsyncMock())
+    with pytest.raises(RuntimeError, match="exited before accepting"):
+        await asyncio.wait_for(
+            worker.request(["show-lists", "--format", "json"]), timeout=2
+        )
+    assert worker._pending == {}
+
+
+@pytest.mark.asyncio
+async def test_task_manager_close_stops_the_worker(worker):
+    manager = RemindersCliTaskManager(worker=worker)
+    await manager.get_lists()
+    process = worker._process
+    assert process is not None
+
+    await manager.close()
+
+    assert process.returncode is not None
+
+
+@pytest.mark.asyncio
+async def test_filter_tasks_leaves_out_completed_tasks(worker):
+    manager = RemindersCliTaskManager(worker=worker)
+    today = datetime.date.today()
+    done = await manager.add_task("Done", "develop", due_date=today)
+    await manager.add_task("Open", "develop", due_date=today)
+    await manager.complete_task(done.id, "develop")
+
+    overdue = await manager.filter_tasks("develop", due_by=today)
+    assert [task.title for task in overdue] == ["Open"]
+    overdue = await manager.filter_tasks(
+        "develop", include_completed=True, due_by=today
+    )
+    assert [task.title for task in overdue] == ["Done", "Open"]
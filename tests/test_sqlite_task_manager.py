@@ -0,0 +1,144 @@
+import datetime
+import sys
+
+import pytest
+
+from lazytask.container import DependencyContainer
+from lazytask.domain.task import Task
+from lazytask.infrastructure.sqlite_task_manager import SqliteTaskManager
+
+
+@pytest.fixture
+def task_manager(tmp_path):
+    return SqliteTaskManager(str(tmp_path / "tasks.db"))
+
+
+@pytest.mark.asyncio
+async def test_tasks_persist_across_instances(tmp_path):
+    database_path = str(tmp_path / "tasks.db")
+    first = SqliteTaskManager(database_path)
+    added = await first.add_task(
+        "Persisted", due_date="2025-01-02", tags=["work"], priority=1
+    )
+
+    reloaded = await SqliteTaskManager(database_path).get_task(added.id)
+
+    assert (reloaded.title, reloaded.due_date, reloaded.tags, reloaded.priority) == (
+        "Persisted",
+        datetime.date(2025, 1, 2),
+        ["work"],
+        1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_excludes_completed_by_default(task_manager):
+    done = await task_manager.add_task("Done")
+    await task_manager.add_task("Open")
+    await task_manager.complete_task(done.id)
+
+    assert [task.title for task in await task_manager.get_tasks()] == ["Open"]
+    assert len(await task_manager.get_tasks(include_completed=True)) == 2
+
+
+@pytest.mark.asyncio
+async def test_filter_tasks_combines_predicates(task_manager):
+    await task_manager.add_task("Write report", tags=["work"], is_flagged=True)
+    await task_manager.add_task("Write letter", tags=["home"], is_flagged=True)
+    await task_manager.add_task("Read report", tags=["work"])
+    await task_manager.add_task("Other", description="report in notes", tags=["work"])
+
+    filtered = await task_manager.filter_tasks(
+        query="REPORT", tags=["work"], flagged=True
+    )
+
+    assert [task.title for task in filtered] == ["Write report"]
+
+
+@pytest.mark.asyncio
+async def test_filter_tasks_matches_description(task_manager):
+    await task_manager.add_task("Other", description="report in notes")
+
+    filtered = await task_manager.filter_tasks(query="report")
+
+    assert [task.title for task in filtered] == ["Other"]
+
+
+@pytest.mark.asyncio
+async def test_sort_tasks_puts_undated_last(task_manager):
+    await task_manager.add_task("Undated")
+    await task_manager.add_task("Later", due_date=datetime.date(2025, 2, 1))
+    await task_manager.add_task("Sooner", due_date=datetime.date(2025, 1, 1))
+
+    sorted_tasks = await task_manager.sort_tasks(sort_by="due_date")
+
+    assert [task.title for task in sorted_tasks] == ["Sooner", "Later", "Undated"]
+
+
+@pytest.mark.asyncio
+async def test_move_task_registers_target_list(task_manager):
+    task = await task_manager.add_task("Moving")
+
+    moved = await task_manager.move_task(task.id, "develop", "develop2")
+
+    assert moved.list_name == "develop2"
+    assert await task_manager.get_tasks("develop") == []
+    assert await task_manager.get_lists() == ["develop", "develop2"]
+
+
+@pytest.mark.asyncio
+async def test_moved_task_goes_to_the_end_of_its_new_list(task_manager):
+    moving = await task_manager.add_task("Moving")
+    await task_manager.add_task("Already there", "develop2")
+
+    await task_manager.move_task(moving.id, "develop", "develop2")
+    await task_manager.add_task("Added later", "develop2")
+
+    assert [task.title for task in await task_manager.get_tasks("develop2")] == [
+        "Already there",
+        "Moving",
+        "Added later",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_names_set_by_the_backend_are_interned(task_manager):
+    task = await task_manager.add_task("Moving")
+    moved = await task_manager.move_task(task.id, "develop", " backlog ")
+    assert moved.list_name is sys.intern("backlog")
+
+    added = await task_manager.add_task(
+        Task(id="", title="Added", list_name=" backlog ")
+    )
+    assert added.list_name is sys.intern("backlog")
+
+
+def test_list_query_uses_index(task_manager):
+    plan = task_manager._connection.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE list_name = ? AND completed = 0",
+        ("develop",),
+    ).fetchall()
+
+    assert "idx_tasks_list_completed" in " ".join(str(row["detail"]) for row in plan)
+
+
+def test_container_creates_sqlite_backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("LAZYTASK_TASK_MANAGER", "sqlite")
+    monkeypatch.setenv("LAZYTASK_SQLITE_PATH", str(tmp_path / "container.db"))
+
+    assert isinstance(DependencyContainer().task_manager, SqliteTaskManager)
+
+
+@pytest.mark.asyncio
+async def test_editing_a_task_keeps_its_position(task_manager):
+    first = await task_manager.add_task("First")
+    await task_manager.add_task("Second")
+    await task_manager.add_task("Third")
+
+    await task_manager.edit_task_full(first.id, {"title": "First, edited"})
+    tasks = await task_manager.get_tasks(include_completed=True)
+    assert [task.title for task in tasks] == ["First, edited", "Second", "Third"]
+
+    await task_manager.complete_task(first.id)
+    tasks = await task_manager.get_tasks(include_completed=True)
+    assert [task.title for task in tasks] == ["First, edited", "Second", "Third"]
@@ -0,0 +1,64 @@
+import datetime
+import json
+import sys
+
+from lazytask.domain.task import (
+    Task,
+    changed_fields,
+    set_task_field,
+    task_from_dict,
+    task_to_dict,
+)
+
+
+def test_task_is_slotted_and_compared_by_id():
+    task = Task(id="1", title="Old")
+    assert not hasattr(task, "__dict__")
+    assert task == Task(id="1", title="New")
+    assert task != Task(id="2", title="Old")
+    assert len({task, Task(id="1", title="New")}) == 1
+
+
+def test_task_interns_list_names_and_tags():
+    # Decoded from JSON, so the strings aren't shared to begin with.
+    first, second = json.loads(
+        '[{"id": "1", "title": "a", "list_name": "develop", "tags": ["work"]},'
+        ' {"id": "2", "title": "b", "list_name": "develop", "tags": ["work"]}]'
+    )
+    first, second = Task(**first), Task(**second)
+
+    assert first.tags == ["work"]
+    assert first.list_name is second.list_name
+    assert first.tags[0] is second.tags[0]
+    assert Task(id="3", title="c").tags == []
+
+
+def test_set_task_field_keeps_tags_interned():
+    task = Task(id="1", title="a", tags=["home"])
+    set_task_field(task, "tags", json.loads('["work"]'))
+    assert task.tags[0] is sys.intern("work")
+    set_task_field(task, "tags", None)
+    assert task.tags == []
+
+
+def test_changed_fields_compares_tags_as_stored():
+    task = Task(id="1", title="a", tags=["home"])
+    assert changed_fields(task, {"tags": ["home"], "title": "a"}) == {}
+    assert changed_fields(task, {"tags": ["work"]}) == {"tags": ["work"]}
+
+
+def test_task_dict_round_trip():
+    task = Task(
+        id="1",
+        title="a",
+        due_date=datetime.date(2025, 1, 2),
+        creation_date=datetime.datetime(2025, 1, 1, 9, 30),
+        list_name="develop",
+        tags=["work"],
+    )
+    task_dict = task_to_dict(task)
+    assert task_dict["tags"] == ["work"]
+    assert task_dict["due_date"] == "2025-01-02"
+
+    restored = task_from_dict(json.loads(json.dumps(task_dict)))
+    assert task_to_dict(restored) == task_dict
@@ -0,0 +1,115 @@
+import datetime
+
+import pytest
+
+from lazytask.domain.task import Task
+from lazytask.infrastructure.mock_task_manager import MockTaskManager
+from lazytask.infrastructure.task_index import IndexedTasks
+
+DAY = datetime.date(2024, 5, 10)
+
+
+def make_task(task_id, due_date=None, tags=None, is_flagged=False, completed=False):
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        due_date=due_date,
+        tags=tags or [],
+        is_flagged=is_flagged,
+        completed=completed,
+    )
+
+
+@pytest.fixture
+def tasks():
+    return IndexedTasks(
+        [
+            make_task("a", due_date=DAY, tags=["work"]),
+            make_task("b", due_date=DAY - datetime.timedelta(days=3), is_flagged=True),
+            make_task("c", due_date=DAY + datetime.timedelta(days=1), tags=["home"]),
+            make_task("d", tags=["work", "home"], completed=True),
+        ]
+    )
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+def test_due_by_is_inclusive(tasks):
+    assert tasks.candidate_ids(due_by=DAY) == {"a", "b"}
+    assert tasks.candidate_ids(due_by=datetime.date.max) == {"a", "b", "c"}
+
+
+def test_candidate_ids_combine_indexes(tasks):
+    assert tasks.candidate_ids(tags=["home"]) == {"c"}
+    assert tasks.candidate_ids(tags=["home"], include_completed=True) == {"c", "d"}
+    assert tasks.candidate_ids(flagged=True) == {"b"}
+    assert tasks.candidate_ids(flagged=False, due_by=DAY) == {"a"}
+    assert tasks.candidate_ids(tags=["missing"]) == set()
+
+
+def test_in_place_changes_are_picked_up_by_reindex(tasks):
+    task = tasks["c"]
+    task.due_date = DAY - datetime.timedelta(days=10)
+    task.tags = ["work"]
+    task.completed = True
+    tasks.reindex(task)
+
+    assert tasks.candidate_ids(due_by=DAY, include_completed=True) == {"a", "b", "c"}
+    assert tasks.candidate_ids(tags=["home"], include_completed=True) == {"d"}
+    assert ids(tasks.active_tasks()) == ["a", "b"]
+
+    task.completed = False
+    tasks.reindex(task)
+    assert ids(tasks.active_tasks()) == ["a", "b", "c"]
+
+
+def test_reopened_task_keeps_its_place(tasks):
+    tasks["a"].completed = True
+    tasks.reindex(tasks["a"])
+    assert ids(tasks.active_tasks()) == ["b", "c"]
+
+    tasks["a"].completed = False
+    tasks.reindex(tasks["a"])
+    tasks["d"] = make_task("d")
+    tasks["e"] = make_task("e")
+
+    # The same order as filtering the tasks in list order.
+    assert ids(tasks.active_tasks()) == ["a", "b", "c", "d", "e"]
+
+
+def test_removal_and_replacement_update_indexes(tasks):
+    tasks.pop("a")
+    del tasks["b"]
+    tasks["d"] = make_task("d", due_date=DAY)
+
+    assert ids(tasks.in_list_order(tasks.candidate_ids(due_by=DAY))) == ["d"]
+    assert tasks.candidate_ids(tags=["work"], include_completed=True) == set()
+    assert tasks.candidate_ids(flagged=True) == set()
+    assert ids(tasks.active_tasks()) == ["c", "d"]
+
+
+@pytest.mark.asyncio
+async def test_mock_filter_tasks_uses_indexes_after_edits():
+    task_manager = MockTaskManager(use_persistence=False)
+    late = await task_manager.add_task("Late", due_date=DAY)
+    later = await task_manager.add_task("Later", due_date=DAY + datetime.timedelta(1))
+    await task_manager.edit_task_tags(later.id, ["work"])
+    await task_manager.edit_task_flag(late.id, True)
+    await task_manager.move_task_to_tomorrow(late.id)
+
+    assert ids(await task_manager.filter_tasks(due_by=DAY)) == []
+    assert ids(await task_manager.filter_tasks(tags=["work"])) == [later.id]
+    assert ids(await task_manager.filter_tasks(flagged=True)) == [late.id]
+
+    await task_manager.complete_task(later.id)
+    assert ids(await task_manager.get_tasks()) == [late.id]
+    assert ids(await task_manager.filter_tasks(tags=["work"])) == []
+    assert ids(
+        await task_manager.filter_tasks(tags=["work"], include_completed=True)
+    ) == [later.id]
+
+    await task_manager.move_task(late.id, "develop", "other")
+    assert await task_manager.filter_tasks(flagged=True) == []
+    assert ids(await task_manager.filter_tasks("other", flagged=True)) == [late.id]
@@ -1,5 +1,7 @@
 import pytest
 import datetime
+import sys
+from lazytask.domain.task import Task
 from lazytask.infrastructure.mock_task_manager import MockTaskManager
 
 
@@ -138,3 +140,58 @@ async def test_list_names_are_trimmed(task_manager):
     lists = await task_manager.get_lists()
     assert "backlog" in lists
     assert all(name == name.strip() for name in lists)
+
+
+@pytest.mark.asyncio
+async def test_list_names_set_by_the_backend_are_interned(task_manager):
+    task = await task_manager.add_task("Moved Task")
+    moved = await task_manager.move_task(task.id, "develop", " backlog ")
+    assert moved.list_name is sys.intern("backlog")
+
+    added = await task_manager.add_task(
+        Task(id="", title="Added Task", list_name=" backlog ")
+    )
+    assert added.list_name is sys.intern("backlog")
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_for_lists_falls_back_to_get_tasks(task_manager):
+    await task_manager.add_task("Develop task", list_name="develop")
+    await task_manager.add_task("Backlog task", list_name="backlog")
+
+    tasks_by_list = await task_manager.get_tasks_for_lists(["backlog", "develop"])
+
+    assert {
+        list_name: [task.title for task in tasks]
+        for list_name, tasks in tasks_by_list.items()
+    } == {"backlog": ["Backlog task"], "develop": ["Develop task"]}
+
+
+@pytest.mark.asyncio
+async def test_batch_mutations_save_once(task_manager, monkeypatch):
+    writes = []
+    monkeypatch.setattr(task_manager, "_write", writes.append)
+
+    added = await task_manager.add_tasks(
+        [{"title": "One"}, {"title": "Two", "due_date": "2024-05-01"}]
+    )
+    completed = await task_manager.complete_tasks([added[0].task.id, "missing"])
+    edited = await task_manager.edit_tasks({added[1].task.id: {"priority": 1}})
+
+    assert [result.task.title for result in added] == ["One", "Two"]
+    assert added[1].task.due_date == datetime.date(2024, 5, 1)
+    assert completed[0].task.completed and completed[1].task is None
+    assert all(result.ok for result in completed)
+    assert edited[0].task.priority == 1
+    assert len(writes) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failures_per_item(task_manager):
+    results = await task_manager.add_tasks(
+        [{"title": "Good"}, {"title": "Bad", "due_date": "not a date"}]
+    )
+
+    assert results[0].ok and results[0].task.title == "Good"
+    assert isinstance(results[1].error, ValueError)
+    assert [task.title for task in await task_manager.get_tasks()] == ["Good"]
@@ -0,0 +1,41 @@
+import datetime
+
+from lazytask.domain.task import Task
+from lazytask.presentation.task_row import PALETTE, render_task_row
+
+
+def test_row_text_styles_each_part():
+    rendered = render_task_row(Task(id="1", title="Row", priority=1))
+
+    assert rendered.display_text.plain == "[ ] Row (prio: 1)"
+    assert [
+        (rendered.display_text.plain[span.start : span.end], span.style)
+        for span in rendered.display_text.spans
+    ] == [
+        ("[ ]", PALETTE.accent_primary),
+        (" Row", PALETTE.text_primary),
+        (" (prio: 1)", PALETTE.text_secondary),
+    ]
+    assert rendered.meta_parts == ("prio: 1",)
+
+
+def test_control_codes_do_not_shift_the_styles():
+    rendered = render_task_row(Task(id="1", title="Ro\rw", tags=["a\rb"]))
+
+    assert rendered.display_text.plain == "[ ] Row (tags: ab)"
+    assert [
+        rendered.display_text.plain[span.start : span.end]
+        for span in rendered.display_text.spans
+    ] == ["[ ]", " Row", " (tags: ab)"]
+
+
+def test_changed_fields_render_again():
+    task = Task(id="1", title="Row", due_date=datetime.date.today())
+    before = render_task_row(task)
+
+    task.due_date = datetime.date.today() - datetime.timedelta(days=1)
+    after = render_task_row(task)
+
+    assert after is not before
+    assert after.due_color != before.due_color
+    assert after.due_text.plain == f"due: {task.due_date.isoformat()}"
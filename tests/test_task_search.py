@@ -0,0 +1,68 @@
+import pytest
+
+from lazytask.domain.task import Task
+from lazytask.domain.task_search import TaskSearchIndex, TrigramIndex
+from lazytask.infrastructure.mock_task_manager import MockTaskManager
+
+
+def test_trigram_index_verifies_candidates():
+    index = TrigramIndex()
+    index.set("a", "Write the Report")
+    index.set("b", "report writing")
+    index.set("c", "Port reset")
+
+    assert index.search("REPORT") == {"a", "b"}
+    # "rep" and "por" are shared with "c", but only as separate words.
+    assert index.search("e repo") == {"a"}
+    assert index.search("re") == {"a", "b", "c"}
+    assert index.search("missing") == set()
+
+
+def test_trigram_index_updates_and_discards():
+    index = TrigramIndex()
+    index.set("a", "groceries")
+    index.set("a", "laundry")
+    assert index.search("groc") == set()
+    assert index.search("laun") == {"a"}
+
+    index.discard("a")
+    assert index.search("laun") == set()
+    assert len(index) == 0
+
+
+def test_task_search_index_covers_titles_and_descriptions():
+    tasks = [
+        Task(id="1", title="Call Bob", description="about the invoice"),
+        Task(id="2", title="Invoice Alice"),
+        Task(id="3", title="Walk"),
+    ]
+    index = TaskSearchIndex(tasks)
+
+    assert index.search("invoice") == {"1", "2"}
+    assert index.search("invoice", include_descriptions=False) == {"2"}
+    assert [task.id for task in index.filter(reversed(tasks), "invoice")] == [
+        "2",
+        "1",
+    ]
+
+    tasks[0].description = None
+    index.add(tasks[0])
+    assert index.search("invoice") == {"2"}
+
+
+@pytest.mark.asyncio
+async def test_mock_filter_tasks_searches_after_edits():
+    task_manager = MockTaskManager(use_persistence=False)
+    task = await task_manager.add_task("Plan trip")
+    await task_manager.add_task("Pack", description="trip checklist")
+    await task_manager.add_task("Other")
+
+    found = await task_manager.filter_tasks(query="TRIP")
+    assert [found_task.title for found_task in found] == ["Plan trip", "Pack"]
+
+    await task_manager.edit_task_full(task.id, {"title": "Book hotel"})
+    await task_manager.edit_task_description(task.id, "for the trip")
+    found = await task_manager.filter_tasks(query="hotel")
+    assert [found_task.title for found_task in found] == ["Book hotel"]
+    found = await task_manager.filter_tasks(query="trip")
+    assert [found_task.title for found_task in found] == ["Book hotel", "Pack"]
@@ -0,0 +1,137 @@
+import datetime
+import threading
+from unittest.mock import AsyncMock
+
+import pytest
+from textual.widgets import ListView
+
+from lazytask.domain.fuzzy_match import FuzzyMatcher
+from lazytask.domain.task import Task
+from lazytask.presentation.task_view_model import TaskViewModel
+
+
+def test_view_model_keeps_completed_tasks_once_fetched():
+    model = TaskViewModel()
+    open_task = Task(id="1", title="Open")
+    done_task = Task(id="2", title="Done", completed=True)
+
+    model.store("develop", [open_task], include_completed=False)
+    assert model.tasks("develop", include_completed=True) is None
+
+    model.store("develop", [open_task, done_task], include_completed=True)
+    assert model.tasks("develop", include_completed=False) == [open_task]
+    assert model.tasks("develop", include_completed=True) == [open_task, done_task]
+
+    model.invalidate("develop")
+    assert model.tasks("develop", include_completed=False) is None
+
+
+def test_restore_only_puts_back_the_failed_task():
+    model = TaskViewModel()
+    first = Task(id="1", title="First")
+    second = Task(id="2", title="Second")
+    third = Task(id="3", title="Third")
+    model.store("develop", [first, second, third], include_completed=False)
+
+    failed = model.apply("1", None)
+    renamed = Task(id="2", title="Second, renamed")
+    model.apply("2", renamed)
+    model.restore("1", failed)
+    assert model.tasks("develop", include_completed=False) == [first, renamed, third]
+    assert model.tasks("develop", include_completed=False)[1] is renamed
+
+    edited = model.apply("3", Task(id="3", title="Third, edited"))
+    model.restore("3", edited)
+    assert model.tasks("develop", include_completed=False)[2] is third
+
+
+def test_held_update_survives_a_refetch_until_released():
+    model = TaskViewModel()
+    fetched = Task(id="1", title="Draft", list_name="develop")
+    model.store("develop", [fetched], include_completed=False)
+
+    renamed = Task(id="1", title="Final", list_name="develop")
+    model.apply("1", renamed)
+    key = model.hold("1", renamed)
+    model.store("develop", [fetched], include_completed=False)
+    assert model.tasks("develop", include_completed=False) == [renamed]
+
+    model.release(key)
+    model.store("develop", [fetched], include_completed=False)
+    assert model.tasks("develop", include_completed=False) == [fetched]
+
+
+def test_store_does_not_wait_for_a_ranking_in_progress(monkeypatch):
+    model = TaskViewModel()
+    task = Task(id="1", title="Draft", list_name="develop")
+    model.store("develop", [task], include_completed=False)
+
+    ranking = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+    rank = FuzzyMatcher.rank
+
+    def slow_rank(self, tasks, query, cancelled=None):
+        ranked = rank(self, tasks, query, cancelled)
+        ranking.set()
+        release.wait(2)
+        finished.set()
+        return ranked
+
+    monkeypatch.setattr(FuzzyMatcher, "rank", slow_rank)
+    worker = threading.Thread(target=model.matching, args=([task], "draft"))
+    worker.start()
+    assert ranking.wait(2)
+
+    # The title changes in place while the ranking is still running.
+    task.title = "Final"
+    model.store("develop", [task], include_completed=False)
+    assert not finished.is_set()
+    release.set()
+    worker.join(2)
+
+    # The matcher that ranked the old title isn't used again.
+    monkeypatch.setattr(FuzzyMatcher, "rank", rank)
+    assert model.matching([task], "final") == [task]
+
+
+def listed_titles(app) -> list[str]:
+    return [item.data.title for item in app.query_one(ListView).children]
+
+
+@pytest.mark.asyncio
+async def test_presentation_changes_do_not_refetch(app, mock_task_manager):
+    today = datetime.date.today()
+    await mock_task_manager.add_task("Alpha", "develop", due_date=today)
+    await mock_task_manager.add_task("Beta", "develop")
+    done = await mock_task_manager.add_task("Gamma", "develop")
+    await mock_task_manager.complete_task(done.id, "develop")
+    get_tasks = AsyncMock(wraps=mock_task_manager.get_tasks)
+    mock_task_manager.get_tasks = get_tasks
+
+    async with app.run_test() as pilot:
+        await app.switch_list("develop")
+        await pilot.pause()
+        get_tasks.reset_mock()
+
+        await pilot.press("ctrl+i")
+        await pilot.press("ctrl+d")
+        await pilot.pause()
+        assert listed_titles(app) == ["Alpha"]
+        await pilot.press("ctrl+d")
+        await app.update_tasks_list("bet", refetch=False)
+        assert listed_titles(app) == ["Beta"]
+        await pilot.press("escape")
+        await pilot.pause()
+        get_tasks.assert_not_awaited()
+
+        await pilot.press("ctrl+c")
+        await pilot.pause()
+        get_tasks.assert_awaited_once_with("develop", True)
+        assert "Gamma" in listed_titles(app)
+
+        await pilot.press("ctrl+c")
+        await pilot.press("ctrl+c")
+        await pilot.pause()
+        get_tasks.assert_awaited_once()
+        assert "Gamma" in listed_titles(app)
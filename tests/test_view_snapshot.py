@@ -0,0 +1,165 @@
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from textual.widgets import ListView
+
+from lazytask.domain.task import Task
+from lazytask.presentation.app import LazyTaskApp
+from lazytask.presentation.filter_bar import FilterBar
+from lazytask.presentation.view_snapshot import (
+    ViewSnapshot,
+    load_view_snapshot,
+    save_view_snapshot,
+)
+
+
+def make_snapshot(**overrides) -> ViewSnapshot:
+    fields = dict(
+        current_list="develop",
+        sort_by="title",
+        sort_reverse=False,
+        filter_query="",
+        show_overdue_only=False,
+        show_completed=False,
+        selected_task_id="2",
+        lists={
+            "develop": (
+                [
+                    Task(id="1", title="Cached A", list_name="develop"),
+                    Task(id="2", title="Cached B", list_name="develop"),
+                ],
+                False,
+            )
+        },
+    )
+    fields.update(overrides)
+    return ViewSnapshot(**fields)
+
+
+def test_snapshot_round_trips(tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    task = Task(
+        id="1",
+        title="Dated",
+        due_date=datetime.date(2024, 5, 1),
+        creation_date=datetime.datetime(2024, 4, 1, 9, 30),
+        list_name="develop",
+        tags=["home"],
+        priority=2,
+    )
+    snapshot = make_snapshot(lists={"develop": ([task], True)})
+
+    save_view_snapshot(path, snapshot)
+    loaded = load_view_snapshot(path)
+
+    assert loaded is not None
+    assert loaded.selected_task_id == "2"
+    [(tasks, include_completed)] = loaded.lists.values()
+    assert include_completed
+    assert tasks[0].due_date == datetime.date(2024, 5, 1)
+    assert tasks[0].creation_date == datetime.datetime(2024, 4, 1, 9, 30)
+    assert (tasks[0].tags, tasks[0].priority) == (["home"], 2)
+
+
+def test_unreadable_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text("{not json")
+
+    assert load_view_snapshot(str(path)) is None
+    assert load_view_snapshot(str(tmp_path / "missing.json")) is None
+
+
+@pytest.mark.asyncio
+async def test_startup_paints_snapshot_then_revalidates(monkeypatch, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    save_view_snapshot(path, make_snapshot())
+    monkeypatch.setenv("LAZYTASK_LISTS", "develop")
+    monkeypatch.setenv("LAZYTASK_SNAPSHOT_PATH", path)
+    app = LazyTaskApp()
+    release = asyncio.Event()
+
+    async def get_tasks(list_name, include_completed=False):
+        await release.wait()
+        return [
+            Task(id="2", title="Fresh B", list_name="develop"),
+            Task(id="3", title="Fresh C", list_name="develop"),
+        ]
+
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(side_effect=get_tasks)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        list_view = app.query_one(ListView)
+
+        assert app.current_list == "develop"
+        assert [item.data.title for item in list_view.children] == [
+            "Cached A",
+            "Cached B",
+        ]
+        assert list_view.index == 1
+
+        release.set()
+        await app._revalidation
+        await pilot.pause()
+
+        assert [item.data.title for item in list_view.children] == [
+            "Fresh B",
+            "Fresh C",
+        ]
+        assert list_view.highlighted_child.data.id == "2"
+
+
+@pytest.mark.asyncio
+async def test_restored_filter_is_shown_in_the_filter_bar(monkeypatch, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    save_view_snapshot(path, make_snapshot(filter_query="ed a"))
+    monkeypatch.setenv("LAZYTASK_LISTS", "develop")
+    monkeypatch.setenv("LAZYTASK_SNAPSHOT_PATH", path)
+    app = LazyTaskApp()
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(side_effect=asyncio.Event().wait)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        filter_bar = app.query_one(FilterBar)
+
+        assert app.filter_query == "ed a"
+        assert filter_bar.display
+        assert filter_bar.value == "ed a"
+        assert [item.data.title for item in app.query_one(ListView).children] == [
+            "Cached A"
+        ]
+
+        await pilot.press("escape")
+        await pilot.pause()
+
+        assert app.filter_query == ""
+        assert not filter_bar.display
+        assert filter_bar.value == ""
+
+
+@pytest.mark.asyncio
+async def test_exit_saves_snapshot(monkeypatch, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    monkeypatch.setenv("LAZYTASK_LISTS", "develop")
+    monkeypatch.setenv("LAZYTASK_SNAPSHOT_PATH", path)
+    app = LazyTaskApp()
+    app.show_overdue_only = False
+    app.get_tasks_uc = MagicMock()
+    app.get_tasks_uc.execute = AsyncMock(
+        return_value=[Task(id="1", title="Saved", list_name="develop")]
+    )
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app.query_one(ListView).index = 0
+        await pilot.pause()
+
+    snapshot = load_view_snapshot(path)
+    assert snapshot is not None
+    assert snapshot.current_list == "all"
+    assert snapshot.selected_task_id == "1"
+    assert [task.title for task in snapshot.lists["all"][0]] == ["Saved"]
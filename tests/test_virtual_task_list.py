@@ -0,0 +1,78 @@
+import pytest
+from textual.widgets import ListView
+
+from lazytask.presentation.task_detail import TaskDetail
+from lazytask.presentation.virtual_task_list import VirtualTaskList
+
+
+async def add_tasks(mock_task_manager, count: int) -> list:
+    return [
+        await mock_task_manager.add_task(f"Task {index:02d}", "develop")
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_large_lists_use_virtual_list(app, mock_task_manager):
+    tasks = await add_tasks(mock_task_manager, 30)
+    app.virtualize_threshold = 10
+
+    async with app.run_test() as pilot:
+        app.sort_by = "title"
+        await app.update_tasks_list()
+        await pilot.pause()
+
+        virtual_list = app.query_one(VirtualTaskList)
+        assert virtual_list.display
+        assert not app.query_one(ListView).display
+        assert len(app.query_one(ListView).children) == 0
+        assert [task.id for task in virtual_list.tasks] == [task.id for task in tasks]
+
+        await pilot.press("j", "j")
+        await pilot.pause()
+        assert virtual_list.index == 1
+        assert virtual_list.highlighted_child.data.id == tasks[1].id
+        assert "Task 01" in str(app.query_one(TaskDetail).text)
+
+        await pilot.press("G")
+        await pilot.pause()
+        assert virtual_list.index == 29
+        # Only rows in view plus the overscan window are kept rendered.
+        assert len(virtual_list._rendered_rows) <= (
+            virtual_list.size.height + 2 * virtual_list.overscan
+        )
+        assert 29 in virtual_list._rendered_rows
+
+        await pilot.press("g")
+        await pilot.pause()
+        assert virtual_list.index == 0
+
+
+@pytest.mark.asyncio
+async def test_virtual_list_preserves_selection_and_switches_back(
+    app, mock_task_manager
+):
+    tasks = await add_tasks(mock_task_manager, 12)
+    app.virtualize_threshold = 10
+
+    async with app.run_test() as pilot:
+        app.sort_by = "title"
+        await app.update_tasks_list()
+        virtual_list = app.query_one(VirtualTaskList)
+        virtual_list.index = 4
+
+        app.sort_reverse = True
+        await app.update_tasks_list()
+        assert virtual_list.highlighted_child.data.id == tasks[4].id
+
+        await pilot.press("c")
+        await pilot.pause()
+        for task in tasks[:3]:
+            await mock_task_manager.complete_task(task.id, "develop")
+        await app.update_tasks_list()
+        await pilot.pause()
+
+        list_view = app.query_one(ListView)
+        assert list_view.display
+        assert not virtual_list.display
+        assert len(list_view.children) == 8